@@ -0,0 +1,244 @@
+import numpy as np
+import pandas as pd
+from AnalyseFondamentale.IndicatorInterpreter import IndicatorInterpreter
+from AnalyseFondamentale.Utils import Utils
+
+
+class FundamentalScreener:
+    """
+    Score fondamental de tout un univers en une passe, à partir des snapshots `info`
+    (un ticker par ligne, un champ par colonne) : ratios dérivés calculés par colonne,
+    notes par barème vectorisé (RuleEngine.notes) et scores pondérés par secteur,
+    selon les mêmes règles que FundamentalAnalysis.run. Aucun téléchargement : les
+    snapshots proviennent d'InfoCache.
+
+    Différence avec l'analyse détaillée : le prix courant est celui du snapshot
+    (`currentPrice`), sauf s'il est fourni (ex: dernière clôture du cache des cours).
+    """
+
+    # Champs numériques de `info` utilisés par le screener
+    FIELDS = (
+        "returnOnEquity", "returnOnAssets", "profitMargins", "operatingMargins", "grossMargins",
+        "earningsGrowth", "freeCashflow", "marketCap", "currentRatio", "quickRatio",
+        "operatingCashflow", "totalCurrentLiabilities", "debtToEquity", "totalDebt", "ebitda",
+        "totalAssets", "bookValue", "ebit", "interestExpense", "totalStockholderEquity",
+        "forwardPE", "trailingEps", "trailingPE", "priceToBook", "trailingPegRatio",
+        "dividendYield", "payoutRatio", "beta", "fiftyTwoWeekLow", "fiftyTwoWeekHigh",
+        "recommendationMean", "numberOfAnalystOpinions", "currentPrice", "regularMarketPrice",
+    )
+
+    # Indicateur pondéré (cf. Utils.SECTOR_WEIGHTS) -> (catégorie, barème d'InterpretationRules)
+    INDICATORS = {
+        "ROE": ("Rentabilité", "roe"),
+        "ROA": ("Rentabilité", "roa"),
+        "Marge nette": ("Rentabilité", "profit_margin"),
+        "Marge opérationnelle": ("Rentabilité", "operating_margin"),
+        "Marge brute": ("Rentabilité", "gross_margin"),
+        "Croissance bénéfices": ("Rentabilité", "earnings_growth"),
+        "FCF Yield": ("Rentabilité", "fcf_yield"),
+        "Current Ratio": ("Liquidité", "current_ratio"),
+        "Quick Ratio": ("Liquidité", "quick_ratio"),
+        "Operating Cash Flow": ("Liquidité", "ocf_ratio"),
+        "Dette/Equity": ("Solvabilité", "debt_to_equity"),
+        "Dette/EBITDA": ("Solvabilité", "debt_ebitda"),
+        "Dette/Actifs": ("Solvabilité", "debt_to_assets"),
+        "Valeur comptable": ("Solvabilité", "book_value"),
+        "Couverture intérêts": ("Solvabilité", "interest_coverage"),
+        "Equity Ratio": ("Solvabilité", "equity_ratio"),
+        "Forward P/E": ("Valorisation", "forward_pe"),
+        "Trailing PE": ("Valorisation", "trailing_pe"),
+        "Price to Book": ("Valorisation", "price_to_book"),
+        "PEG Ratio": ("Valorisation", "peg_ratio"),
+        "Dividend Yield": ("Valorisation", "dividend_yield"),
+        "Payout ratio": ("Valorisation", "payout_ratio"),
+        "Beta": ("Risque & Marché", "beta"),
+        "Position 52W": ("Risque & Marché", "52w_position"),
+        "Avis Analystes": ("Risque & Marché", "analyst_rating"),
+    }
+    CATEGORIES = ("Rentabilité", "Liquidité", "Solvabilité", "Valorisation", "Risque & Marché")
+
+    # Secteurs (bruts) pour lesquels la marge brute est notée
+    GROSS_MARGIN_SECTORS = ("Energy", "Consumer Cyclical", "Consumer Defensive", "Basic Materials")
+
+    def __init__(self, rules=None):
+        self.rules = rules if rules is not None else IndicatorInterpreter.rules
+
+    # ------------------------------------------------------------------
+    # Données
+    # ------------------------------------------------------------------
+    @staticmethod
+    def frame(infos, prices=None):
+        """
+        Snapshots `info` de l'univers en DataFrame (index : tickers). Les tickers en
+        erreur (Exception) ou sans snapshot sont ignorés ; les champs non numériques
+        valent NaN.
+
+        Args:
+            infos: dict {ticker: info}
+            prices: dict / Series {ticker: prix courant} optionnel (remplace celui de info)
+        """
+        tickers = [t for t, info in infos.items() if isinstance(info, dict)]
+        fields = FundamentalScreener.FIELDS
+        frame = pd.DataFrame(
+            [[infos[t].get(field) for field in fields] for t in tickers],
+            index=pd.Index(tickers, name="Ticker"), columns=list(fields), dtype=object
+        )
+        frame = frame.apply(pd.to_numeric, errors="coerce").astype(float)
+
+        price = frame["currentPrice"].where(frame["currentPrice"].notna() & (frame["currentPrice"] != 0),
+                                            frame["regularMarketPrice"])
+        if prices is not None:
+            price = pd.Series(prices, dtype=float).reindex(frame.index).fillna(price)
+        frame["price"] = price
+        frame["sector"] = [infos[t].get("sector", "Général") for t in tickers]
+        frame["name"] = [infos[t].get("shortName") or infos[t].get("longName") for t in tickers]
+        return frame
+
+    @staticmethod
+    def metrics(frame):
+        """
+        Valeur évaluée de chaque indicateur (NaN = donnée indisponible) et masque des
+        indicateurs retenus, avec les conditions de FundamentalAnalysis.run (un ratio
+        dérivé n'est noté que si ses composantes sont disponibles).
+
+        Returns:
+            tuple: (valeurs, retenus), DataFrames tickers × indicateurs
+        """
+        col = frame.__getitem__
+        given = lambda x: x.notna() & (x != 0)  # Équivalent vectorisé de `if x`
+        index = frame.index
+        always = pd.Series(True, index=index)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fcf_ok = given(col("freeCashflow")) & (col("marketCap") > 0)
+            ocf_ok = given(col("operatingCashflow")) & (col("totalCurrentLiabilities") > 0)
+            ebitda_ok = given(col("totalDebt")) & (col("ebitda") > 0)
+            assets_ok = given(col("totalDebt")) & (col("totalAssets") > 0)
+            book_ok = given(col("bookValue")) & given(col("price")) & (col("bookValue") > 0)
+            coverage_ok = given(col("ebit")) & given(col("interestExpense"))
+            equity_ok = (col("totalAssets") > 0) & given(col("totalStockholderEquity"))
+            range_ok = (given(col("price")) & given(col("fiftyTwoWeekLow")) & given(col("fiftyTwoWeekHigh"))
+                        & (col("fiftyTwoWeekHigh") != col("fiftyTwoWeekLow")))
+
+            # Forward P/E estimé à partir du BPA et de la croissance s'il est absent
+            estimated_eps = col("trailingEps") * (1 + col("earningsGrowth"))
+            can_estimate = (col("price").notna() & given(col("trailingEps")) & col("earningsGrowth").notna()
+                            & (col("price") > 0) & (estimated_eps > 0))
+            forward_pe = col("forwardPE").where(col("forwardPE").notna(),
+                                                (col("price") / estimated_eps).where(can_estimate))
+            forward_pe = forward_pe.where(np.isfinite(forward_pe) & (forward_pe > 0))
+
+            values = pd.DataFrame({
+                "ROE": col("returnOnEquity"),
+                "ROA": col("returnOnAssets"),
+                "Marge nette": col("profitMargins"),
+                "Marge opérationnelle": col("operatingMargins"),
+                "Marge brute": col("grossMargins"),
+                "Croissance bénéfices": col("earningsGrowth"),
+                "FCF Yield": col("freeCashflow") / col("marketCap"),
+                "Current Ratio": col("currentRatio"),
+                "Quick Ratio": col("quickRatio"),
+                "Operating Cash Flow": col("operatingCashflow") / col("totalCurrentLiabilities"),
+                "Dette/Equity": col("debtToEquity"),
+                "Dette/EBITDA": col("totalDebt") / col("ebitda"),
+                "Dette/Actifs": col("totalDebt") / col("totalAssets"),
+                "Valeur comptable": col("price") / col("bookValue"),
+                "Couverture intérêts": col("ebit") / col("interestExpense").abs(),
+                "Equity Ratio": col("totalStockholderEquity") / col("totalAssets"),
+                "Forward P/E": forward_pe,
+                "Trailing PE": col("trailingPE"),
+                "Price to Book": col("priceToBook"),
+                "PEG Ratio": col("trailingPegRatio"),
+                "Dividend Yield": col("dividendYield"),
+                "Payout ratio": col("payoutRatio"),
+                "Beta": col("beta"),
+                "Position 52W": (col("price") - col("fiftyTwoWeekLow"))
+                                / (col("fiftyTwoWeekHigh") - col("fiftyTwoWeekLow")) * 100,
+                "Avis Analystes": col("recommendationMean"),
+            }, index=index)
+
+        kept = pd.DataFrame({name: always for name in FundamentalScreener.INDICATORS}, index=index)
+        kept["Marge brute"] = frame["sector"].isin(FundamentalScreener.GROSS_MARGIN_SECTORS)
+        for name, ok in (("FCF Yield", fcf_ok), ("Operating Cash Flow", ocf_ok), ("Dette/EBITDA", ebitda_ok),
+                         ("Dette/Actifs", assets_ok), ("Valeur comptable", book_ok),
+                         ("Couverture intérêts", coverage_ok), ("Equity Ratio", equity_ok),
+                         ("Position 52W", range_ok)):
+            kept[name] = ok
+        return values, kept
+
+    # ------------------------------------------------------------------
+    # Notes et scores
+    # ------------------------------------------------------------------
+    def notes(self, frame, values=None):
+        """Note (/10) de chaque indicateur : DataFrame tickers × indicateurs."""
+        if values is None:
+            values, _ = self.metrics(frame)
+        groups = [Utils._get_sector_group(sector) for sector in frame["sector"]]
+        notes = pd.DataFrame(index=frame.index)
+        for name, (_, indicator) in self.INDICATORS.items():
+            notes[name] = self.rules.notes(indicator, values[name].to_numpy(), groups)
+
+        # Forward P/E non calculable : note 3 (comme l'analyse détaillée)
+        notes["Forward P/E"] = notes["Forward P/E"].where(values["Forward P/E"].notna(), 3)
+
+        # Avis des analystes : ajustement selon le nombre d'avis et le secteur
+        count = frame["numberOfAnalystOpinions"].fillna(0).to_numpy()
+        base = notes["Avis Analystes"].to_numpy()
+        adjusted = np.select(
+            [count < 2, count < 4, count < 8, count < 15],
+            [np.maximum(1, base - 3), np.maximum(1, base - 2), np.maximum(1, base - 1), base],
+            default=np.minimum(10, base + 1)
+        )
+        notes["Avis Analystes"] = np.where(np.isnan(base), 3, adjusted)
+        return notes
+
+    def run(self, frame):
+        """
+        Classement fondamental de l'univers.
+
+        Args:
+            frame: Snapshots en DataFrame (cf. `frame`)
+
+        Returns:
+            DataFrame trié par score décroissant : Rang, Nom, Secteur, score par catégorie
+            et score fondamental global (/100)
+        """
+        values, kept = self.metrics(frame)
+        notes = self.notes(frame, values)
+
+        weight_table = pd.DataFrame.from_dict(
+            {key: dict(w) for key, w in Utils.SECTOR_WEIGHTS.items()}, orient="index"
+        ).reindex(columns=list(self.INDICATORS)).fillna(0)
+        keys = [Utils._sector_weights_key(sector) for sector in frame["sector"]]
+        weights = pd.DataFrame(weight_table.loc[keys].to_numpy(), index=frame.index, columns=list(self.INDICATORS))
+        weights = weights.where(kept, 0.0)
+        points = notes * weights / 10
+
+        result = pd.DataFrame({"Nom": frame["name"], "Secteur": frame["sector"]}, index=frame.index)
+        for category in self.CATEGORIES:
+            names = [name for name, (cat, _) in self.INDICATORS.items() if cat == category]
+            total = weights[names].sum(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result[category] = np.where(total > 0, points[names].sum(axis=1) / total * 100, np.nan)
+        total = weights.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result["Score"] = np.where(total > 0, points.sum(axis=1) / total * 100, 0.0)
+
+        result = result.sort_values("Score", ascending=False, kind="stable")
+        result.insert(0, "Rang", np.arange(1, len(result) + 1))
+        return result
+
+    @staticmethod
+    def print_results(results, top=None):
+        from Formatter import Formatter
+        from TablePrinter import TablePrinter
+
+        shown = results if top is None else results.head(top)
+        print(f"\n🏆 Classement fondamental ({len(results)} tickers{'' if top is None else f', top {len(shown)}'})")
+        table = shown.reset_index()
+        for column in FundamentalScreener.CATEGORIES + ("Score",):
+            table[column] = [Formatter.colorize_percent_score(v) if v == v else "N/A" for v in table[column]]
+        TablePrinter.afficher_table(
+            table, ["Rang", "Ticker", "Nom", "Secteur", *FundamentalScreener.CATEGORIES, "Score"],
+            center_cols=["Rang", "Score"]
+        )
@@ -0,0 +1,900 @@
+class InterpretationRules:
+    """
+    Barèmes d'interprétation des indicateurs fondamentaux par groupe de secteurs
+    (cf. Utils._get_sector_group), compilés par RuleEngine.
+
+    Pour chaque indicateur : opérateur de comparaison des paliers, facteur d'échelle
+    éventuel (ratio -> %), résultat en l'absence de donnée, et un barème par groupe de
+    secteurs ("default" pour les autres). Les paliers se lisent comme une cascade de
+    if/elif : le premier seuil satisfait donne la note et l'interprétation, "else"
+    sinon.
+    """
+
+    RULES = {
+        # --- Rentabilité ---
+        "roe": {
+            "op": ">",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Technology"], "bands": [
+                    (0.25, 10, "ROE exceptionnel pour la tech - création de valeur majeure 💎"),
+                    (0.18, 9, "Excellente rentabilité tech - largement au-dessus du coût du capital 🚀"),
+                    (0.13, 8, "Bonne rentabilité pour le secteur ✅"),
+                    (0.09, 7, "Rentabilité correcte 👍"),
+                    (0.05, 6, "Rentabilité faible - création de valeur limitée ⚠️"),
+                    (0, 4, "Rentabilité très faible - préoccupant 🔴"),
+                ], "else": (2, "Rentabilité négative - destruction de valeur 🚨")},
+                {"groups": ["Financial Services"], "bands": [
+                    (0.18, 10, "ROE exceptionnel pour le secteur financier 💎"),
+                    (0.14, 9, "Excellente rentabilité bancaire 🚀"),
+                    (0.10, 8, "Bonne rentabilité financière ✅"),
+                    (0.07, 7, "Rentabilité correcte pour une banque 👍"),
+                    (0.04, 6, "Rentabilité faible 📊"),
+                    (0, 4, "Rentabilité très faible 🔴"),
+                ], "else": (1, "Rentabilité négative - critique 🚨")},
+                {"groups": ["Healthcare"], "bands": [
+                    (0.20, 10, "ROE exceptionnel pour la santé 💎"),
+                    (0.15, 9, "Excellente rentabilité pharma 🚀"),
+                    (0.11, 8, "Bonne rentabilité santé ✅"),
+                    (0.07, 7, "Rentabilité correcte 👍"),
+                    (0.04, 6, "Rentabilité faible 📊"),
+                    (0, 4, "Rentabilité très faible 🔴"),
+                ], "else": (2, "Rentabilité négative - R&D non rentable 🚨")},
+                {"groups": ["Energy"], "bands": [
+                    (0.18, 10, "ROE exceptionnel pour l'énergie 💎"),
+                    (0.14, 9, "Excellente rentabilité énergie 🚀"),
+                    (0.10, 8, "Bonne rentabilité ✅"),
+                    (0.06, 7, "Rentabilité correcte 👍"),
+                    (0.03, 6, "Rentabilité faible ⚠️"),
+                    (0, 4, "Rentabilité très faible 🔴"),
+                ], "else": (2, "Rentabilité négative - cycle bas ou inefficacités 🚨")},
+                {"groups": ["default"], "bands": [
+                    (0.25, 10, "Exceptionnel - création de valeur majeure 💎"),
+                    (0.20, 9, "Excellente rentabilité 🚀"),
+                    (0.15, 8, "Très bonne rentabilité ✅"),
+                    (0.12, 7, "Bonne rentabilité 👍"),
+                    (0.08, 6, "Rentabilité correcte 📊"),
+                    (0.05, 5, "Rentabilité moyenne 😐"),
+                    (0.02, 4, "Rentabilité faible ⬇️"),
+                    (0, 3, "Rentabilité très faible ⚠️"),
+                ], "else": (1, "Rentabilité négative - destruction de valeur 🔴")},
+            ],
+        },
+        "roa": {
+            "op": ">",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Financial Services"], "bands": [
+                    (0.015, 10, "ROA exceptionnel pour une banque 💎"),
+                    (0.012, 9, "Excellente utilisation des actifs 🚀"),
+                    (0.009, 8, "Bonne efficacité bancaire ✅"),
+                    (0.006, 7, "Efficacité correcte 👍"),
+                    (0.004, 6, "Efficacité moyenne 📊"),
+                    (0.002, 5, "Efficacité faible ⚠️"),
+                    (0, 4, "Efficacité très faible 🔴"),
+                ], "else": (2, "ROA négatif - problème sérieux 🚨")},
+                {"groups": ["Technology"], "bands": [
+                    (0.15, 10, "Utilisation exceptionnelle des actifs tech 💎"),
+                    (0.11, 9, "Excellente efficacité tech 🚀"),
+                    (0.08, 8, "Bonne utilisation des actifs ✅"),
+                    (0.05, 7, "Efficacité correcte 👍"),
+                    (0.03, 6, "Efficacité moyenne 📊"),
+                    (0.01, 5, "Efficacité faible ⚠️"),
+                    (0, 4, "Efficacité très faible 🔴"),
+                ], "else": (2, "Efficacité négative - actifs mal utilisés 🚨")},
+                {"groups": ["Healthcare"], "bands": [
+                    (0.12, 10, "ROA exceptionnel pour la santé 💎"),
+                    (0.09, 9, "Excellente efficacité R&D 🚀"),
+                    (0.07, 8, "Bonne utilisation des actifs ✅"),
+                    (0.05, 7, "Efficacité correcte 👍"),
+                    (0.03, 6, "Efficacité moyenne 📊"),
+                    (0.01, 5, "Efficacité faible ⚠️"),
+                    (0, 4, "Efficacité très faible 🔴"),
+                ], "else": (2, "ROA négatif - mauvaise allocation 🚨")},
+                {"groups": ["Energy"], "bands": [
+                    (0.13, 10, "ROA exceptionnel pour l'énergie 💎"),
+                    (0.10, 9, "Excellente utilisation des actifs 🚀"),
+                    (0.07, 8, "Bonne efficacité ✅"),
+                    (0.05, 7, "Efficacité correcte 👍"),
+                    (0.03, 6, "Efficacité moyenne 📊"),
+                    (0.01, 5, "Efficacité faible ⚠️"),
+                    (0, 4, "Efficacité très faible 🔴"),
+                ], "else": (2, "ROA négatif - inefficacités majeures 🚨")},
+                {"groups": ["default"], "bands": [
+                    (0.15, 10, "Utilisation des actifs exceptionnelle 💎"),
+                    (0.12, 9, "Excellente efficacité 🚀"),
+                    (0.09, 8, "Très bonne utilisation ✅"),
+                    (0.06, 7, "Bonne efficacité 👍"),
+                    (0.04, 6, "Utilisation correcte 📊"),
+                    (0.02, 5, "Utilisation moyenne 😐"),
+                    (0.01, 4, "Utilisation faible ⬇️"),
+                    (0, 3, "Utilisation très faible ⚠️"),
+                ], "else": (1, "Utilisation négative - destruction de valeur 🔴")},
+            ],
+        },
+        # --- Valorisation ---
+        "forward_pe": {
+            "op": "<",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (12, 10, "Exceptionnellement attractif pour la croissance 💎"),
+                    (18, 9, "Très attractif 🚀"),
+                    (25, 8, "Attractif pour le secteur ✅"),
+                    (35, 7, "Correct pour une entreprise de croissance 👍"),
+                    (45, 6, "Légèrement élevé 📊"),
+                    (60, 5, "Élevé mais justifiable 😐"),
+                    (80, 4, "Très élevé ⚠️"),
+                    (120, 3, "Excessif 🔴"),
+                ], "else": (1, "Bullesque 💀")},
+                {"groups": ["Financial Services", "Energy", "Real Estate"], "bands": [
+                    (5, 10, "Exceptionnellement attractif 💎"),
+                    (7, 9, "Très attractif 🚀"),
+                    (10, 8, "Attractif ✅"),
+                    (13, 7, "Correct 👍"),
+                    (18, 6, "Légèrement élevé 📊"),
+                    (22, 5, "Élevé pour le secteur 😐"),
+                    (30, 4, "Très élevé ⚠️"),
+                    (45, 3, "Excessif 🔴"),
+                ], "else": (1, "Extrêmement excessif 💀")},
+                {"groups": ["default"], "bands": [
+                    (7, 10, "Exceptionnellement attractif 💎"),
+                    (10, 9, "Très attractif 🚀"),
+                    (14, 8, "Attractif ✅"),
+                    (18, 7, "Légèrement attractif 👍"),
+                    (22, 6, "Correct 📊"),
+                    (28, 5, "Légèrement élevé 😐"),
+                    (35, 4, "Élevé ⚠️"),
+                    (45, 3, "Très élevé 🚨"),
+                    (60, 2, "Excessif 🔴"),
+                ], "else": (1, "Extrêmement excessif 💀")},
+            ],
+        },
+        "trailing_pe": {
+            "op": "<",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (15, 10, "Exceptionnel pour le secteur 💎"),
+                    (20, 9, "Très attractif 🚀"),
+                    (28, 8, "Attractif ✅"),
+                    (36, 7, "Correct 👍"),
+                    (46, 6, "Légèrement élevé 📊"),
+                    (60, 5, "Élevé 😐"),
+                    (75, 4, "Très élevé ⚠️"),
+                    (100, 3, "Excessif 🔴"),
+                ], "else": (1, "Extrêmement excessif 💀")},
+                {"groups": ["Financial Services", "Energy", "Real Estate"], "bands": [
+                    (5, 10, "Exceptionnel 💎"),
+                    (8, 9, "Très attractif 🚀"),
+                    (12, 8, "Attractif ✅"),
+                    (16, 7, "Correct 👍"),
+                    (20, 6, "Légèrement élevé 📊"),
+                    (26, 5, "Élevé 😐"),
+                    (34, 4, "Très élevé ⚠️"),
+                    (45, 3, "Excessif 🔴"),
+                ], "else": (1, "Extrêmement excessif 💀")},
+                {"groups": ["default"], "bands": [
+                    (7, 10, "Exceptionnel 💎"),
+                    (11, 9, "Très attractif 🚀"),
+                    (15, 8, "Attractif ✅"),
+                    (20, 7, "Correct 👍"),
+                    (25, 6, "Légèrement élevé 📊"),
+                    (32, 5, "Élevé 😐"),
+                    (42, 4, "Très élevé ⚠️"),
+                    (55, 3, "Excessif 🔴"),
+                ], "else": (1, "Extrêmement excessif 💀")},
+            ],
+        },
+        "price_to_book": {
+            "op": "<",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Financial Services", "Real Estate"], "bands": [
+                    (0.4, 10, "Très sous-évalué pour le secteur 💎"),
+                    (0.7, 9, "Sous-évalué 🚀"),
+                    (0.95, 8, "Légèrement sous-évalué ✅"),
+                    (1.2, 7, "Correct pour une banque/REIT 👍"),
+                    (1.6, 6, "Légèrement élevé 📊"),
+                    (2.2, 5, "Élevé 😐"),
+                    (3.0, 4, "Très élevé ⚠️"),
+                    (4.0, 3, "Excessif 🔴"),
+                ], "else": (1, "Extrêmement excessif 💀")},
+                {"groups": ["Technology"], "bands": [
+                    (1.5, 10, "Exceptionnel pour la tech 💎"),
+                    (3.0, 9, "Très attractif 🚀"),
+                    (5.0, 8, "Attractif ✅"),
+                    (8.0, 7, "Correct pour la croissance 👍"),
+                    (12.0, 6, "Légèrement élevé 📊"),
+                    (18.0, 5, "Élevé 😐"),
+                    (25.0, 4, "Très élevé ⚠️"),
+                    (35.0, 3, "Excessif 🔴"),
+                ], "else": (1, "Bullesque 💀")},
+                {"groups": ["default"], "bands": [
+                    (0.6, 10, "Très sous-évalué 💎"),
+                    (0.9, 9, "Sous-évalué 🚀"),
+                    (1.2, 8, "Légèrement sous-évalué ✅"),
+                    (1.6, 7, "Bon rapport 👍"),
+                    (2.2, 6, "Correct 📊"),
+                    (3.0, 5, "Légèrement élevé 😐"),
+                    (4.0, 4, "Élevé ⚠️"),
+                    (6.0, 3, "Très élevé 🔴"),
+                    (10.0, 2, "Excessif 💀"),
+                ], "else": (1, "Extrêmement excessif 🎯")},
+            ],
+        },
+        # --- Risque / Solidité financière ---
+        "beta": {
+            "op": "<",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Technology", "Consumer Cyclical"], "bands": [
+                    (0.6, 10, "Très défensif pour le secteur tech/cyclique 🛡️"),
+                    (0.85, 9, "Défensif ✅"),
+                    (1.1, 8, "Volatilité modérée 👍"),
+                    (1.3, 7, "Typique du secteur 📊"),
+                    (1.6, 6, "Volatilité élevée 😐"),
+                    (1.9, 5, "Très volatile ⚠️"),
+                    (2.3, 4, "Extrêmement volatile 🔴"),
+                ], "else": (2, "Spéculatif 💀")},
+                {"groups": ["Consumer Defensive", "Utilities"], "bands": [
+                    (0.3, 10, "Très défensif 💎"),
+                    (0.6, 9, "Défensif 🛡️"),
+                    (0.85, 8, "Légèrement défensif ✅"),
+                    (1.05, 7, "Neutre 👍"),
+                    (1.25, 6, "Légèrement volatil 📊"),
+                    (1.6, 5, "Volatilité élevée 😐"),
+                    (2.0, 4, "Très volatile ⚠️"),
+                ], "else": (3, "Extrêmement volatile 🔴")},
+                {"groups": ["default"], "bands": [
+                    (0.4, 10, "Très faible volatilité 🛡️"),
+                    (0.7, 9, "Faible volatilité ✅"),
+                    (0.9, 8, "Légèrement défensif 👍"),
+                    (1.1, 7, "Similaire au marché 📊"),
+                    (1.3, 6, "Légèrement volatil 😐"),
+                    (1.6, 5, "Volatilité élevée ⚠️"),
+                    (2.0, 4, "Très volatile 🔴"),
+                    (2.5, 3, "Extrêmement volatile 💀"),
+                ], "else": (1, "Spéculatif extrême 🎰")},
+            ],
+        },
+        "debt_to_equity": {
+            "op": "<",
+            "missing": (3, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Financial Services", "Real Estate"], "bands": [
+                    (100, 10, "Endettement très faible 💎"),
+                    (200, 9, "Endettement faible 🚀"),
+                    (350, 8, "Endettement modéré ✅"),
+                    (550, 7, "Acceptable 👍"),
+                    (800, 6, "Légèrement élevé 📊"),
+                    (1100, 5, "Élevé 😐"),
+                    (1500, 4, "Très endetté ⚠️"),
+                    (2000, 3, "Endettement excessif 🔴"),
+                ], "else": (2, "Critique 💀")},
+                {"groups": ["Utilities"], "bands": [
+                    (40, 10, "Très faible endettement 💎"),
+                    (80, 9, "Endettement faible 🚀"),
+                    (130, 8, "Endettement modéré ✅"),
+                    (200, 7, "Acceptable 👍"),
+                    (280, 6, "Élevé 📊"),
+                    (400, 5, "Très endetté 😐"),
+                    (600, 4, "Endettement excessif ⚠️"),
+                ], "else": (3, "Critique 🔴")},
+                {"groups": ["Technology"], "bands": [
+                    (5, 10, "Endettement quasi nul 💎"),
+                    (15, 9, "Endettement faible 🚀"),
+                    (30, 8, "Endettement modéré ✅"),
+                    (60, 7, "Acceptable 👍"),
+                    (100, 6, "Élevé 📊"),
+                    (150, 5, "Très endetté 😐"),
+                    (220, 4, "Endettement excessif ⚠️"),
+                ], "else": (3, "Critique 🔴")},
+                {"groups": ["default"], "bands": [
+                    (10, 10, "Endettement très faible 💎"),
+                    (25, 9, "Endettement faible 🚀"),
+                    (50, 8, "Endettement modéré ✅"),
+                    (80, 7, "Acceptable 👍"),
+                    (120, 6, "Moyen 📊"),
+                    (180, 5, "Élevé 😐"),
+                    (250, 4, "Très endetté ⚠️"),
+                    (350, 3, "Endettement excessif 🔴"),
+                ], "else": (2, "Critique 💀")},
+            ],
+        },
+        "current_ratio": {
+            "op": ">",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Financial Services"], "bands": [
+                    (1.3, 10, "Liquidité très forte 💎"),
+                    (1.1, 9, "Forte liquidité 🚀"),
+                    (0.9, 8, "Bonne liquidité ✅"),
+                    (0.7, 6, "Correcte 👍"),
+                    (0.5, 4, "Faible ⚠️"),
+                    (0.3, 3, "Problème grave 🔴"),
+                ], "else": (2, "Critique 🚨")},
+                {"groups": ["Retail"], "bands": [
+                    (2.5, 10, "Liquidité exceptionnelle 💎"),
+                    (2.0, 9, "Excellente 🚀"),
+                    (1.5, 8, "Très bonne ✅"),
+                    (1.2, 7, "Bonne 👍"),
+                    (1.0, 6, "Correcte 📊"),
+                    (0.8, 4, "Faible ⚠️"),
+                ], "else": (3, "Critique 🔴")},
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (3.0, 10, "Liquidité exceptionnelle 💎"),
+                    (2.5, 9, "Excellente 🚀"),
+                    (2.0, 8, "Très bonne ✅"),
+                    (1.5, 7, "Bonne 👍"),
+                    (1.2, 6, "Correcte 📊"),
+                    (1.0, 5, "Acceptable 😐"),
+                    (0.8, 4, "Faible ⚠️"),
+                ], "else": (3, "Critique 🔴")},
+                {"groups": ["Utilities", "Telecom"], "bands": [
+                    (2.0, 10, "Liquidité très forte 💎"),
+                    (1.5, 9, "Excellente 🚀"),
+                    (1.2, 8, "Bonne ✅"),
+                    (1.0, 7, "Correcte 👍"),
+                    (0.8, 6, "Acceptable 📊"),
+                    (0.6, 4, "Faible ⚠️"),
+                ], "else": (3, "Critique 🔴")},
+                {"groups": ["default"], "bands": [
+                    (3.0, 10, "Liquidité exceptionnelle 💎"),
+                    (2.5, 9, "Excellente 🚀"),
+                    (2.0, 8, "Très bonne ✅"),
+                    (1.5, 7, "Bonne 👍"),
+                    (1.2, 6, "Correcte 📊"),
+                    (1.0, 5, "Acceptable 😐"),
+                    (0.8, 4, "Faible ⚠️"),
+                    (0.6, 3, "Problème grave 🔴"),
+                ], "else": (2, "Critique 🚨")},
+            ],
+        },
+        # --- Rentabilité / marges ---
+        "profit_margin": {
+            "op": ">",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Technology"], "bands": [
+                    (0.30, 10, "Marge exceptionnelle 💎"),
+                    (0.22, 9, "Très bonne marge 🚀"),
+                    (0.15, 8, "Bonne marge logicielle ✅"),
+                    (0.10, 7, "Acceptable 👍"),
+                    (0.05, 6, "Marge faible ⚠️"),
+                    (0.02, 4, "Marge très faible 🔴"),
+                ], "else": (1, "Pertes - modèle non rentable 🚨")},
+                {"groups": ["Healthcare"], "bands": [
+                    (0.25, 10, "Marge exceptionnelle pharma 💎"),
+                    (0.18, 9, "Excellente marge 🚀"),
+                    (0.12, 8, "Bonne marge ✅"),
+                    (0.08, 7, "Correcte 👍"),
+                    (0.04, 6, "Marge faible ⚠️"),
+                    (0.01, 4, "Marge très faible 🔴"),
+                ], "else": (1, "Pertes - R&D non amortie 🚨")},
+                {"groups": ["Financial Services", "Energy"], "bands": [
+                    (0.35, 10, "Marge exceptionnelle 💎"),
+                    (0.25, 9, "Excellente marge 🚀"),
+                    (0.18, 8, "Très bonne marge ✅"),
+                    (0.12, 7, "Bonne marge 👍"),
+                    (0.07, 6, "Marge correcte 📊"),
+                    (0.03, 4, "Marge faible ⚠️"),
+                ], "else": (1, "Pertes 🚨")},
+                {"groups": ["default"], "bands": [
+                    (0.30, 10, "Marge exceptionnelle 💎"),
+                    (0.22, 9, "Très bonne marge 🚀"),
+                    (0.15, 8, "Bonne marge ✅"),
+                    (0.10, 7, "Correcte 👍"),
+                    (0.06, 6, "Marge moyenne ⚠️"),
+                    (0.03, 4, "Marge faible 🔴"),
+                    (0, 3, "Marge très faible 💀"),
+                ], "else": (1, "Pertes 🚨")},
+            ],
+        },
+        "fcf_yield": {
+            "op": ">",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (0.10, 10, "Rendement exceptionnel 💎"),
+                    (0.07, 9, "Très bon rendement 🚀"),
+                    (0.05, 8, "Bon rendement ✅"),
+                    (0.03, 6, "Correct 👍"),
+                    (0.02, 5, "Rendement faible ⚠️"),
+                    (0.01, 4, "Très faible 🔴"),
+                ], "else": (1, "Cash-flow négatif 🚨")},
+                {"groups": ["Energy"], "bands": [
+                    (0.15, 10, "Rendement exceptionnel 💎"),
+                    (0.10, 9, "Très bon rendement 🚀"),
+                    (0.07, 8, "Bon rendement ✅"),
+                    (0.04, 6, "Correct 👍"),
+                    (0.02, 4, "Rendement faible ⚠️"),
+                ], "else": (1, "Cash-flow négatif 🚨")},
+                {"groups": ["default"], "bands": [
+                    (0.12, 10, "Rendement exceptionnel 💎"),
+                    (0.08, 9, "Très bon rendement 🚀"),
+                    (0.06, 8, "Bon rendement ✅"),
+                    (0.04, 6, "Correct 👍"),
+                    (0.02, 4, "Rendement faible ⚠️"),
+                ], "else": (1, "Cash-flow négatif 🚨")},
+            ],
+        },
+        "dividend_yield": {
+            "op": ">",
+            "missing": (2, "Pas de dividende 🚫"),
+            "tables": [
+                {"groups": ["Utilities", "Energy", "Real Estate"], "bands": [
+                    (10, 8, "Rendement très élevé (risque de soutenabilité) ⚠️"),
+                    (7, 9, "Rendement élevé - typique du secteur 💰"),
+                    (5, 8, "Bon rendement ✅"),
+                    (4, 7, "Rendement correct 👍"),
+                    (3, 6, "Rendement modéré 📊"),
+                    (2, 5, "Rendement modeste 😐"),
+                    (1, 4, "Rendement faible ⬇️"),
+                    (0, 3, "Rendement symbolique 🔴"),
+                ], "else": (1, "Dividende nul - atypique 🚫")},
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (4, 8, "Rendement élevé pour la croissance ⚠️"),
+                    (2.5, 7, "Bon rendement - rare dans le secteur ✅"),
+                    (1.5, 6, "Rendement modéré 👍"),
+                    (0.8, 5, "Rendement symbolique 📊"),
+                    (0.3, 4, "Très faible 😐"),
+                    (0, 3, "Minimal ⬇️"),
+                ], "else": (5, "Aucun dividende - normal pour la croissance 📈")},
+                {"groups": ["default"], "bands": [
+                    (8, 10, "Rendement très élevé (risque) ⚠️"),
+                    (6, 9, "Rendement élevé 💰"),
+                    (4.5, 8, "Bon rendement ✅"),
+                    (4, 7, "Rendement correct 👍"),
+                    (3, 6, "Rendement modéré 📊"),
+                    (2, 5, "Rendement modeste 📊"),
+                    (1, 4, "Rendement faible 😐"),
+                    (0.5, 3, "Rendement très faible ⬇️"),
+                    (0, 2, "Rendement symbolique 🔴"),
+                ], "else": (1, "Dividende nul 🚫")},
+            ],
+        },
+        "payout_ratio": {
+            # Bandes [borne haute, borne incluse, note, texte] : la distribution idéale est un intervalle
+            "op": "range",
+            "missing": (4, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Utilities", "Real Estate"], "bands": [
+                    (0.30, False, 6, "Distribution faible 📊"),
+                    (0.50, False, 7, "Distribution conservatrice 👍"),
+                    (0.60, False, 9, "Distribution équilibrée 🚀"),
+                    (0.80, True, 10, "Distribution idéale pour le secteur 💎"),
+                    (0.95, True, 8, "Distribution élevée mais acceptable ✅"),
+                ], "else": (4, "Distribution très élevée ⚠️"), "nan": (5, "Hors normes 😐")},
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (0.20, False, 10, "Conservation des profits idéale pour la R&D 💎"),
+                    (0.35, False, 9, "Distribution faible - bon pour la croissance 🚀"),
+                    (0.50, False, 8, "Distribution modérée ✅"),
+                    (0.70, False, 6, "Distribution élevée - limite pour la croissance 📊"),
+                ], "else": (3, "Distribution très élevée - pénalise l'innovation ⚠️"), "nan": (5, "Distribution nulle - normal 📈")},
+                {"groups": ["default"], "bands": [
+                    (0.25, False, 7, "Distribution conservatrice 👍"),
+                    (0.45, True, 10, "Distribution idéale 💎"),
+                    (0.60, True, 8, "Distribution équilibrée ✅"),
+                    (0.75, True, 6, "Distribution élevée 📊"),
+                    (0.90, True, 3, "Distribution très élevée ⚠️"),
+                ], "else": (1, "Non soutenable 🚨"), "nan": (5, "Distribution nulle 😐")},
+            ],
+        },
+        # --- Marché ---
+        "52w_position": {
+            "op": "<",
+            "tables": [
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (20, 10, "Exceptionnellement proche du plus bas - opportunité croissance 💎"),
+                    (35, 9, "Très proche du plus bas 🚀"),
+                    (50, 8, "Dans le bas du range ✅"),
+                    (65, 7, "Légèrement sous la moyenne 👍"),
+                    (75, 6, "Proche de la moyenne 📊"),
+                    (85, 5, "Légèrement au-dessus 😐"),
+                    (92, 4, "Dans le haut du range ⚠️"),
+                    (97, 3, "Proche du plus haut 🔴"),
+                ], "else": (2, "Exceptionnellement proche du plus haut - surévalué 🚨")},
+                {"groups": ["Energy", "Financial Services"], "bands": [
+                    (15, 10, "Exceptionnellement proche du plus bas - cycle favorable 💎"),
+                    (25, 9, "Très proche du plus bas 🚀"),
+                    (40, 8, "Dans le bas du range ✅"),
+                    (55, 7, "Légèrement sous la moyenne 👍"),
+                    (65, 6, "Proche de la moyenne 📊"),
+                    (75, 5, "Légèrement au-dessus 😐"),
+                    (85, 4, "Dans le haut du range ⚠️"),
+                    (95, 3, "Proche du plus haut 🔴"),
+                ], "else": (2, "Exceptionnellement proche du plus haut 🚨")},
+                {"groups": ["default"], "bands": [
+                    (10, 10, "Exceptionnellement proche du plus bas 💎"),
+                    (20, 9, "Très proche du plus bas 🚀"),
+                    (30, 8, "Proche du plus bas ✅"),
+                    (40, 7, "Dans le bas du range 👍"),
+                    (50, 6, "Légèrement sous la moyenne 📊"),
+                    (60, 5, "Proche de la moyenne 😐"),
+                    (70, 4, "Légèrement au-dessus ⚠️"),
+                    (80, 3, "Dans le haut du range 🔴"),
+                    (90, 2, "Proche du plus haut 💀"),
+                ], "else": (1, "Exceptionnellement proche du plus haut 🚨")},
+            ],
+        },
+        "analyst_rating": {
+            "op": "<=",
+            "tables": [
+                {"groups": ["default"], "bands": [
+                    (1.2, 10, "Achat fort exceptionnel 💎"),
+                    (1.5, 9, "Achat fort 🚀"),
+                    (1.7, 8, "Achat fort 🚀"),
+                    (2.0, 7, "Achat ✅"),
+                    (2.5, 6, "Achat modéré 👍"),
+                    (3.0, 5, "Neutre positif 📊"),
+                    (3.3, 4, "Neutre 😐"),
+                    (3.7, 3, "Neutre négatif ⚠️"),
+                    (4.2, 2, "Vente modérée 🔴"),
+                    (4.5, 1, "Vente 💀"),
+                ], "else": (0, "Vente forte 🚨")},
+            ],
+        },
+        # --- Marges et croissance ---
+        "operating_margin": {
+            "op": ">",
+            "scale": 100,
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Technology"], "bands": [
+                    (25, 10, "Marge opérationnelle exceptionnelle ({value:.1f}%) 💎"),
+                    (18, 9, "Excellente efficacité opérationnelle ({value:.1f}%) 🚀"),
+                    (12, 8, "Bonne marge opérationnelle ({value:.1f}%) ✅"),
+                    (8, 7, "Marge correcte ({value:.1f}%) 👍"),
+                    (4, 6, "Marge faible ({value:.1f}%) 📊"),
+                    (0, 4, "Marge très faible ({value:.1f}%) ⚠️"),
+                ], "else": (2, "Pertes opérationnelles ({value:.1f}%) 🔴")},
+                {"groups": ["Healthcare"], "bands": [
+                    (22, 10, "Marge exceptionnelle pharma ({value:.1f}%) 💎"),
+                    (15, 9, "Excellente marge ({value:.1f}%) 🚀"),
+                    (10, 8, "Bonne marge ({value:.1f}%) ✅"),
+                    (6, 7, "Marge correcte ({value:.1f}%) 👍"),
+                    (3, 5, "Marge faible ({value:.1f}%) ⚠️"),
+                    (0, 3, "Marge très faible ({value:.1f}%) 🔴"),
+                ], "else": (1, "Pertes opérationnelles ({value:.1f}%) 🚨")},
+                {"groups": ["Financial Services"], "bands": [
+                    (40, 10, "Marge exceptionnelle ({value:.1f}%) 💎"),
+                    (30, 9, "Excellente efficacité ({value:.1f}%) 🚀"),
+                    (22, 8, "Bonne marge ({value:.1f}%) ✅"),
+                    (15, 7, "Marge correcte ({value:.1f}%) 👍"),
+                    (10, 5, "Marge faible ({value:.1f}%) 📊"),
+                    (0, 3, "Marge très faible ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Pertes ({value:.1f}%) 🔴")},
+                {"groups": ["Energy"], "bands": [
+                    (18, 10, "Marge exceptionnelle ({value:.1f}%) 💎"),
+                    (12, 9, "Excellente marge ({value:.1f}%) 🚀"),
+                    (8, 8, "Bonne marge ({value:.1f}%) ✅"),
+                    (5, 7, "Marge correcte ({value:.1f}%) 👍"),
+                    (2, 5, "Marge faible ({value:.1f}%) ⚠️"),
+                    (0, 3, "Marge très faible ({value:.1f}%) 🔴"),
+                ], "else": (1, "Pertes ({value:.1f}%) 🚨")},
+                {"groups": ["default"], "bands": [
+                    (20, 10, "Marge exceptionnelle ({value:.1f}%) 💎"),
+                    (14, 9, "Excellente marge ({value:.1f}%) 🚀"),
+                    (10, 8, "Bonne marge ({value:.1f}%) ✅"),
+                    (6, 7, "Marge correcte ({value:.1f}%) 👍"),
+                    (3, 5, "Marge faible ({value:.1f}%) 📊"),
+                    (0, 3, "Marge très faible ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Pertes ({value:.1f}%) 🔴")},
+            ],
+        },
+        "gross_margin": {
+            "op": ">",
+            "scale": 100,
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Energy"], "bands": [
+                    (45, 10, "Marge brute exceptionnelle ({value:.1f}%) 💎"),
+                    (35, 9, "Excellente marge brute ({value:.1f}%) 🚀"),
+                    (28, 8, "Bonne marge brute ({value:.1f}%) ✅"),
+                    (20, 7, "Marge correcte ({value:.1f}%) 👍"),
+                    (15, 5, "Marge faible ({value:.1f}%) 📊"),
+                    (0, 3, "Marge très faible ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Marge négative ({value:.1f}%) 🔴")},
+                {"groups": ["Consumer Cyclical", "Consumer Defensive"], "bands": [
+                    (50, 10, "Marge brute exceptionnelle ({value:.1f}%) 💎"),
+                    (40, 9, "Excellente marge ({value:.1f}%) 🚀"),
+                    (32, 8, "Bonne marge ({value:.1f}%) ✅"),
+                    (25, 7, "Marge correcte ({value:.1f}%) 👍"),
+                    (18, 5, "Marge faible ({value:.1f}%) 📊"),
+                    (0, 3, "Marge très faible ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Marge négative ({value:.1f}%) 🔴")},
+                {"groups": ["default"], "bands": [
+                    (45, 10, "Marge brute exceptionnelle ({value:.1f}%) 💎"),
+                    (35, 9, "Excellente marge ({value:.1f}%) 🚀"),
+                    (28, 8, "Bonne marge ({value:.1f}%) ✅"),
+                    (20, 7, "Marge correcte ({value:.1f}%) 👍"),
+                    (15, 5, "Marge faible ({value:.1f}%) 📊"),
+                    (0, 3, "Marge très faible ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Marge négative ({value:.1f}%) 🔴")},
+            ],
+        },
+        "earnings_growth": {
+            "op": "<",
+            "scale": 100,
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["default"], "bands": [
+                    (-30, 1, "Effondrement des bénéfices ({value:.1f}%) 🚨"),
+                    (-20, 2, "Forte baisse des bénéfices ({value:.1f}%) 🔴"),
+                    (-10, 3, "Baisse importante ({value:.1f}%) ⚠️"),
+                    (-5, 4, "Baisse modérée ({value:.1f}%) 📊"),
+                    (0, 5, "Légère baisse ({value:.1f}%) 😐"),
+                    (5, 6, "Croissance faible ({value:.1f}%) 👍"),
+                    (15, 7, "Croissance modérée ({value:.1f}%) ✅"),
+                    (25, 8, "Bonne croissance ({value:.1f}%) 🚀"),
+                    (50, 9, "Forte croissance ({value:.1f}%) 💎"),
+                ], "else": (10, "Croissance exceptionnelle ({value:.1f}%) 🔥")},
+            ],
+        },
+        # --- Liquidité ---
+        "quick_ratio": {
+            "op": ">",
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Financial Services"], "bands": [
+                    (1.0, 10, "Excellente liquidité immédiate ({value:.2f}) 💎"),
+                    (0.8, 9, "Très bonne liquidité ({value:.2f}) 🚀"),
+                    (0.6, 8, "Bonne liquidité ({value:.2f}) ✅"),
+                    (0.5, 6, "Liquidité correcte ({value:.2f}) 👍"),
+                    (0.4, 4, "Liquidité faible ({value:.2f}) ⚠️"),
+                    (0.3, 3, "Liquidité préoccupante ({value:.2f}) 🔴"),
+                ], "else": (2, "Liquidité critique ({value:.2f}) 🚨")},
+                {"groups": ["Retail", "Manufacturing"], "bands": [
+                    (1.5, 10, "Excellente liquidité immédiate ({value:.2f}) 💎"),
+                    (1.0, 9, "Très bonne liquidité ({value:.2f}) 🚀"),
+                    (0.8, 8, "Bonne liquidité ({value:.2f}) ✅"),
+                    (0.6, 7, "Liquidité correcte ({value:.2f}) 👍"),
+                    (0.5, 6, "Liquidité acceptable ({value:.2f}) 📊"),
+                    (0.4, 4, "Liquidité faible ({value:.2f}) ⚠️"),
+                    (0.3, 3, "Liquidité préoccupante ({value:.2f}) 🔴"),
+                ], "else": (2, "Liquidité critique ({value:.2f}) 🚨")},
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (2.5, 10, "Excellente liquidité immédiate ({value:.2f}) 💎"),
+                    (2.0, 9, "Très bonne liquidité ({value:.2f}) 🚀"),
+                    (1.5, 8, "Bonne liquidité ({value:.2f}) ✅"),
+                    (1.0, 7, "Liquidité correcte ({value:.2f}) 👍"),
+                    (0.8, 6, "Liquidité acceptable ({value:.2f}) 📊"),
+                    (0.6, 5, "Liquidité faible ({value:.2f}) 😐"),
+                    (0.4, 4, "Liquidité préoccupante ({value:.2f}) ⚠️"),
+                ], "else": (3, "Liquidité critique ({value:.2f}) 🔴")},
+                {"groups": ["Services", "Consulting"], "bands": [
+                    (2.0, 10, "Excellente liquidité immédiate ({value:.2f}) 💎"),
+                    (1.5, 9, "Très bonne liquidité ({value:.2f}) 🚀"),
+                    (1.2, 8, "Bonne liquidité ({value:.2f}) ✅"),
+                    (1.0, 7, "Liquidité correcte ({value:.2f}) 👍"),
+                    (0.8, 6, "Liquidité acceptable ({value:.2f}) 📊"),
+                    (0.6, 4, "Liquidité faible ({value:.2f}) ⚠️"),
+                ], "else": (3, "Liquidité critique ({value:.2f}) 🔴")},
+                {"groups": ["Utilities", "Telecom"], "bands": [
+                    (1.5, 10, "Excellente liquidité immédiate ({value:.2f}) 💎"),
+                    (1.2, 9, "Très bonne liquidité ({value:.2f}) 🚀"),
+                    (1.0, 8, "Bonne liquidité ({value:.2f}) ✅"),
+                    (0.8, 7, "Liquidité correcte ({value:.2f}) 👍"),
+                    (0.6, 6, "Liquidité acceptable ({value:.2f}) 📊"),
+                    (0.5, 4, "Liquidité faible ({value:.2f}) ⚠️"),
+                ], "else": (3, "Liquidité critique ({value:.2f}) 🔴")},
+                {"groups": ["default"], "bands": [
+                    (2.0, 10, "Excellente liquidité immédiate ({value:.2f}) 💎"),
+                    (1.5, 9, "Très bonne liquidité ({value:.2f}) 🚀"),
+                    (1.2, 8, "Bonne liquidité ({value:.2f}) ✅"),
+                    (1.0, 7, "Liquidité correcte ({value:.2f}) 👍"),
+                    (0.8, 6, "Liquidité acceptable ({value:.2f}) 📊"),
+                    (0.6, 5, "Liquidité faible ({value:.2f}) 😐"),
+                    (0.5, 4, "Liquidité préoccupante ({value:.2f}) ⚠️"),
+                ], "else": (3, "Liquidité critique ({value:.2f}) 🔴")},
+            ],
+        },
+        "ocf_ratio": {
+            "op": ">",
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["default"], "bands": [
+                    (2.5, 10, "Excellent flux de trésorerie ({value:.2f}x) 💎"),
+                    (2.0, 9, "Très bon flux ({value:.2f}x) 🚀"),
+                    (1.5, 8, "Bon flux de trésorerie ({value:.2f}x) ✅"),
+                    (1.0, 7, "Flux correct ({value:.2f}x) 👍"),
+                    (0.7, 6, "Flux acceptable ({value:.2f}x) 📊"),
+                    (0.5, 5, "Flux faible ({value:.2f}x) 😐"),
+                    (0.3, 3, "Flux très faible ({value:.2f}x) ⚠️"),
+                ], "else": (1, "Flux insuffisant ({value:.2f}x) 🔴")},
+            ],
+        },
+        # --- Solvabilité et valorisation ---
+        "debt_ebitda": {
+            "op": "<",
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (1.0, 10, "Endettement très faible ({value:.1f}x) 💎"),
+                    (2.0, 9, "Endettement faible ({value:.1f}x) 🚀"),
+                    (3.0, 8, "Endettement modéré ({value:.1f}x) ✅"),
+                    (4.0, 7, "Endettement correct ({value:.1f}x) 👍"),
+                    (5.5, 5, "Endettement élevé ({value:.1f}x) 📊"),
+                    (7.0, 3, "Endettement très élevé ({value:.1f}x) ⚠️"),
+                ], "else": (1, "Endettement critique ({value:.1f}x) 🔴")},
+                {"groups": ["Utilities", "Real Estate"], "bands": [
+                    (3.0, 10, "Endettement faible ({value:.1f}x) 💎"),
+                    (4.5, 9, "Endettement modéré ({value:.1f}x) 🚀"),
+                    (6.0, 8, "Endettement acceptable ({value:.1f}x) ✅"),
+                    (7.5, 7, "Endettement correct ({value:.1f}x) 👍"),
+                    (9.0, 5, "Endettement élevé ({value:.1f}x) 📊"),
+                    (11.0, 3, "Endettement très élevé ({value:.1f}x) ⚠️"),
+                ], "else": (1, "Endettement critique ({value:.1f}x) 🔴")},
+                {"groups": ["Energy"], "bands": [
+                    (1.5, 10, "Endettement très faible ({value:.1f}x) 💎"),
+                    (2.5, 9, "Endettement faible ({value:.1f}x) 🚀"),
+                    (3.5, 8, "Endettement modéré ({value:.1f}x) ✅"),
+                    (5.0, 7, "Endettement correct ({value:.1f}x) 👍"),
+                    (6.5, 5, "Endettement élevé ({value:.1f}x) 📊"),
+                    (8.0, 3, "Endettement très élevé ({value:.1f}x) ⚠️"),
+                ], "else": (1, "Endettement critique ({value:.1f}x) 🔴")},
+                {"groups": ["default"], "bands": [
+                    (1.5, 10, "Endettement très faible ({value:.1f}x) 💎"),
+                    (2.5, 9, "Endettement faible ({value:.1f}x) 🚀"),
+                    (3.5, 8, "Endettement modéré ({value:.1f}x) ✅"),
+                    (5.0, 7, "Endettement correct ({value:.1f}x) 👍"),
+                    (6.5, 5, "Endettement élevé ({value:.1f}x) 📊"),
+                    (8.0, 3, "Endettement très élevé ({value:.1f}x) ⚠️"),
+                ], "else": (1, "Endettement critique ({value:.1f}x) 🔴")},
+            ],
+        },
+        "peg_ratio": {
+            "op": "range",
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["default"], "bands": [
+                    (0, True, 2, "PEG invalide ({value:.2f}) - croissance négative ⚠️"),
+                    (0.5, False, 10, "Action très sous-évaluée (PEG: {value:.2f}) 💎"),
+                    (0.8, False, 9, "Action sous-évaluée (PEG: {value:.2f}) 🚀"),
+                    (1.0, False, 8, "Bonne valorisation (PEG: {value:.2f}) ✅"),
+                    (1.3, False, 7, "Valorisation correcte (PEG: {value:.2f}) 👍"),
+                    (1.7, False, 6, "Valorisation acceptable (PEG: {value:.2f}) 📊"),
+                    (2.0, False, 5, "Légèrement surévaluée (PEG: {value:.2f}) 😐"),
+                    (2.5, False, 4, "Surévaluée (PEG: {value:.2f}) ⚠️"),
+                    (3.0, False, 3, "Très surévaluée (PEG: {value:.2f}) 🔴"),
+                ], "else": (1, "Excessivement surévaluée (PEG: {value:.2f}) 🚨")},
+            ],
+        },
+        "debt_to_assets": {
+            "op": "<",
+            "scale": 100,
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Financial Services"], "bands": [
+                    (30, 10, "Endettement très faible ({value:.1f}%) 💎"),
+                    (45, 9, "Endettement faible ({value:.1f}%) 🚀"),
+                    (60, 8, "Endettement modéré ({value:.1f}%) ✅"),
+                    (70, 7, "Endettement acceptable ({value:.1f}%) 👍"),
+                    (80, 5, "Endettement élevé ({value:.1f}%) 📊"),
+                    (88, 3, "Endettement très élevé ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Endettement excessif ({value:.1f}%) 🔴")},
+                {"groups": ["Utilities", "Real Estate"], "bands": [
+                    (25, 10, "Endettement très faible ({value:.1f}%) 💎"),
+                    (40, 9, "Endettement faible ({value:.1f}%) 🚀"),
+                    (55, 8, "Endettement modéré ({value:.1f}%) ✅"),
+                    (65, 7, "Endettement acceptable ({value:.1f}%) 👍"),
+                    (75, 5, "Endettement élevé ({value:.1f}%) 📊"),
+                    (82, 3, "Endettement très élevé ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Endettement excessif ({value:.1f}%) 🔴")},
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (15, 10, "Endettement très faible ({value:.1f}%) 💎"),
+                    (25, 9, "Endettement faible ({value:.1f}%) 🚀"),
+                    (35, 8, "Endettement modéré ({value:.1f}%) ✅"),
+                    (45, 7, "Endettement acceptable ({value:.1f}%) 👍"),
+                    (55, 5, "Endettement élevé ({value:.1f}%) 📊"),
+                    (65, 3, "Endettement très élevé ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Endettement excessif ({value:.1f}%) 🔴")},
+                {"groups": ["default"], "bands": [
+                    (20, 10, "Endettement très faible ({value:.1f}%) 💎"),
+                    (30, 9, "Endettement faible ({value:.1f}%) 🚀"),
+                    (40, 8, "Endettement modéré ({value:.1f}%) ✅"),
+                    (50, 7, "Endettement acceptable ({value:.1f}%) 👍"),
+                    (60, 6, "Endettement moyen ({value:.1f}%) 📊"),
+                    (70, 5, "Endettement élevé ({value:.1f}%) 😐"),
+                    (80, 3, "Endettement très élevé ({value:.1f}%) ⚠️"),
+                ], "else": (1, "Endettement excessif ({value:.1f}%) 🔴")},
+            ],
+        },
+        "book_value": {
+            "op": "<",
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Financial Services", "Real Estate"], "bands": [
+                    (0.5, 10, "Forte décote vs actifs ({book_value:.2f}€, P/B: {value:.2f}) 💎"),
+                    (0.8, 9, "Décote significative ({book_value:.2f}€, P/B: {value:.2f}) 🚀"),
+                    (1.0, 8, "Légère décote ({book_value:.2f}€, P/B: {value:.2f}) ✅"),
+                    (1.3, 7, "Proche de la valeur comptable ({book_value:.2f}€, P/B: {value:.2f}) 👍"),
+                    (1.7, 6, "Légère prime ({book_value:.2f}€, P/B: {value:.2f}) 📊"),
+                    (2.5, 5, "Prime modérée ({book_value:.2f}€, P/B: {value:.2f}) 😐"),
+                ], "else": (3, "Prime élevée ({book_value:.2f}€, P/B: {value:.2f}) ⚠️")},
+                {"groups": ["default"], "bands": [
+                    (0.7, 10, "Forte marge de sécurité ({book_value:.2f}€, P/B: {value:.2f}) 💎"),
+                    (1.0, 9, "Bonne marge de sécurité ({book_value:.2f}€, P/B: {value:.2f}) 🚀"),
+                    (1.5, 8, "Marge de sécurité correcte ({book_value:.2f}€, P/B: {value:.2f}) ✅"),
+                    (2.5, 7, "Valorisation raisonnable ({book_value:.2f}€, P/B: {value:.2f}) 👍"),
+                    (4.0, 6, "Valorisation élevée ({book_value:.2f}€, P/B: {value:.2f}) 📊"),
+                    (6.0, 5, "Valorisation très élevée ({book_value:.2f}€, P/B: {value:.2f}) 😐"),
+                ], "else": (3, "Valorisation excessive ({book_value:.2f}€, P/B: {value:.2f}) ⚠️")},
+            ],
+        },
+        "interest_coverage": {
+            "op": ">",
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Utilities", "Real Estate", "Energy"], "bands": [
+                    (8.0, 10, "Excellente couverture des intérêts ({value:.1f}x) 💎"),
+                    (5.0, 9, "Très bonne couverture ({value:.1f}x) 🚀"),
+                    (3.5, 8, "Bonne couverture ({value:.1f}x) ✅"),
+                    (2.5, 7, "Couverture correcte ({value:.1f}x) 👍"),
+                    (2.0, 6, "Couverture acceptable ({value:.1f}x) 📊"),
+                    (1.5, 5, "Couverture faible ({value:.1f}x) 😐"),
+                    (1.0, 3, "Couverture très faible ({value:.1f}x) ⚠️"),
+                    (0, 2, "Couverture critique ({value:.1f}x) 🔴"),
+                ], "else": (1, "Incapacité à couvrir les intérêts 🚨")},
+                {"groups": ["Technology", "Healthcare"], "bands": [
+                    (15.0, 10, "Excellente couverture ({value:.1f}x) 💎"),
+                    (10.0, 9, "Très bonne couverture ({value:.1f}x) 🚀"),
+                    (7.0, 8, "Bonne couverture ({value:.1f}x) ✅"),
+                    (5.0, 7, "Couverture correcte ({value:.1f}x) 👍"),
+                    (3.0, 6, "Couverture acceptable ({value:.1f}x) 📊"),
+                    (2.0, 5, "Couverture faible ({value:.1f}x) 😐"),
+                    (1.2, 3, "Couverture très faible ({value:.1f}x) ⚠️"),
+                    (0, 2, "Couverture critique ({value:.1f}x) 🔴"),
+                ], "else": (1, "Incapacité à couvrir les intérêts 🚨")},
+                {"groups": ["default"], "bands": [
+                    (10.0, 10, "Excellente couverture des intérêts ({value:.1f}x) 💎"),
+                    (6.0, 9, "Très bonne couverture ({value:.1f}x) 🚀"),
+                    (4.0, 8, "Bonne couverture ({value:.1f}x) ✅"),
+                    (3.0, 7, "Couverture correcte ({value:.1f}x) 👍"),
+                    (2.0, 6, "Couverture acceptable ({value:.1f}x) 📊"),
+                    (1.5, 5, "Couverture faible ({value:.1f}x) 😐"),
+                    (1.0, 3, "Couverture très faible ({value:.1f}x) ⚠️"),
+                    (0, 2, "Couverture critique ({value:.1f}x) 🔴"),
+                ], "else": (1, "Incapacité à couvrir les intérêts 🚨")},
+            ],
+        },
+        "equity_ratio": {
+            "op": ">",
+            "scale": 100,
+            "missing": (5, "Données indisponibles"),
+            "tables": [
+                {"groups": ["Financial Services", "Real Estate"], "bands": [
+                    (20, 10, "Excellente indépendance financière ({value:.1f}%) 💎"),
+                    (15, 9, "Très bonne structure ({value:.1f}%) 🚀"),
+                    (12, 8, "Bonne structure financière ({value:.1f}%) ✅"),
+                    (10, 7, "Structure correcte ({value:.1f}%) 👍"),
+                    (8, 6, "Structure acceptable ({value:.1f}%) 📊"),
+                    (6, 5, "Capitaux propres faibles ({value:.1f}%) 😐"),
+                    (4, 3, "Structure fragile ({value:.1f}%) ⚠️"),
+                    (0, 2, "Structure très fragile ({value:.1f}%) 🔴"),
+                ], "else": (1, "Capitaux propres négatifs 🚨")},
+                {"groups": ["Utilities", "Energy"], "bands": [
+                    (50, 10, "Excellente indépendance ({value:.1f}%) 💎"),
+                    (40, 9, "Très bonne structure ({value:.1f}%) 🚀"),
+                    (35, 8, "Bonne structure ({value:.1f}%) ✅"),
+                    (30, 7, "Structure correcte ({value:.1f}%) 👍"),
+                    (25, 6, "Structure acceptable ({value:.1f}%) 📊"),
+                    (20, 5, "Capitaux propres faibles ({value:.1f}%) 😐"),
+                    (15, 3, "Structure fragile ({value:.1f}%) ⚠️"),
+                    (0, 2, "Structure très fragile ({value:.1f}%) 🔴"),
+                ], "else": (1, "Capitaux propres négatifs 🚨")},
+                {"groups": ["default"], "bands": [
+                    (65, 10, "Excellente indépendance financière ({value:.1f}%) 💎"),
+                    (55, 9, "Très bonne structure ({value:.1f}%) 🚀"),
+                    (45, 8, "Bonne structure financière ({value:.1f}%) ✅"),
+                    (40, 7, "Structure correcte ({value:.1f}%) 👍"),
+                    (35, 6, "Structure acceptable ({value:.1f}%) 📊"),
+                    (30, 5, "Capitaux propres faibles ({value:.1f}%) 😐"),
+                    (25, 4, "Dépendance élevée à la dette ({value:.1f}%) ⚠️"),
+                    (20, 3, "Structure fragile ({value:.1f}%) 🔴"),
+                    (0, 2, "Structure très fragile ({value:.1f}%) 🚨"),
+                ], "else": (1, "Capitaux propres négatifs - insolvabilité 💀")},
+            ],
+        },
+    }
@@ -0,0 +1,234 @@
+import copy
+import json
+import math
+from bisect import bisect_left
+import numpy as np
+import pandas as pd
+from AnalyseFondamentale.InterpretationRules import InterpretationRules
+from AnalyseFondamentale.Utils import Utils
+
+
+class RuleTable:
+    """
+    Barème compilé d'un indicateur pour un groupe de secteurs : bornes croissantes de
+    la droite réelle, chacune fermée (valeur == borne dans l'intervalle inférieur) ou
+    ouverte, et résultat (note, texte) de chaque intervalle. L'évaluation est une
+    recherche par dichotomie, pour une valeur (bisect) ou une colonne (np.searchsorted).
+    """
+
+    def __init__(self, bounds, closed, outcomes, nan_outcome):
+        self.bounds = [float(b) for b in bounds]
+        self.closed = list(closed)
+        self.outcomes = [(o[0], o[1]) for o in outcomes]  # len(bounds) + 1 intervalles
+        self.nan_outcome = (nan_outcome[0], nan_outcome[1])
+
+        self._bounds = np.array(self.bounds, dtype=float)
+        self._open = ~np.array(self.closed, dtype=bool)
+        self._all = self.outcomes + [self.nan_outcome]  # Index len(bounds) + 1 : NaN
+        self.notes = np.array([note for note, _ in self._all], dtype=float)
+        self.texts = [text for _, text in self._all]
+
+    @staticmethod
+    def compile(spec, op):
+        """
+        Compile un barème déclaratif.
+
+        Args:
+            spec: {"bands": [...], "else": (note, texte), "nan": (note, texte) optionnel}
+            op: Comparaison des paliers, évalués dans l'ordre comme une cascade de if/elif :
+                ">" / ">=" (seuils décroissants), "<" / "<=" (seuils croissants), ou
+                "range" (bandes [borne haute, fermée, note, texte] croissantes, "else" au-delà)
+        """
+        bands, default = spec["bands"], spec["else"]
+        if op == "range":
+            bounds = [b[0] for b in bands]
+            closed = [bool(b[1]) for b in bands]
+            outcomes = [(b[2], b[3]) for b in bands] + [default]
+        elif op in (">", ">="):
+            # value > seuil : l'intervalle (seuil suivant, seuil] revient au palier suivant
+            bounds = [b[0] for b in reversed(bands)]
+            closed = [op == ">"] * len(bands)
+            outcomes = [default] + [(b[1], b[2]) for b in reversed(bands)]
+        elif op in ("<", "<="):
+            bounds = [b[0] for b in bands]
+            closed = [op == "<="] * len(bands)
+            outcomes = [(b[1], b[2]) for b in bands] + [default]
+        else:
+            raise ValueError(f"Opérateur de règle inconnu : '{op}'")
+
+        if any(a >= b for a, b in zip(bounds, bounds[1:])):
+            raise ValueError(f"Seuils non ordonnés pour l'opérateur '{op}' : {[b[0] for b in bands]}")
+        return RuleTable(bounds, closed, outcomes, spec.get("nan", default))
+
+    # ------------------------------------------------------------------
+    # Évaluation
+    # ------------------------------------------------------------------
+    def index(self, value):
+        """Index de l'intervalle contenant `value` (len(bounds) + 1 pour NaN)."""
+        if value != value:
+            return len(self.bounds) + 1
+        i = bisect_left(self.bounds, value)
+        if i < len(self.bounds) and self.bounds[i] == value and not self.closed[i]:
+            i += 1
+        return i
+
+    def indices(self, values):
+        """Index de l'intervalle de chaque valeur d'un tableau (cf. `index`)."""
+        values = np.asarray(values, dtype=float)
+        n = len(self.bounds)
+        if not n:
+            return np.where(np.isnan(values), 1, 0)
+        i = np.searchsorted(self._bounds, values, side="left")
+        at = np.minimum(i, n - 1)
+        i = i + ((i < n) & (self._bounds[at] == values) & self._open[at])
+        return np.where(np.isnan(values), n + 1, i)
+
+    def lookup(self, value):
+        """(note, texte) de l'intervalle contenant `value`."""
+        return self._all[self.index(value)]
+
+
+class RuleEngine:
+    """
+    Interprétation des indicateurs fondamentaux par barèmes déclaratifs
+    (cf. InterpretationRules) : chaque barème est compilé une fois en bornes triées par
+    (indicateur, groupe de secteurs), et une note s'obtient par dichotomie au lieu d'une
+    cascade de if/elif. Un jeu de règles alternatif se charge depuis un fichier JSON
+    (`load`) : les indicateurs qu'il définit remplacent ceux du jeu par défaut.
+
+    Format d'un indicateur :
+        {"op": ">", "scale": 100, "missing": (note, texte),
+         "tables": [{"groups": [...], "bands": [(seuil, note, texte), ...], "else": (note, texte)}, ...]}
+    Le groupe "default" s'applique aux secteurs sans barème dédié. Les textes sont des
+    gabarits str.format : `{value}` est la valeur évaluée (après `scale`).
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.compiled = {}
+        self._scale = {}
+        self._missing = {}
+        for indicator, rule in rules.items():
+            tables = {}
+            for spec in rule["tables"]:
+                table = RuleTable.compile(spec, spec.get("op", rule["op"]))
+                for group in spec["groups"]:
+                    tables[group] = table
+            if "default" not in tables:
+                raise ValueError(f"Barème 'default' manquant pour l'indicateur '{indicator}'")
+            self.compiled[indicator] = tables
+            self._scale[indicator] = rule.get("scale", 1)
+            missing = rule.get("missing", (None, "Données indisponibles"))
+            self._missing[indicator] = (missing[0], missing[1])
+
+    def __contains__(self, indicator):
+        return indicator in self.compiled
+
+    def table(self, indicator, sector="General"):
+        """Barème compilé de l'indicateur pour le secteur (barème 'default' à défaut)."""
+        if indicator not in self.compiled:
+            raise KeyError(f"Indicateur sans règle d'interprétation : '{indicator}'")
+        tables = self.compiled[indicator]
+        return tables.get(Utils._get_sector_group(sector), tables["default"])
+
+    def evaluate(self, indicator, value, sector="General", **context):
+        """
+        Note et interprétation d'une valeur.
+
+        Args:
+            context: Valeurs supplémentaires des gabarits de texte (ex: book_value)
+
+        Returns:
+            tuple: (note, interprétation) ; `missing` de l'indicateur si value est None
+        """
+        table = self.table(indicator, sector)
+        if value is None:
+            return self._missing[indicator]
+        value = value * self._scale[indicator]
+        note, text = table.lookup(value)
+        return note, text.format(value=value, **context) if "{" in text else text
+
+    def notes(self, indicator, values, sectors="General"):
+        """
+        Notes d'une colonne de valeurs, vectorisées par groupe de secteurs.
+
+        Args:
+            values: Tableau / Series de valeurs (NaN = donnée manquante)
+            sectors: Secteur commun, ou secteur de chaque valeur
+
+        Returns:
+            np.ndarray de notes (note `missing` de l'indicateur pour les NaN)
+        """
+        return self._evaluate_many(indicator, values, sectors)[0]
+
+    def interpret_many(self, indicator, values, sectors="General", **context):
+        """
+        Notes (np.ndarray) et interprétations (liste) d'une colonne de valeurs.
+
+        Args:
+            context: Colonnes supplémentaires des gabarits de texte (une valeur par ligne)
+        """
+        notes, indices, owners, tables, scaled = self._evaluate_many(indicator, values, sectors)
+        missing = self._missing[indicator][1]
+        columns = {name: list(column) for name, column in context.items()}
+        texts = []
+        for row, (v, i, owner) in enumerate(zip(scaled.tolist(), indices.tolist(), owners.tolist())):
+            text = missing if math.isnan(v) else tables[owner].texts[i]
+            if "{" in text:
+                text = text.format(value=v, **{name: column[row] for name, column in columns.items()})
+            texts.append(text)
+        return notes, texts
+
+    def _evaluate_many(self, indicator, values, sectors):
+        """
+        Évaluation d'une colonne : le groupe de chaque secteur distinct est résolu une
+        fois, puis chaque barème est appliqué en un appel à ses lignes.
+
+        Returns:
+            tuple: notes, index d'intervalle, barème de chaque ligne (index dans la
+            liste des barèmes), barèmes, valeurs après `scale`
+        """
+        scaled = np.asarray(values, dtype=float) * self._scale[indicator]
+        if sectors is None or isinstance(sectors, str):
+            tables, owners = [self.table(indicator, sectors)], np.zeros(len(scaled), dtype=int)
+        else:
+            codes, uniques = pd.factorize(np.asarray(sectors, dtype=object))
+            tables, position, owner = [], {}, []
+            for sector in list(uniques) + [None]:  # code -1 : secteur manquant
+                table = self.table(indicator, sector)
+                if id(table) not in position:
+                    position[id(table)] = len(tables)
+                    tables.append(table)
+                owner.append(position[id(table)])
+            owners = np.array(owner)[codes]
+
+        indices = np.zeros(len(scaled), dtype=int)
+        notes = np.empty(len(scaled))
+        for k, table in enumerate(tables):
+            rows = owners == k
+            indices[rows] = table.indices(scaled[rows])
+            notes[rows] = table.notes[indices[rows]]
+
+        missing = self._missing[indicator][0]
+        notes[np.isnan(scaled)] = np.nan if missing is None else missing
+        return notes, indices, owners, tables, scaled
+
+    # ------------------------------------------------------------------
+    # Jeux de règles
+    # ------------------------------------------------------------------
+    @staticmethod
+    def load(path, base=None):
+        """
+        Jeu de règles d'un fichier JSON {indicateur: règle}, complété par `base`
+        (InterpretationRules.RULES par défaut) pour les indicateurs absents.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+        rules = copy.deepcopy(InterpretationRules.RULES if base is None else base)
+        rules.update(overrides)
+        return RuleEngine(rules)
+
+    def save(self, path):
+        """Enregistre le jeu de règles en JSON (point de départ d'un jeu alternatif)."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.rules, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+from AnalyseFondamentale.FundamentalScreener import FundamentalScreener
+from AnalyseFondamentale.Utils import Utils
+
+
+class SectorPercentiles:
+    """
+    Notation relative aux pairs du secteur : chaque indicateur est classé dans la
+    distribution de son groupe de secteurs (Utils._get_sector_group) au sein de l'univers
+    en cache, au lieu des seuils absolus des barèmes.
+
+    Les tables de quantiles sont calculées une fois par exécution (un groupby.quantile
+    sur toute la coupe transversale, cf. `build`) ; une note est ensuite une
+    interpolation dans la table du groupe. Même interface que RuleEngine (evaluate /
+    notes / interpret_many), dont elle enveloppe le jeu de règles : elle se substitue à
+    IndicatorInterpreter.rules et s'applique donc à l'analyse détaillée comme au screener.
+
+    Restent notés par le barème absolu : les valeurs manquantes, les indicateurs dont le
+    barème n'est pas monotone (payout, PEG) et les groupes de moins de `min_peers` pairs
+    (distribution de tout l'univers à défaut, si elle est assez fournie).
+    """
+
+    QUANTILES = np.linspace(0, 1, 21)  # Tables par pas de 5 %
+    MIN_PEERS = 8
+
+    def __init__(self, base, tables, directions):
+        """
+        Args:
+            base: RuleEngine des barèmes absolus
+            tables: {indicateur: {groupe: valeurs des QUANTILES}} ("default" = univers)
+            directions: {indicateur: 1 si une valeur élevée est favorable, -1 sinon}
+        """
+        self.base = base
+        self.tables = tables
+        self.directions = directions
+
+    def __getattr__(self, name):
+        # compiled, table, save... : ceux du jeu de règles absolu
+        if name == "base":
+            raise AttributeError(name)
+        return getattr(self.base, name)
+
+    def __contains__(self, indicator):
+        return indicator in self.base
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @staticmethod
+    def direction(base, indicator):
+        """Sens du barème absolu ('default') : 1 croissant, -1 décroissant, 0 non monotone."""
+        steps = np.diff(base.compiled[indicator]["default"].notes[:-1])
+        if (steps >= 0).all():
+            return 1
+        if (steps <= 0).all():
+            return -1
+        return 0
+
+    @staticmethod
+    def build(frame, base, quantiles=None, min_peers=None):
+        """
+        Tables de quantiles par groupe de secteurs à partir des snapshots de l'univers.
+
+        Args:
+            frame: Snapshots en DataFrame (FundamentalScreener.frame)
+            base: RuleEngine des barèmes absolus (direction de chaque indicateur)
+            quantiles: Niveaux de quantiles (QUANTILES par défaut)
+            min_peers: Nombre minimal de valeurs d'un groupe (MIN_PEERS par défaut)
+        """
+        quantiles = SectorPercentiles.QUANTILES if quantiles is None else np.asarray(quantiles, dtype=float)
+        min_peers = SectorPercentiles.MIN_PEERS if min_peers is None else min_peers
+
+        directions = {}
+        names = {}
+        for name, (_, indicator) in FundamentalScreener.INDICATORS.items():
+            direction = SectorPercentiles.direction(base, indicator)
+            if direction:
+                directions[indicator] = direction
+                names[name] = indicator
+
+        # Valeurs effectivement notées par l'analyse (ratios dérivés calculables)
+        values, kept = FundamentalScreener.metrics(frame)
+        values = values[list(names)].where(kept[list(names)])
+        groups = frame["sector"].map(Utils._get_sector_group)
+
+        by_group = values.groupby(groups).quantile(quantiles)  # Index (groupe, quantile)
+        counts = values.groupby(groups).count()
+        universe = values.quantile(quantiles)
+
+        tables = {}
+        for name, indicator in names.items():
+            table = {
+                group: by_group.loc[group, name].to_numpy()
+                for group in counts.index if counts.at[group, name] >= min_peers
+            }
+            if values[name].count() >= min_peers:
+                table["default"] = universe[name].to_numpy()
+            tables[indicator] = table
+        return SectorPercentiles(base, tables, directions)
+
+    # ------------------------------------------------------------------
+    # Évaluation
+    # ------------------------------------------------------------------
+    def _table(self, indicator, sector):
+        tables = self.tables.get(indicator)
+        if not tables:
+            return None
+        return tables.get(Utils._get_sector_group(sector), tables.get("default"))
+
+    def percentile(self, indicator, values, sector="General"):
+        """
+        Rang centile (0-100) de valeurs dans la distribution du groupe du secteur
+        (NaN si l'indicateur ou le groupe n'a pas de table). Les valeurs égales à un
+        palier de quantiles prennent le milieu du palier.
+        """
+        values = np.asarray(values, dtype=float)
+        table = self._table(indicator, sector)
+        if table is None:
+            return np.full(values.shape, np.nan)
+        levels = np.linspace(0, 100, len(table))
+        below = np.interp(values, table, levels)
+        above = -np.interp(-values, -table[::-1], -levels[::-1])
+        return (below + above) / 2
+
+    def _note(self, indicator, pct):
+        """Note (/10, entière) d'un rang centile selon le sens de l'indicateur."""
+        rank = pct if self.directions[indicator] > 0 else 100 - pct
+        return np.rint(1 + 9 * rank / 100)
+
+    def evaluate(self, indicator, value, sector="General", **context):
+        note, text = self.base.evaluate(indicator, value, sector, **context)
+        if value is None or value != value or indicator not in self.directions:
+            return note, text
+        pct = float(self.percentile(indicator, value, sector))
+        if pct != pct:
+            return note, text
+        return int(self._note(indicator, pct)), f"{text} — {pct:.0f}ᵉ centile du secteur"
+
+    def notes(self, indicator, values, sectors="General"):
+        return self._relative(indicator, values, sectors, self.base.notes(indicator, values, sectors))
+
+    def interpret_many(self, indicator, values, sectors="General", **context):
+        notes, texts = self.base.interpret_many(indicator, values, sectors, **context)
+        return self._relative(indicator, values, sectors, notes), texts
+
+    def _relative(self, indicator, values, sectors, notes):
+        """Remplace les notes absolues par les notes relatives, groupe par groupe."""
+        if indicator not in self.directions:
+            return notes
+        values = np.asarray(values, dtype=float)
+        if sectors is None or isinstance(sectors, str):
+            pct = self.percentile(indicator, values, sectors)
+        else:
+            groups = pd.Series([Utils._get_sector_group(s) for s in sectors])
+            pct = np.full(values.shape, np.nan)
+            for group, rows in groups.groupby(groups).indices.items():
+                pct[rows] = self.percentile(indicator, values[rows], group)
+        relative = ~np.isnan(pct) & ~np.isnan(values)
+        notes = np.array(notes, dtype=float)
+        notes[relative] = self._note(indicator, pct[relative])
+        return notes
@@ -0,0 +1,247 @@
+import numpy as np
+import pandas as pd
+from colorama import Fore, Style
+from AnalyseTechnique.FibonacciEngine import FibonacciEngine
+from AnalyseTechnique.IndicatorEvaluator import IndicatorEvaluator
+from AnalyseTechnique.IndicatorPanel import IndicatorPanel
+from AnalyseTechnique.IndicatorRegistry import IndicatorRegistry
+
+
+class Backtester:
+    """
+    Score technique pondéré calculé sur chaque barre de l'historique de tout l'univers,
+    puis simulation d'une stratégie longue :
+    - entrée à la clôture quand le score franchit `entry` (Fibonacci valide, stop sous le prix) ;
+    - sortie au stop loss ou au premier objectif Fibonacci (niveaux fixés à l'entrée),
+      quand le score retombe sous `exit`, ou après `max_holding` séances.
+
+    Les scores et les niveaux sont vectorisés (dates × tickers) ; la simulation avance
+    date par date en traitant tous les tickers à la fois. Le portefeuille est équipondéré
+    entre les positions ouvertes, sans frais ni glissement.
+    """
+
+    def __init__(self, entry=70.0, exit=50.0, max_holding=120, fib_period=50, weights=None, evaluator=None):
+        self.entry = entry  # Score d'entrée (même échelle que TechnicalAnalysis.run)
+        self.exit = exit  # Score de sortie
+        self.max_holding = max_holding  # Durée maximale d'une position (séances)
+        self.fib_period = fib_period
+        self.evaluator = evaluator if evaluator is not None else IndicatorEvaluator()
+        self.weights = weights if weights is not None else self.evaluator.weights
+
+    # ------------------------------------------------------------------
+    # Fibonacci vectorisé
+    # ------------------------------------------------------------------
+    @staticmethod
+    def fibonacci(high, low, close, period=50):
+        """
+        Version vectorisée de TechnicalAnalysis.calculate_fibonacci_levels sur chaque barre :
+        validité, tendance, note de position, support / résistance, stop loss et premier
+        objectif d'une position longue (cf. FibonacciEngine.analyze).
+
+        Returns:
+            dict de tableaux de même forme que `close`
+        """
+        return FibonacciEngine(high, low, close).analyze(period)
+
+    # ------------------------------------------------------------------
+    # Score historique
+    # ------------------------------------------------------------------
+    def arrays(self, panel, aligned=True, specs=None):
+        """
+        Tableaux ne dépendant ni des poids ni des seuils : arguments des évaluateurs
+        vectorisés (clé "<indicateur>/<position>"), Fibonacci ("fib/<champ>") et cours.
+
+        Args:
+            panel: IndicatorPanel
+            aligned: Réaligne sur le calendrier commun (dates × tickers) ; sinon grille
+                des séances du panel
+            specs: Indicateurs à préparer (actifs par défaut)
+        """
+        close = panel.inputs["Close"]
+        place = panel.scatter if aligned else (lambda array: array)
+        arrays = {}
+
+        for spec in specs if specs is not None else IndicatorRegistry.active(self.weights):
+            for k, arg in enumerate(spec.array_args(panel.values, close)):
+                arrays[f"{spec.name}/{k}"] = place(np.broadcast_to(np.asarray(arg, dtype=float), close.shape))
+
+        fib = self.fibonacci(panel.inputs["High"], panel.inputs["Low"], close, self.fib_period)
+        for field in ("valid", "score", "stop", "target"):
+            arrays[f"fib/{field}"] = place(fib[field].astype(float))
+        for field in ("High", "Low", "Close"):
+            arrays[field] = place(panel.inputs[field])
+        return arrays
+
+    @staticmethod
+    def _spec_args(arrays, name):
+        args, k = [], 0
+        while f"{name}/{k}" in arrays:
+            args.append(arrays[f"{name}/{k}"])
+            k += 1
+        return args
+
+    def weighted_score(self, arrays):
+        """Score pondéré (même échelle que TechnicalAnalysis.run) à partir de `arrays`."""
+        close = arrays["Close"]
+        total = np.zeros(close.shape)
+
+        for spec in IndicatorRegistry.active(self.weights):
+            notes, _ = spec.notes_from_args(self.evaluator, self._spec_args(arrays, spec.name))
+            total += notes * self.weights[spec.name] / 10
+
+        fib_weight = self.weights.get("Fibonacci", 0)
+        if fib_weight:
+            total += np.where(arrays["fib/valid"] == 1, arrays["fib/score"] * fib_weight / 10, 0.0)
+
+        total[np.isnan(close)] = np.nan
+        return total
+
+    def scores(self, panel):
+        """
+        Score technique pondéré de chaque barre (séances × tickers du panel), sur la
+        même échelle que TechnicalAnalysis.run. NaN pendant la période de chauffe.
+
+        Returns:
+            tuple: (scores, fibonacci) où fibonacci est le dict de `Backtester.fibonacci`
+        """
+        arrays = self.arrays(panel, aligned=False)
+        fib = self.fibonacci(panel.inputs["High"], panel.inputs["Low"], panel.inputs["Close"], self.fib_period)
+        return self.weighted_score(arrays), fib
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+    def run(self, histories):
+        """
+        Backteste la stratégie sur l'univers.
+
+        Args:
+            histories: dict {ticker: DataFrame OHLCV} ou IndicatorPanel déjà calculé
+
+        Returns:
+            dict: trades (DataFrame), equity (Series), hit_rate, avg_return, cagr,
+            max_drawdown, exposure
+        """
+        panel = histories if isinstance(histories, IndicatorPanel) else IndicatorPanel(histories, self.weights)
+        arrays = self.arrays(panel)
+        return self.simulate(arrays, self.weighted_score(arrays), panel.dates(), panel.tickers)
+
+    def simulate(self, arrays, score, dates, tickers, start=0, end=None):
+        """
+        Simule la stratégie sur les lignes [start, end) du calendrier commun.
+
+        Args:
+            arrays: Tableaux alignés (cf. `arrays`)
+            score: Score pondéré aligné (dates × tickers)
+        """
+        close, high, low = arrays["Close"], arrays["High"], arrays["Low"]
+        fib_valid, fib_stop, fib_target = arrays["fib/valid"], arrays["fib/stop"], arrays["fib/target"]
+        end = len(close) if end is None else end
+        N = close.shape[1]
+
+        held = np.zeros(N, dtype=bool)
+        entry_t = np.zeros(N, dtype=int)
+        entry_price, stop, target, mark = (np.full(N, np.nan) for _ in range(4))
+        prev_score = np.full(N, np.nan)
+        daily = np.zeros(end - start)
+        exposure = np.zeros(end - start)
+        trades = []
+
+        def close_positions(mask, t, price, reason):
+            rows = np.flatnonzero(mask)
+            if len(rows):
+                trades.append((rows, entry_t[rows], np.full(len(rows), t), entry_price[rows],
+                               price[rows], np.full(len(rows), reason)))
+
+        with np.errstate(invalid="ignore"):
+            for t in range(start, end):
+                c, s = close[t], score[t]
+                quoted = ~np.isnan(c)
+                active = held & quoted
+
+                # --- Sorties (stop prioritaire si stop et objectif sont touchés le même jour) ---
+                hit_stop = active & (low[t] <= stop)
+                hit_target = active & ~hit_stop & (high[t] >= target)
+                by_score = active & ~hit_stop & ~hit_target & (s <= self.exit)
+                by_time = active & ~hit_stop & ~hit_target & ~by_score & (t - entry_t >= self.max_holding)
+                price = np.where(hit_stop, stop, np.where(hit_target, target, c))
+
+                if active.any():
+                    daily[t - start] = np.mean(price[active] / mark[active] - 1)
+                    exposure[t - start] = active.sum()
+                mark = np.where(active, price, mark)
+
+                close_positions(hit_stop, t, price, "stop")
+                close_positions(hit_target, t, price, "objectif")
+                close_positions(by_score, t, price, "signal")
+                close_positions(by_time, t, price, "durée")
+                held &= ~(hit_stop | hit_target | by_score | by_time)
+
+                # --- Entrées à la clôture sur franchissement du seuil ---
+                crossed = (s >= self.entry) & ~(prev_score >= self.entry)
+                enter = ~held & quoted & crossed & (fib_valid[t] == 1) & (fib_stop[t] < c)
+                held |= enter
+                entry_t = np.where(enter, t, entry_t)
+                entry_price = np.where(enter, c, entry_price)
+                mark = np.where(enter, c, mark)
+                stop = np.where(enter, fib_stop[t], stop)
+                target = np.where(enter, fib_target[t], target)
+                prev_score = np.where(quoted, s, prev_score)
+
+        # Positions encore ouvertes : valorisées au dernier cours connu
+        close_positions(held, end - 1, mark, "fin")
+
+        trades = self._trades_frame(trades, tickers, dates)
+        equity = pd.Series(np.cumprod(1 + daily), index=dates[start:end])
+        return {
+            "trades": trades,
+            "equity": equity,
+            "hit_rate": float((trades["Rendement"] > 0).mean()) if len(trades) else float("nan"),
+            "avg_return": float(trades["Rendement"].mean()) if len(trades) else float("nan"),
+            "cagr": self._cagr(equity),
+            "max_drawdown": float((equity / equity.cummax() - 1).min()) if len(equity) else float("nan"),
+            "exposure": float((exposure > 0).mean()) if len(exposure) else float("nan"),
+        }
+
+    @staticmethod
+    def _trades_frame(chunks, tickers, dates):
+        """Assemble les trades enregistrés par blocs (indices) en DataFrame."""
+        columns = ["Ticker", "Entrée", "Sortie", "Prix entrée", "Prix sortie", "Rendement", "Séances", "Motif"]
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        rows, entries, exits, entry_prices, exit_prices, reasons = (np.concatenate(part) for part in zip(*chunks))
+        return pd.DataFrame({
+            "Ticker": np.asarray(tickers, dtype=object)[rows],
+            "Entrée": dates[entries],
+            "Sortie": dates[exits],
+            "Prix entrée": entry_prices,
+            "Prix sortie": exit_prices,
+            "Rendement": exit_prices / entry_prices - 1,
+            "Séances": exits - entries,
+            "Motif": reasons,
+        }).sort_values(["Sortie", "Ticker"], kind="stable").reset_index(drop=True)
+
+    @staticmethod
+    def _cagr(equity):
+        if len(equity) < 2:
+            return float("nan")
+        years = (equity.index[-1] - equity.index[0]).days / 365.25
+        return float(equity.iloc[-1] ** (1 / years) - 1) if years > 0 else float("nan")
+
+    @staticmethod
+    def print_report(result):
+        """Affiche la synthèse du backtest."""
+        trades = result["trades"]
+        print(Fore.CYAN + "\n=== 🧪 BACKTEST DU SCORE TECHNIQUE ===" + Style.RESET_ALL)
+        if trades.empty:
+            print("⚠️ Aucun trade déclenché sur la période.")
+            return
+        print(f"📅 Période : {result['equity'].index[0]:%Y-%m-%d} → {result['equity'].index[-1]:%Y-%m-%d}")
+        print(f"🔁 Trades : {len(trades)} ({trades['Ticker'].nunique()} tickers)")
+        print(f"🎯 Taux de réussite : {result['hit_rate'] * 100:.1f}%")
+        print(f"📊 Rendement moyen par trade : {result['avg_return'] * 100:.2f}%")
+        print(f"📈 CAGR : {result['cagr'] * 100:.2f}%")
+        print(f"📉 Drawdown maximal : {result['max_drawdown'] * 100:.2f}%")
+        print(f"⏱️ Exposition : {result['exposure'] * 100:.1f}% des séances")
+        reasons = trades["Motif"].value_counts()
+        print("🚪 Sorties : " + " | ".join(f"{motif} {count}" for motif, count in reasons.items()))
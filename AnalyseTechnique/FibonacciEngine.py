@@ -0,0 +1,199 @@
+import numpy as np
+
+
+class SparseTable:
+    """
+    Table creuse (sparse table) d'un tableau : `levels[k][i]` est l'extremum de
+    x[i : i + 2^k]. Construite une fois en O(n log w), elle répond à toute requête de
+    fenêtre glissante en O(n) (deux lectures par barre), quelle que soit la longueur
+    de la fenêtre. Les NaN se propagent comme pour IndicatorEngine.rolling_max/min.
+    """
+
+    def __init__(self, x, reducer):
+        """
+        Args:
+            x: Tableau 1-D ou 2-D (barres en lignes)
+            reducer: np.maximum ou np.minimum
+        """
+        self.reducer = reducer
+        self.levels = [np.asarray(x, dtype=np.float64)]
+
+    def _level(self, k):
+        """Niveau k, construit à la demande à partir du niveau précédent."""
+        while len(self.levels) <= k:
+            previous = self.levels[-1]
+            half = 1 << (len(self.levels) - 1)
+            self.levels.append(self.reducer(previous[:-half], previous[half:]))
+        return self.levels[k]
+
+    def rolling(self, window):
+        """Extremum des `window` dernières barres (NaN avant la première fenêtre complète)."""
+        x = self.levels[0]
+        out = np.full(x.shape, np.nan)
+        n = len(x)
+        if window < 1 or n < window:
+            return out
+        k = window.bit_length() - 1
+        level = self._level(k)
+        offset = window - (1 << k)
+        out[window - 1:] = self.reducer(level[:n - window + 1], level[offset:offset + n - window + 1])
+        return out
+
+
+class FibonacciEngine:
+    """
+    Niveaux de Fibonacci, tendance et position de chaque barre, pour plusieurs périodes.
+
+    Version vectorisée de TechnicalAnalysis.calculate_fibonacci_levels appliquée à toutes
+    les dates (dates × tickers éventuellement) : plus haut / plus bas glissants par table
+    creuse et moyennes glissantes par sommes cumulées, construits une fois et réutilisés
+    pour toutes les périodes (20, 50, 100, 200...). Chaque période coûte O(n).
+
+    Contrairement à la version scalaire, qui réduit la période aux barres disponibles,
+    les barres précédant la première fenêtre complète valent NaN.
+    """
+
+    # Niveaux de retracement, du plus bas (0%) au plus haut (100%)
+    RATIOS = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0])
+    LEVEL_NAMES = ("Low (0%)", "Fib 23.6%", "Fib 38.2%", "Fib 50%", "Fib 61.8%", "Fib 78.6%", "High (100%)")
+    KEY_LEVELS = (3, 4)  # Fib 50% et Fib 61.8%
+    EXTENSIONS = {"Ext 100%": 0.0, "Ext 127.2%": 0.272, "Ext 138.2%": 0.382, "Ext 161.8%": 0.618}
+    PERIODS = (20, 50, 100, 200)
+    SHORT_SMA = 10  # Moyenne courte de la détection de tendance
+
+    def __init__(self, high, low, close):
+        self.high, self.low, self.close = (np.asarray(a, dtype=np.float64) for a in (high, low, close))
+        self.highs = SparseTable(self.high, np.maximum)
+        self.lows = SparseTable(self.low, np.minimum)
+
+        # Sommes cumulées des clôtures (NaN comptés à part pour invalider leurs fenêtres)
+        missing = np.isnan(self.close)
+        zero = np.zeros((1,) + self.close.shape[1:])
+        self._sums = np.concatenate([zero, np.cumsum(np.where(missing, 0.0, self.close), axis=0)])
+        self._missing = np.concatenate([zero, np.cumsum(missing, axis=0)])
+
+    def rolling_mean(self, window):
+        """Moyenne glissante des clôtures en O(n)."""
+        out = np.full(self.close.shape, np.nan)
+        if len(self.close) < window:
+            return out
+        total = self._sums[window:] - self._sums[:-window]
+        gaps = self._missing[window:] - self._missing[:-window]
+        out[window - 1:] = np.where(gaps > 0, np.nan, total / window)
+        return out
+
+    def shifted_close(self, lag):
+        out = np.full(self.close.shape, np.nan)
+        if lag < len(self.close):
+            out[lag:] = self.close[:len(self.close) - lag]
+        return out
+
+    def levels(self, period):
+        """
+        Plus haut / plus bas glissants et niveaux de la période.
+
+        Returns:
+            dict: top, bottom, range, levels (7 × forme de close, du plus bas au plus haut)
+            et extensions {nom: tableau}
+        """
+        top = self.highs.rolling(period)
+        bottom = self.lows.rolling(period)
+        diff = top - bottom
+        return {
+            "top": top,
+            "bottom": bottom,
+            "range": diff,
+            "levels": bottom + self.RATIOS.reshape((-1,) + (1,) * self.close.ndim) * diff,
+            "extensions": {name: top + diff * ratio for name, ratio in self.EXTENSIONS.items()},
+        }
+
+    def analyze(self, period=50):
+        """
+        Analyse Fibonacci de chaque barre : validité, tendance (1 / 0 / -1), position dans
+        le range (%), note de position, support / résistance, stop loss et premier
+        objectif d'une position longue (cf. TechnicalAnalysis._analyze_fibonacci_position).
+
+        Returns:
+            dict de tableaux de même forme que `close` (+ `levels`, 7 × forme de close)
+        """
+        close = self.close
+        fib = self.levels(period)
+        top, bottom, diff, levels = fib["top"], fib["bottom"], fib["range"], fib["levels"]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            valid = (diff > 0) & (close > 0) & (diff / close >= 0.02)
+
+            # --- Tendance (cf. _detect_trend) ---
+            start = self.shifted_close(period - 1)
+            change = (close - start) / start * 100
+            sma_short = self.rolling_mean(self.SHORT_SMA)
+            sma_long = self.rolling_mean(period)
+            up = (change > 5) & (sma_short > sma_long * 1.02)
+            down = ~up & (change < -5) & (sma_short < sma_long * 0.98)
+            trend = np.where(up, 1, np.where(down, -1, 0))
+
+            # --- Support et résistance ---
+            tolerance = diff * 0.01
+            n_below = (levels < close - tolerance).sum(axis=0)
+            n_above = (levels > close + tolerance).sum(axis=0)
+            n_over = (levels > close).sum(axis=0)
+            count = len(self.RATIOS)
+
+            def level_at(index, present):
+                picked = np.take_along_axis(levels, np.clip(index, 0, count - 1)[None], axis=0)[0]
+                return np.where(present, picked, np.nan)
+
+            support = level_at(n_below - 1, n_below > 0)
+            resistance = level_at(count - n_above, n_above > 0)
+
+            # --- Note de position (cf. _evaluate_fibonacci_position) ---
+            position = (close - bottom) / diff * 100
+            near_key = np.zeros(close.shape, dtype=bool)
+            for k in self.KEY_LEVELS:
+                near_key |= np.abs(close - levels[k]) / diff < 0.03
+
+            score = 5.0 + np.select(
+                [up & (position >= 35) & (position <= 65), up & (position < 35), up & (position > 80)],
+                [3.0, 2.0, -2.0], default=0.0
+            )
+            score += np.where(up & near_key, 1.0, 0.0)
+            score += np.where(down, np.where(position > 65, 2.0, -1.0), 0.0)
+            score += np.where(~up & ~down & (position >= 45) & (position <= 55), 1.0, 0.0)
+
+            both = (n_below > 0) & (n_above > 0) & (support != 0) & (resistance != 0)
+            rr = (resistance - close) / (close - support)
+            score += np.where(both & (rr > 2), 1.5, np.where(both & (rr < 1), -1.0, 0.0))
+            score = np.clip(score, 0, 10)
+
+            # --- Stop loss d'une position longue ---
+            next_support = level_at(n_below - 2, n_below > 1)
+            stop = np.where(
+                n_below > 0,
+                np.where(up & (n_below > 1), next_support * 0.99, support * 0.97),
+                close * 0.95
+            )
+
+            # --- Premier objectif : résistance, sinon niveau supérieur, sinon extension 127.2% ---
+            target = np.where(
+                n_above > 0, resistance,
+                np.where(n_over > 0, level_at(count - n_over, n_over > 0),
+                         np.where(up, fib["extensions"]["Ext 127.2%"], np.nan))
+            )
+
+        return {
+            "valid": valid,
+            "trend": trend,
+            "position": np.where(valid, position, np.nan),
+            "score": np.where(valid, score, np.nan),
+            "support": support,
+            "resistance": resistance,
+            "stop": stop,
+            "target": target,
+            "top": top,
+            "bottom": bottom,
+            "levels": levels,
+        }
+
+    def analyze_all(self, periods=PERIODS):
+        """Analyse pour chaque période, en réutilisant les mêmes tables : {période: dict}."""
+        return {period: self.analyze(period) for period in periods}
@@ -0,0 +1,249 @@
+import os
+import numpy as np
+import pandas as pd
+from AnalyseTechnique.FibonacciEngine import FibonacciEngine
+
+
+class FibonacciIndex:
+    """
+    Index transversal « prix proche d'un niveau de Fibonacci » sur tout l'univers.
+
+    Pour chaque ticker : dernier prix, tendance, validité et valeur de chaque niveau de
+    retracement et d'extension. Les distances au prix (en %) sont triées une fois par
+    niveau, de sorte qu'une requête (ex: tickers à moins de 2% de leur Fib 61.8% en
+    tendance haussière) se résout par dichotomie en O(log N + résultats).
+
+    L'index est alimenté par les résultats de TechnicalAnalysis.calculate_fibonacci_levels
+    (`update`, après chaque analyse) ou construit directement à partir des cours de
+    l'univers (`build`, vectorisé), puis enregistré en Parquet. Chaque ligne garde
+    l'ancrage de ses niveaux et sa dernière séance : `stale` repère les lignes à
+    recalculer avant une requête.
+    """
+
+    LEVELS = ("High (100%)", "Fib 78.6%", "Fib 61.8%", "Fib 50%", "Fib 38.2%", "Fib 23.6%", "Low (0%)")
+    EXTENSIONS = ("Ext 161.8%", "Ext 138.2%", "Ext 127.2%", "Ext 100%")
+    NAMES = LEVELS + EXTENSIONS
+    TRENDS = {"haussier": 1, "neutre": 0, "baissier": -1}
+
+    def __init__(self):
+        self.rows = {}  # {ticker: (prix, code tendance, valide, [valeur par niveau], ancrage, date)}
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, ticker):
+        return ticker in self.rows
+
+    # ------------------------------------------------------------------
+    # Alimentation
+    # ------------------------------------------------------------------
+    def update(self, ticker, fib_data):
+        """
+        Ajoute / remplace un ticker à partir du résultat de calculate_fibonacci_levels
+        (avec son ancrage et sa dernière séance, cf. FibonacciResult).
+        """
+        values = dict(fib_data.get("levels", {}), **fib_data.get("extensions", {}))
+        self.rows[ticker] = (
+            float(fib_data["current_price"]),
+            self.TRENDS.get(fib_data.get("trend"), 0),
+            bool(fib_data.get("valid", False)),
+            [float(values.get(name, np.nan)) for name in self.NAMES],
+            fib_data.get("anchor") or "range",
+            fib_data.get("date"),
+        )
+        self._arrays = None
+
+    @staticmethod
+    def build(histories, period=50, anchor="range"):
+        """
+        Index de tout l'univers en une passe (FibonacciEngine sur les `period` dernières
+        barres de chaque ticker), avec les mêmes niveaux que l'analyse détaillée : les
+        historiques plus courts et l'ancrage "swing" passent par
+        TechnicalAnalysis.calculate_fibonacci_levels, ticker par ticker.
+
+        Args:
+            histories: dict {ticker: DataFrame OHLCV}
+            anchor: "range" ou "swing" (cf. TechnicalAnalysis.FIB_ANCHOR)
+        """
+        index = FibonacciIndex()
+        tickers, blocks, dates, others = [], [], [], {}
+        for ticker, data in histories.items():
+            if data is None or data.empty:
+                continue
+            columns = [
+                (data[f].iloc[:, 0] if isinstance(data[f], pd.DataFrame) else data[f]).to_numpy(dtype=np.float64)
+                for f in ("High", "Low", "Close")
+            ]
+            valid = ~np.isnan(columns[2])
+            if anchor != "range" or valid.sum() < period:
+                others[ticker] = data.loc[valid]
+                continue
+            tickers.append(ticker)
+            blocks.append(np.column_stack(columns)[valid][-period:])
+            dates.append(pd.Timestamp(data.index[valid][-1]).strftime("%Y-%m-%d"))
+
+        for ticker, data in others.items():
+            index._update_from_history(ticker, data, period, anchor)
+        if not tickers:
+            return index
+
+        stacked = np.stack(blocks, axis=2)  # (period, 3, N)
+        engine = FibonacciEngine(stacked[:, 0], stacked[:, 1], stacked[:, 2])
+        fib = engine.levels(period)
+        analysis = engine.analyze(period)
+
+        by_name = dict(zip(FibonacciEngine.LEVEL_NAMES, fib["levels"][:, -1]))
+        by_name.update({name: values[-1] for name, values in fib["extensions"].items()})
+        values = np.column_stack([by_name[name] for name in FibonacciIndex.NAMES])
+        for j, ticker in enumerate(tickers):
+            index.rows[ticker] = (
+                float(stacked[-1, 2, j]),
+                int(analysis["trend"][-1, j]),
+                bool(analysis["valid"][-1, j]),
+                values[j].tolist(),
+                anchor,
+                dates[j],
+            )
+        return index
+
+    def _update_from_history(self, ticker, data, period, anchor):
+        """Ligne d'un ticker calculée comme dans l'analyse détaillée (TechnicalAnalysis)."""
+        from AnalyseTechnique.TechnicalAnalysis import TechnicalAnalysis
+        from Donnees.TickerContext import TickerContext
+
+        if data.empty:
+            return
+        analysis = TechnicalAnalysis(ticker, context=TickerContext(ticker, history=data))
+        fib_data = analysis.calculate_fibonacci_levels(data, period=period, anchor=anchor)
+        self.update(ticker, dict(fib_data, anchor=anchor, date=pd.Timestamp(data.index[-1]).strftime("%Y-%m-%d")))
+
+    def replace(self, tickers, other):
+        """Remplace les lignes de `tickers` par celles de `other` (supprimées si absentes)."""
+        for ticker in tickers:
+            if ticker in other.rows:
+                self.rows[ticker] = other.rows[ticker]
+            else:
+                self.rows.pop(ticker, None)
+        self._arrays = None
+
+    @staticmethod
+    def last_session():
+        """Dernière séance close attendue (jour ouvré précédent), AAAA-MM-JJ."""
+        today = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+        return (today - pd.offsets.BDay(1)).strftime("%Y-%m-%d")
+
+    def stale(self, anchor, session=None):
+        """
+        Tickers à recalculer : niveaux d'un autre ancrage, ou antérieurs à `session`
+        (par défaut la dernière séance close). Les lignes d'un index enregistré avant
+        l'ajout de l'ancrage et de la date le sont toujours.
+        """
+        session = session or self.last_session()
+        return [ticker for ticker, row in self.rows.items()
+                if row[4] != anchor or row[5] is None or row[5] < session]
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+    def _build_arrays(self):
+        """Tableaux (tickers × niveaux) et, par niveau, distances triées (calculés une fois)."""
+        if self._arrays is None:
+            tickers = list(self.rows)
+            prices = np.array([self.rows[t][0] for t in tickers], dtype=float)
+            values = np.array([self.rows[t][3] for t in tickers], dtype=float).reshape(len(tickers), len(self.NAMES))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                distances = (prices[:, None] - values) / values * 100
+            distances[~np.array([self.rows[t][2] for t in tickers], dtype=bool)] = np.nan
+            order = np.argsort(distances, axis=0, kind="stable")  # NaN en fin de tri
+            self._arrays = {
+                "tickers": np.array(tickers, dtype=object),
+                "prices": prices,
+                "trends": np.array([self.rows[t][1] for t in tickers], dtype=int),
+                "values": values,
+                "order": order,
+                "sorted": np.take_along_axis(distances, order, axis=0),
+            }
+        return self._arrays
+
+    def query(self, level="Fib 61.8%", within=2.0, trend=None, side=None):
+        """
+        Tickers dont le prix est à moins de `within` % du niveau `level`.
+
+        Args:
+            level: Nom du niveau (cf. NAMES)
+            within: Distance maximale en % du niveau
+            trend: 'haussier', 'baissier' ou 'neutre' (toutes par défaut)
+            side: 'above' (prix au-dessus du niveau), 'below' ou None (les deux)
+
+        Returns:
+            DataFrame trié par distance absolue croissante
+        """
+        if level not in self.NAMES:
+            raise KeyError(f"Niveau inconnu : '{level}' (disponibles : {', '.join(self.NAMES)})")
+        columns = ["Ticker", "Prix", "Niveau", "Distance (%)", "Tendance"]
+        if not self.rows:
+            return pd.DataFrame(columns=columns)
+
+        a = self._build_arrays()
+        k = self.NAMES.index(level)
+        low = 0.0 if side == "above" else -within
+        high = 0.0 if side == "below" else within
+        start = np.searchsorted(a["sorted"][:, k], low, side="left")
+        end = np.searchsorted(a["sorted"][:, k], high, side="right")
+        rows, distances = a["order"][start:end, k], a["sorted"][start:end, k]
+        if trend is not None:
+            keep = a["trends"][rows] == self.TRENDS[trend]
+            rows, distances = rows[keep], distances[keep]
+
+        names = {code: name for name, code in self.TRENDS.items()}
+        result = pd.DataFrame({
+            "Ticker": a["tickers"][rows],
+            "Prix": a["prices"][rows],
+            "Niveau": a["values"][rows, k],
+            "Distance (%)": distances,
+            "Tendance": [names[code] for code in a["trends"][rows]],
+        }, columns=columns)
+        return result.reindex(result["Distance (%)"].abs().sort_values(kind="stable").index).reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # Persistance
+    # ------------------------------------------------------------------
+    def to_frame(self):
+        return pd.DataFrame(
+            [[price, trend, valid, *values, anchor, date]
+             for price, trend, valid, values, anchor, date in self.rows.values()],
+            index=pd.Index(list(self.rows), name="Ticker"),
+            columns=["Prix", "Tendance", "Valide", *self.NAMES, "Ancrage", "Date"],
+        )
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.to_frame().to_parquet(path)
+
+    @staticmethod
+    def load(path):
+        """Index enregistré, ou index vide si le fichier est absent ou illisible."""
+        index = FibonacciIndex()
+        if not os.path.exists(path):
+            return index
+        try:
+            frame = pd.read_parquet(path)
+        except Exception as e:
+            print(f"⚠️ Index Fibonacci illisible ({e}), index vide.")
+            return index
+        values = frame[list(FibonacciIndex.NAMES)].to_numpy(dtype=float).tolist()
+        # Index antérieur à l'ancrage / la date par ligne : provenance inconnue
+        anchors = frame["Ancrage"] if "Ancrage" in frame else [None] * len(frame)
+        dates = frame["Date"] if "Date" in frame else [None] * len(frame)
+        for ticker, price, trend, valid, levels, anchor, date in zip(
+                frame.index, frame["Prix"], frame["Tendance"], frame["Valide"], values, anchors, dates):
+            index.rows[ticker] = (float(price), int(trend), bool(valid), levels, anchor, date)
+        return index
+
+    @staticmethod
+    def print_results(results, level, within):
+        print(f"\n🔎 {len(results)} ticker(s) à moins de {within:g}% du niveau {level}")
+        for _, row in results.iterrows():
+            print(f"  {row['Ticker']:10} {row['Prix']:10.2f}€ | {level} : {row['Niveau']:.2f}€ "
+                  f"({row['Distance (%)']:+.2f}%) | {row['Tendance']}")
@@ -0,0 +1,91 @@
+from bisect import bisect_left, bisect_right
+import numpy as np
+
+
+class FibonacciLevels:
+    """
+    Niveaux de Fibonacci d'un ticker triés une fois par prix croissant, pour des recherches
+    par dichotomie : support et résistance les plus proches, N niveaux suivants au-dessus
+    ou en dessous d'un prix, niveaux proches d'un prix.
+
+    Les versions `*_many` traitent un tableau de prix en un appel (np.searchsorted). Pour
+    des niveaux différents à chaque barre (niveaux glissants), cf. FibonacciEngine, dont les
+    niveaux (7 × barres) sont déjà triés par construction.
+    """
+
+    def __init__(self, levels):
+        """
+        Args:
+            levels: dict {nom: prix}
+        """
+        self.by_name = dict(levels)
+        ordered = sorted(self.by_name.items(), key=lambda item: item[1])
+        self.names = [name for name, _ in ordered]
+        self.values = [float(value) for _, value in ordered]
+        self.array = np.array(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, name, default=None):
+        return self.by_name.get(name, default)
+
+    # ------------------------------------------------------------------
+    # Un prix
+    # ------------------------------------------------------------------
+    def support(self, price, tolerance=0.0):
+        """Niveau le plus proche strictement sous `price - tolerance` : (prix, nom) ou (None, None)."""
+        i = bisect_left(self.values, price - tolerance) - 1
+        return (self.values[i], self.names[i]) if i >= 0 else (None, None)
+
+    def resistance(self, price, tolerance=0.0):
+        """Niveau le plus proche strictement au-dessus de `price + tolerance` : (prix, nom) ou (None, None)."""
+        i = bisect_right(self.values, price + tolerance)
+        return (self.values[i], self.names[i]) if i < len(self.values) else (None, None)
+
+    def below(self, price, tolerance=0.0, count=None):
+        """Niveaux strictement sous `price - tolerance`, du plus proche au plus lointain : [(prix, nom)]."""
+        end = bisect_left(self.values, price - tolerance)
+        start = 0 if count is None else max(0, end - count)
+        return [(self.values[i], self.names[i]) for i in range(end - 1, start - 1, -1)]
+
+    def above(self, price, tolerance=0.0, count=None):
+        """Niveaux strictement au-dessus de `price + tolerance`, du plus proche au plus lointain : [(prix, nom)]."""
+        start = bisect_right(self.values, price + tolerance)
+        end = len(self.values) if count is None else min(len(self.values), start + count)
+        return [(self.values[i], self.names[i]) for i in range(start, end)]
+
+    def near(self, price, distance):
+        """Noms des niveaux à moins de `distance` de `price` (|prix - niveau| < distance)."""
+        start = max(0, bisect_left(self.values, price - distance) - 1)
+        end = min(len(self.values), bisect_right(self.values, price + distance) + 1)
+        return [self.names[i] for i in range(start, end) if abs(price - self.values[i]) < distance]
+
+    # ------------------------------------------------------------------
+    # Plusieurs prix
+    # ------------------------------------------------------------------
+    def supports_many(self, prices, tolerance=0.0):
+        """Supports de chaque prix (NaN s'il n'y en a pas) et leurs index dans `names` (-1)."""
+        index = np.searchsorted(self.array, np.asarray(prices, dtype=float) - tolerance, side="left") - 1
+        return self._pick(index), index
+
+    def resistances_many(self, prices, tolerance=0.0):
+        """Résistances de chaque prix (NaN s'il n'y en a pas) et leurs index dans `names` (len)."""
+        index = np.searchsorted(self.array, np.asarray(prices, dtype=float) + tolerance, side="right")
+        return self._pick(index), index
+
+    def above_many(self, prices, count, tolerance=0.0):
+        """`count` niveaux suivants au-dessus de chaque prix : tableau (prix × count), NaN au-delà."""
+        start = np.searchsorted(self.array, np.asarray(prices, dtype=float) + tolerance, side="right")
+        return self._pick(start[..., None] + np.arange(count))
+
+    def below_many(self, prices, count, tolerance=0.0):
+        """`count` niveaux suivants en dessous de chaque prix (du plus proche) : (prix × count), NaN au-delà."""
+        end = np.searchsorted(self.array, np.asarray(prices, dtype=float) - tolerance, side="left")
+        return self._pick(end[..., None] - 1 - np.arange(count))
+
+    def _pick(self, index):
+        present = (index >= 0) & (index < len(self.values))
+        if not len(self.values):
+            return np.full(np.shape(index), np.nan)
+        return np.where(present, self.array[np.clip(index, 0, len(self.values) - 1)], np.nan)
@@ -0,0 +1,227 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class IndicatorEngine:
+    """
+    Calcul vectorisé (NumPy) des indicateurs techniques sur des tableaux float64 contigus.
+
+    Reproduit les colonnes de la librairie `ta` (RSI, Stochastique, MACD, OBV, Bollinger,
+    EMA200, ADX) en partageant les calculs intermédiaires : une seule différence de
+    clôture, un seul true range, des moyennes exponentielles réutilisées.
+
+    Toutes les fonctions acceptent un tableau 1-D (une série) ou 2-D (dates × tickers),
+    le temps étant toujours l'axe 0. Les NaN de tête (date de cotation plus tardive)
+    sont gérés colonne par colonne.
+    """
+
+    BLOCK = 64  # Taille des blocs de la récurrence exponentielle (stabilité numérique)
+
+    # ------------------------------------------------------------------
+    # Primitives
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _as_2d(x):
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        return (x.reshape(-1, 1) if x.ndim == 1 else x), x.shape
+
+    @staticmethod
+    def shift(x, n=1):
+        """Décale la série de `n` barres vers le bas (NaN en tête)."""
+        out = np.full_like(x, np.nan, dtype=np.float64)
+        out[n:] = x[:-n]
+        return out
+
+    @staticmethod
+    def ewm(x, alpha, min_periods=1, seed_window=None):
+        """
+        Moyenne exponentielle récursive y[t] = (1 - alpha) * y[t-1] + alpha * x[t]
+        (équivalent pandas `ewm(adjust=False)`), démarrant à la première valeur valide
+        de chaque colonne.
+
+        Les NaN après le démarrage sont sautés comme dans pandas (`ignore_na=False`) :
+        la moyenne est reportée sur ces barres, et la valeur suivante est pondérée
+        selon la durée du trou, poids (1 - alpha)^(trou + 1) contre alpha.
+
+        Args:
+            x: Tableau 1-D ou 2-D (temps en axe 0)
+            alpha: Facteur de lissage
+            min_periods: Nombre d'observations avant la première valeur publiée
+            seed_window: Si fourni, initialise la récurrence par la moyenne simple des
+                `seed_window` premières valeurs (lissage de Wilder)
+        """
+        x2, shape = IndicatorEngine._as_2d(x)
+        T, N = x2.shape
+        out = np.full((T, N), np.nan)
+        if T == 0:
+            return out.reshape(shape)
+
+        valid = ~np.isnan(x2)
+        has_data = valid.any(axis=0)
+        first = np.where(has_data, valid.argmax(axis=0), T)
+        seed_idx = first + (seed_window - 1 if seed_window else 0)
+        ok = seed_idx < T
+        seed_at = np.minimum(seed_idx, T - 1)
+
+        # Valeur initiale : première valeur valide ou moyenne de la fenêtre d'amorçage
+        filled = np.where(valid, x2, 0.0)
+        csum = np.vstack([np.zeros((1, N)), np.cumsum(filled, axis=0)])
+        cols = np.arange(N)
+        count = (seed_at - first + 1).clip(min=1)
+        seed = (csum[seed_at + 1, cols] - csum[np.minimum(first, T - 1), cols]) / count
+
+        # Récurrence à coefficients variables y[t] = c[t] * y[t-1] + d[t] * x[t] :
+        # c = 1 - alpha, d = alpha sans trou ; c = w / (w + alpha), d = alpha / (w + alpha)
+        # avec w = (1 - alpha)^(trou + 1) après un trou ; c = 1, d = 0 sur un NaN et
+        # jusqu'à l'amorçage (y reste égal à la graine)
+        t = np.arange(T)[:, None]
+        decay = 1.0 - alpha
+        last = np.maximum.accumulate(np.where(valid, t, -1), axis=0)
+        gap = t - np.vstack([np.full((1, N), -1), last[:-1]]) - 1
+        w = decay ** (gap + 1.0)
+        c = np.where(valid, w / (w + alpha), 1.0)
+        d = np.where(valid, alpha / (w + alpha), 0.0)
+        warmup = t <= seed_idx[None, :]
+        c[warmup] = 1.0
+        d[warmup] = 0.0
+
+        # Forme fermée par blocs : y[t] = P[t] * (y0 + somme(d[s] * x[s] / P[s])), P = produit des c
+        y_prev = seed
+        for start in range(0, T, IndicatorEngine.BLOCK):
+            stop = start + IndicatorEngine.BLOCK
+            P = np.cumprod(c[start:stop], axis=0)
+            acc = np.cumsum(d[start:stop] * filled[start:stop] / P, axis=0)
+            out[start:stop] = P * (y_prev + acc)
+            y_prev = out[min(stop, T) - 1]
+
+        nobs = np.cumsum(valid, axis=0)
+        publish = (t >= seed_idx[None, :]) & (nobs >= min_periods)
+        out[~publish | ~ok[None, :]] = np.nan
+        return out.reshape(shape)
+
+    @staticmethod
+    def _rolling(x, window, reducer):
+        x2, shape = IndicatorEngine._as_2d(x)
+        out = np.full(x2.shape, np.nan)
+        if len(x2) >= window:
+            out[window - 1:] = reducer(sliding_window_view(x2, window, axis=0), axis=-1)
+        return out.reshape(shape)
+
+    @staticmethod
+    def rolling_mean(x, window):
+        return IndicatorEngine._rolling(x, window, np.mean)
+
+    @staticmethod
+    def rolling_std(x, window):
+        """Écart-type glissant (ddof=0, comme `ta`)."""
+        return IndicatorEngine._rolling(x, window, np.std)
+
+    @staticmethod
+    def rolling_min(x, window):
+        return IndicatorEngine._rolling(x, window, np.min)
+
+    @staticmethod
+    def rolling_max(x, window):
+        return IndicatorEngine._rolling(x, window, np.max)
+
+    # ------------------------------------------------------------------
+    # Intermédiaires partagés
+    # ------------------------------------------------------------------
+    @staticmethod
+    def close_diff(close, prev_close):
+        """Variation de clôture d'une barre à l'autre (RSI, OBV)."""
+        return close - prev_close
+
+    @staticmethod
+    def true_range(high, low, prev_close):
+        return np.maximum(high, prev_close) - np.minimum(low, prev_close)
+
+    # ------------------------------------------------------------------
+    # Indicateurs
+    # ------------------------------------------------------------------
+    @staticmethod
+    def rsi(close, diff):
+        """
+        RSI (14) : lissage de Wilder des hausses / baisses. Comme dans `ta`, une
+        variation manquante en cours de série compte pour 0 (hausse et baisse, le ratio
+        est inchangé) ; seules les barres avant la première cotation sont ignorées.
+        """
+        e = IndicatorEngine
+        leading = np.cumsum(~np.isnan(close), axis=0) == 0
+        up = np.where(diff > 0, diff, 0.0)
+        down = np.where(diff < 0, -diff, 0.0)
+        up[leading] = np.nan
+        down[leading] = np.nan
+        avg_up = e.ewm(up, 1 / 14, min_periods=14)
+        avg_down = e.ewm(down, 1 / 14, min_periods=14)
+        rsi = np.where(avg_down == 0, 100.0, 100 - 100 / (1 + avg_up / avg_down))
+        rsi[np.isnan(avg_down)] = np.nan
+        return {"RSI": rsi}
+
+    @staticmethod
+    def stochastic(high, low, close):
+        """Stochastique (14, 3)."""
+        e = IndicatorEngine
+        lowest = e.rolling_min(low, 14)
+        highest = e.rolling_max(high, 14)
+        stoch_k = 100 * (close - lowest) / (highest - lowest)
+        return {"STOCH_K": stoch_k, "STOCH_D": e.rolling_mean(stoch_k, 3)}
+
+    @staticmethod
+    def macd(close):
+        """MACD (12, 26, 9)."""
+        e = IndicatorEngine
+        macd = e.ewm(close, 2 / 13, min_periods=12) - e.ewm(close, 2 / 27, min_periods=26)
+        return {"MACD": macd, "Signal": e.ewm(macd, 2 / 10, min_periods=9)}
+
+    @staticmethod
+    def obv(close, diff, volume):
+        """OBV : réutilise la différence de clôture."""
+        signed = np.where(diff < 0, -volume, volume)
+        obv = np.cumsum(np.nan_to_num(signed), axis=0)
+        obv[np.isnan(close)] = np.nan
+        return {"OBV": obv}
+
+    @staticmethod
+    def bollinger(close):
+        """Bandes de Bollinger (20, 2)."""
+        bb_m = IndicatorEngine.rolling_mean(close, 20)
+        bb_std = IndicatorEngine.rolling_std(close, 20)
+        return {"BB_H": bb_m + 2 * bb_std, "BB_L": bb_m - 2 * bb_std, "BB_M": bb_m}
+
+    @staticmethod
+    def ema200(close):
+        return {"EMA200": IndicatorEngine.ewm(close, 2 / 201, min_periods=200)}
+
+    @staticmethod
+    def adx(high, low, true_range):
+        """ADX (14) : true range et mouvements directionnels lissés (Wilder)."""
+        e = IndicatorEngine
+        up_move = high - e.shift(high)
+        down_move = e.shift(low) - low
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+        plus_dm[np.isnan(up_move)] = np.nan
+        minus_dm[np.isnan(down_move)] = np.nan
+
+        trs = e.ewm(true_range, 1 / 14, seed_window=14)
+        dip = e.ewm(plus_dm, 1 / 14, seed_window=14)
+        din = e.ewm(minus_dm, 1 / 14, seed_window=14)
+        di_plus = np.where(trs != 0, 100 * dip / trs, 0.0)
+        di_minus = np.where(trs != 0, 100 * din / trs, 0.0)
+        di_sum = di_plus + di_minus
+        dx = np.where(di_sum != 0, 100 * np.abs(di_plus - di_minus) / di_sum, 0.0)
+        dx[np.isnan(trs)] = np.nan
+        return {"ADX": e.ewm(dx, 1 / 14, seed_window=14)}
+
+    @staticmethod
+    def compute(high, low, close, volume):
+        """
+        Calcule tous les indicateurs en une passe (cf. IndicatorRegistry pour un sous-ensemble).
+
+        Returns:
+            dict: {colonne: tableau} pour RSI, STOCH_K, STOCH_D, MACD, Signal, OBV,
+            BB_H, BB_L, BB_M, EMA200, ADX
+        """
+        from AnalyseTechnique.IndicatorRegistry import IndicatorRegistry
+        return IndicatorRegistry.compute(high, low, close, volume)
@@ -1,4 +1,5 @@
-from colorama import Fore, Style
+import json
+import numpy as np
 
 class IndicatorEvaluator:
     """
@@ -6,7 +7,14 @@ class IndicatorEvaluator:
     moyen-terme (2 ans). Combine prudence et flexibilité pour capter les retournements naissants.
     """
 
-    def __init__(self):
+    # Seuils ajustables (cf. WeightOptimizer) : remplacent les tables de classe sur l'instance
+    THRESHOLDS = ("RSI_BINS", "BOLLINGER_DEEP", "EMA200_BINS", "ADX_BINS")
+
+    # Configuration {"weights": ..., "thresholds": ...} appliquée par défaut (cf. `use`)
+    config = None
+
+    def __init__(self, weights=None, thresholds=None):
+        config = IndicatorEvaluator.config or {}
         self.weights = {
             "RSI": 22,
             "Stochastique": 5,
@@ -17,121 +25,216 @@ class IndicatorEvaluator:
             "ADX": 5,
             "Fibonacci": 10,  # Nouveau poids pour Fibonacci
         }
+        self.weights.update(weights if weights is not None else config.get("weights", {}))
+
+        thresholds = thresholds if thresholds is not None else config.get("thresholds", {})
+        for name, value in thresholds.items():
+            if name not in self.THRESHOLDS:
+                raise KeyError(f"Seuil inconnu : '{name}'")
+            setattr(self, name, tuple(value) if isinstance(value, (list, tuple)) else float(value))
+
+    def thresholds(self):
+        """Seuils ajustables en vigueur."""
+        return {name: getattr(self, name) for name in self.THRESHOLDS}
+
+    @staticmethod
+    def load(path):
+        """
+        Lit une configuration {"weights": ..., "thresholds": ...} (ex: `recommended` d'un
+        rapport WeightOptimizer). Le fichier peut contenir le rapport complet.
+        """
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        return config.get("recommended", config)
+
+    @staticmethod
+    def use(path):
+        """Applique la configuration du fichier à tous les évaluateurs créés ensuite."""
+        IndicatorEvaluator.config = IndicatorEvaluator.load(path) if path else None
+
+    # ------------------------------------------------------------------
+    # Chaque évaluation existe en version vectorisée (`*_array`) qui note des
+    # tableaux entiers (dates × tickers) en une passe et retourne les notes et
+    # les codes d'interprétation (index dans `*_MESSAGES`). Les versions
+    # scalaires, utilisées pour le dernier cours, s'appuient sur les mêmes tables.
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _lookup(codes, notes):
+        codes = np.asarray(codes)
+        return np.asarray(notes)[codes], codes
+
+    @staticmethod
+    def interpretation(messages, code, *values):
+        """Texte d'interprétation d'un code (les messages EMA200 sont formatés avec la décote)."""
+        return messages[int(code)].format(*values)
 
     # --- RSI ---
+    RSI_BINS = (22, 28, 30, 35, 45, 50, 55, 65)
+    RSI_NOTES = (10, 9, 8, 7, 6, 5, 4, 3, 1)
+    RSI_MESSAGES = (
+        "🟢 RSI < 20 → Marché en panique totale 😱. Niveau historiquement bas, opportunité exceptionnelle 💎.",
+        "🟢 RSI 20–28 → Forte sous-évaluation, marché dominé par la peur. Signal d'entrée solide ✅.",
+        "🟢 RSI 28–35 → Sous-évaluation technique claire, zone d'achat intéressante 👀.",
+        "🟢 RSI 28–35 → Sous-évaluation technique claire, zone d'achat intéressante 👀.",
+        "🟡 RSI 35–45 → Faiblesse modérée, surveiller une reprise confirmée.",
+        "🟡 RSI 35–45 → Faiblesse modérée, surveiller une reprise confirmée.",
+        "⚪ RSI 45–55 → Marché neutre, patience recommandée ⏳.",
+        "🟠 RSI 55–65 → Légère surévaluation, prudence.",
+        "🔴 RSI > 65 → Surachat, risque de repli 🚨.",
+    )
+
+    def evaluate_rsi_array(self, rsi):
+        codes = np.digitize(rsi, self.RSI_BINS)
+        return self._lookup(codes, self.RSI_NOTES)
+
     def evaluate_rsi(self, rsi: float):
-        if rsi < 22:
-            return 10, "🟢 RSI < 20 → Marché en panique totale 😱. Niveau historiquement bas, opportunité exceptionnelle 💎."
-        elif rsi < 28:
-            return 9, "🟢 RSI 20–28 → Forte sous-évaluation, marché dominé par la peur. Signal d'entrée solide ✅."
-        elif rsi < 30:
-            return 8, "🟢 RSI 28–35 → Sous-évaluation technique claire, zone d'achat intéressante 👀."
-        elif rsi < 35:
-            return 7, "🟢 RSI 28–35 → Sous-évaluation technique claire, zone d'achat intéressante 👀."
-        elif rsi < 45:
-            return 6, "🟡 RSI 35–45 → Faiblesse modérée, surveiller une reprise confirmée."
-        elif rsi < 50:
-            return 5, "🟡 RSI 35–45 → Faiblesse modérée, surveiller une reprise confirmée."
-        elif rsi < 55:
-            return 4, "⚪ RSI 45–55 → Marché neutre, patience recommandée ⏳."
-        elif rsi < 65:
-            return 3, "🟠 RSI 55–65 → Légère surévaluation, prudence."
-        else:
-            return 1, "🔴 RSI > 65 → Surachat, risque de repli 🚨."
+        notes, code = self.evaluate_rsi_array(rsi)
+        return int(notes), self.RSI_MESSAGES[int(code)]
 
     # --- Stochastique ---
+    STOCH_NOTES = (9, 8, 6, 4, 3, 1)
+    STOCH_MESSAGES = (
+        "🟢 Croisement haussier sous 15 → Signal fort de redressement potentiel ⚡.",
+        "🟢 Stochastique < 25 → Marché survendu, probabilité élevée de rebond 📈.",
+        "🟡 Stochastique bas mais stabilisé → zone d'observation.",
+        "⚪ Stochastique neutre → peu exploitable.",
+        "🟠 Stochastique haut → possible essoufflement.",
+        "🔴 Stochastique > 80 → Surachat confirmé 🚨.",
+    )
+
+    def evaluate_stoch_array(self, k, d):
+        k, d = np.asarray(k, dtype=float), np.asarray(d, dtype=float)
+        codes = np.select(
+            [(k < 15) & (k > d), k < 25, (25 <= k) & (k <= 40), (40 < k) & (k <= 65), (65 < k) & (k <= 80)],
+            [0, 1, 2, 3, 4], default=5
+        )
+        return self._lookup(codes, self.STOCH_NOTES)
+
     def evaluate_stoch(self, k: float, d: float):
-        if k < 15 and k > d:
-            return 9, "🟢 Croisement haussier sous 15 → Signal fort de redressement potentiel ⚡."
-        elif k < 25:
-            return 8, "🟢 Stochastique < 25 → Marché survendu, probabilité élevée de rebond 📈."
-        elif 25 <= k <= 40:
-            return 6, "🟡 Stochastique bas mais stabilisé → zone d'observation."
-        elif 40 < k <= 65:
-            return 4, "⚪ Stochastique neutre → peu exploitable."
-        elif 65 < k <= 80:
-            return 3, "🟠 Stochastique haut → possible essoufflement."
-        else:
-            return 1, "🔴 Stochastique > 80 → Surachat confirmé 🚨."
+        notes, code = self.evaluate_stoch_array(k, d)
+        return int(notes), self.STOCH_MESSAGES[int(code)]
 
     # --- Bandes de Bollinger ---
+    BOLLINGER_DEEP = 0.97  # Cours « très en dessous » de la bande basse
+    BOLLINGER_NOTES = (10, 8, 6, 4, 2)
+    BOLLINGER_MESSAGES = (
+        "🟢 Cours très en dessous de la bande basse → excès de vente exceptionnel 💎.",
+        "🟢 Cours sous la bande basse → marché survendu, rebond probable ⚡.",
+        "🟡 Cours sous la moyenne → phase de repli, bonne zone d'accumulation progressive 📊.",
+        "⚪ Cours entre moyenne et bande haute → marché équilibré.",
+        "🔴 Cours au-dessus de la bande haute → euphorie du marché 🚨.",
+    )
+
+    def evaluate_bollinger_array(self, close, bb_low, bb_mid, bb_high):
+        close, bb_low, bb_mid, bb_high = (np.asarray(a, dtype=float) for a in (close, bb_low, bb_mid, bb_high))
+        codes = np.select(
+            [close < bb_low * self.BOLLINGER_DEEP, close < bb_low, close < bb_mid, close < bb_high],
+            [0, 1, 2, 3], default=4
+        )
+        return self._lookup(codes, self.BOLLINGER_NOTES)
+
     def evaluate_bollinger(self, close, bb_low, bb_mid, bb_high):
-        if close < bb_low * 0.97:
-            return 10, "🟢 Cours très en dessous de la bande basse → excès de vente exceptionnel 💎."
-        elif close < bb_low:
-            return 8, "🟢 Cours sous la bande basse → marché survendu, rebond probable ⚡."
-        elif close < bb_mid:
-            return 6, "🟡 Cours sous la moyenne → phase de repli, bonne zone d'accumulation progressive 📊."
-        elif close < bb_high:
-            return 4, "⚪ Cours entre moyenne et bande haute → marché équilibré."
-        else:
-            return 2, "🔴 Cours au-dessus de la bande haute → euphorie du marché 🚨."
+        notes, code = self.evaluate_bollinger_array(close, bb_low, bb_mid, bb_high)
+        return int(notes), self.BOLLINGER_MESSAGES[int(code)]
 
     # --- MACD ---
-    def evaluate_macd(self, macd_val, signal_val):
+    MACD_NOTES = (10, 9, 7, 5, 3, 2)
+    MACD_MESSAGES = (
+        "🟢 Croisement haussier profond sous zéro → retournement majeur probable, signal rare 🔄✨.",
+        "🟢 Croisement haussier sous zéro → très bon signal de redressement 💪📈.",
+        "🟢 MACD haussier proche de zéro → reprise en cours, encore un peu de prudence 👀.",
+        "🟡 MACD haussier positif → tendance déjà engagée, peu de marge d'entrée 🏁.",
+        "🟠 MACD baissier sous zéro → marché toujours sous pression, patience 🕰️.",
+        "🔴 MACD positif mais en affaiblissement → risque de retournement baissier ⚠️.",
+    )
+
+    def evaluate_macd_array(self, macd_val, signal_val):
         """
         Interprétation du MACD centrée sur la détection de retournements haussiers précoces.
         L'accent est mis sur les croisements haussiers sous zéro, et non sur les phases déjà haussières.
         """
-        if macd_val > signal_val and macd_val < -0.6:
-            return 10, "🟢 Croisement haussier profond sous zéro → retournement majeur probable, signal rare 🔄✨."
-        elif macd_val > signal_val and macd_val < -0.3:
-            return 9, "🟢 Croisement haussier sous zéro → très bon signal de redressement 💪📈."
-        elif macd_val > signal_val and macd_val < 0:
-            return 7, "🟢 MACD haussier proche de zéro → reprise en cours, encore un peu de prudence 👀."
-        elif macd_val > signal_val:
-            return 5, "🟡 MACD haussier positif → tendance déjà engagée, peu de marge d'entrée 🏁."
-        elif macd_val < signal_val and macd_val < -0.3:
-            return 3, "🟠 MACD baissier sous zéro → marché toujours sous pression, patience 🕰️."
-        else:
-            return 2, "🔴 MACD positif mais en affaiblissement → risque de retournement baissier ⚠️."
+        macd_val, signal_val = np.asarray(macd_val, dtype=float), np.asarray(signal_val, dtype=float)
+        bullish = macd_val > signal_val
+        codes = np.select(
+            [bullish & (macd_val < -0.6), bullish & (macd_val < -0.3), bullish & (macd_val < 0), bullish,
+             (macd_val < signal_val) & (macd_val < -0.3)],
+            [0, 1, 2, 3, 4], default=5
+        )
+        return self._lookup(codes, self.MACD_NOTES)
+
+    def evaluate_macd(self, macd_val, signal_val):
+        notes, code = self.evaluate_macd_array(macd_val, signal_val)
+        return int(notes), self.MACD_MESSAGES[int(code)]
 
     # --- OBV ---
+    OBV_NOTES = (9, 7, 4, 3, 1)
+    OBV_MESSAGES = (
+        "🟢 OBV en forte hausse → accumulation claire 📦. Acheteurs discrets en action.",
+        "🟢 OBV légèrement haussier → flux acheteurs modérés mais réguliers ✅.",
+        "⚪ OBV stable → marché attentiste ⏸️.",
+        "🟠 OBV en baisse → sortie légère de capitaux.",
+        "🔴 OBV en forte baisse → distribution nette 💸.",
+    )
+
+    def evaluate_obv_array(self, recent, previous):
+        recent, previous = np.asarray(recent, dtype=float), np.asarray(previous, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variation = np.where(previous != 0, (recent - previous) / previous * 100, 0.0)
+        codes = np.select(
+            [variation > 8, variation > 3, np.abs(variation) <= 1, variation < -3],
+            [0, 1, 2, 3], default=4
+        )
+        return self._lookup(codes, self.OBV_NOTES)
+
     def evaluate_obv(self, recent, previous):
-        variation = (recent - previous) / previous * 100 if previous != 0 else 0
-        if variation > 8:
-            return 9, "🟢 OBV en forte hausse → accumulation claire 📦. Acheteurs discrets en action."
-        elif variation > 3:
-            return 7, "🟢 OBV légèrement haussier → flux acheteurs modérés mais réguliers ✅."
-        elif abs(variation) <= 1:
-            return 4, "⚪ OBV stable → marché attentiste ⏸️."
-        elif variation < -3:
-            return 3, "🟠 OBV en baisse → sortie légère de capitaux."
-        else:
-            return 1, "🔴 OBV en forte baisse → distribution nette 💸."
+        notes, code = self.evaluate_obv_array(recent, previous)
+        return int(notes), self.OBV_MESSAGES[int(code)]
 
     # --- EMA200 ---
+    EMA200_BINS = (-18, -10, -5, -2.5, 0, 2.5, 5)
+    EMA200_NOTES = (10, 9, 7, 6, 5, 4, 3, 1)
+    EMA200_MESSAGES = (  # {0} = écart absolu au prix en %
+        "🟢 Prix {0:.1f}% sous EMA200 → décote exceptionnelle 💎.",
+        "🟢 Prix {0:.1f}% sous EMA200 → forte sous-évaluation, opportunité sérieuse ✅.",
+        "🟢 Prix {0:.1f}% sous EMA200 → décote intéressante, zone d'accumulation potentielle.",
+        "🟡 Prix légèrement sous EMA200 → neutre à légèrement favorable.",
+        "🟡 Prix légèrement sous EMA200 → neutre à légèrement favorable.",
+        "🟡 Prix légèrement sous EMA200 → neutre à légèrement favorable.",
+        "🟠 Prix légèrement au-dessus EMA200 → valorisation intégrée, prudence.",
+        "🔴 Prix {0:.1f}% au-dessus EMA200 → surévaluation du titre 🚨.",
+    )
+
+    def evaluate_ema200_array(self, close, ema200):
+        close, ema200 = np.asarray(close, dtype=float), np.asarray(ema200, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            discount = (close - ema200) / ema200 * 100
+        codes = np.digitize(discount, self.EMA200_BINS)
+        return self._lookup(codes, self.EMA200_NOTES)
+
     def evaluate_ema200(self, close, ema200, ema50=None):
         discount = (close - ema200) / ema200 * 100
-        if discount < -18:
-            return 10, f"🟢 Prix {abs(discount):.1f}% sous EMA200 → décote exceptionnelle 💎."
-        elif discount < -10:
-            return 9, f"🟢 Prix {abs(discount):.1f}% sous EMA200 → forte sous-évaluation, opportunité sérieuse ✅."
-        elif discount < -5:
-            return 7, f"🟢 Prix {abs(discount):.1f}% sous EMA200 → décote intéressante, zone d'accumulation potentielle."
-        elif discount < -2.5:
-            return 6, f"🟡 Prix légèrement sous EMA200 → neutre à légèrement favorable."
-        elif discount < 0:
-            return 5, f"🟡 Prix légèrement sous EMA200 → neutre à légèrement favorable."
-        elif discount < 2.5:
-            return 4, f"🟡 Prix légèrement sous EMA200 → neutre à légèrement favorable."
-        elif discount < 5:
-            return 3, f"🟠 Prix légèrement au-dessus EMA200 → valorisation intégrée, prudence."
-        else:
-            return 1, f"🔴 Prix {abs(discount):.1f}% au-dessus EMA200 → surévaluation du titre 🚨."
+        notes, code = self.evaluate_ema200_array(close, ema200)
+        return int(notes), self.interpretation(self.EMA200_MESSAGES, code, abs(discount))
 
     # --- ADX ---
+    ADX_BINS = (10, 20, 30, 40)
+    ADX_NOTES = (8, 7, 5, 3, 1)
+    ADX_MESSAGES = (
+        "🟢 ADX < 10 → marché très calme, souvent proche d'un plancher ⏳.",
+        "🟢 ADX 10–20 → tendance faible mais en formation 🌱.",
+        "⚪ ADX 20–30 → tendance moyenne, rien de marqué.",
+        "🟠 ADX 30–40 → tendance forte, possible entrée tardive.",
+        "🔴 ADX > 40 → tendance violente, peu de marge pour un achat.",
+    )
+
+    def evaluate_adx_array(self, adx):
+        codes = np.digitize(adx, self.ADX_BINS)
+        return self._lookup(codes, self.ADX_NOTES)
+
     def evaluate_adx(self, adx):
-        if adx < 10:
-            return 8, "🟢 ADX < 10 → marché très calme, souvent proche d'un plancher ⏳."
-        elif 10 <= adx < 20:
-            return 7, "🟢 ADX 10–20 → tendance faible mais en formation 🌱."
-        elif 20 <= adx < 30:
-            return 5, "⚪ ADX 20–30 → tendance moyenne, rien de marqué."
-        elif 30 <= adx < 40:
-            return 3, "🟠 ADX 30–40 → tendance forte, possible entrée tardive."
-        else:
-            return 1, "🔴 ADX > 40 → tendance violente, peu de marge pour un achat."
+        notes, code = self.evaluate_adx_array(adx)
+        return int(notes), self.ADX_MESSAGES[int(code)]
 
     # --- FIBONACCI ---
     def evaluate_fibonacci(self, price, levels, support, resistance):
@@ -200,30 +303,42 @@ class IndicatorEvaluator:
             return 1, f"🔴 Prix au-dessus de Fib 78.6% → zone de surachat majeur 🚨. Éviter toute entrée, risque de correction >20% à moyen terme 🛑."
 
     # --- INTERPRÉTATION GLOBALE ---
-    def _global_interpretation(df, score):
-        """Interprétation globale affinée du score total, adaptée à la détection de sous-évaluation."""
-        bullish_signals = sum(df["Note (/10)"] >= 7)
-
-        if score >= 90:
-            msg = Fore.GREEN + "💎 Exceptionnel : forte sous-évaluation confirmée 🔥 — opportunité rare à saisir."
-        elif score >= 80:
-            msg = Fore.GREEN + "🟢 Très bon niveau : marché nettement en décote, configuration favorable à l'achat."
-        elif score >= 70:
-            msg = Fore.CYAN + "🔵 Sous-évaluation modérée : tendance de reprise à confirmer par le volume ou le MACD."
-        elif score >= 60:
-            msg = Fore.LIGHTBLUE_EX + "🔷 Neutre-haussier : signaux mitigés, attendre confirmation d'un retournement clair."
-        elif score >= 50:
-            msg = Fore.YELLOW + "🟠 Marché équilibré : peu de marge de sécurité, à surveiller sans se précipiter."
-        elif score >= 40:
-            msg = Fore.MAGENTA + "🟣 Légère surévaluation : prudence, possible consolidation avant reprise."
-        else:
-            msg = Fore.RED + "🔴 Surévaluation marquée : tendance défavorable, aucun signal d'entrée."
+    # (seuil du score, niveau, message) par ordre décroissant ; couleurs dans Renderer
+    GLOBAL_LEVELS = (
+        (90, "exceptionnel", "💎 Exceptionnel : forte sous-évaluation confirmée 🔥 — opportunité rare à saisir."),
+        (80, "tres_bon", "🟢 Très bon niveau : marché nettement en décote, configuration favorable à l'achat."),
+        (70, "sous_evaluation", "🔵 Sous-évaluation modérée : tendance de reprise à confirmer par le volume ou le MACD."),
+        (60, "neutre_haussier", "🔷 Neutre-haussier : signaux mitigés, attendre confirmation d'un retournement clair."),
+        (50, "equilibre", "🟠 Marché équilibré : peu de marge de sécurité, à surveiller sans se précipiter."),
+        (40, "legere_surevaluation", "🟣 Légère surévaluation : prudence, possible consolidation avant reprise."),
+        (float("-inf"), "surevaluation", "🔴 Surévaluation marquée : tendance défavorable, aucun signal d'entrée."),
+    )
+    GLOBAL_SIGNALS = {
+        "convergence": "✅ Plusieurs indicateurs convergent → signal fort de retournement probable.",
+        "faiblesse": "⚠️ Peu ou pas de signaux positifs → risque élevé de poursuite baissière.",
+    }
+
+    def _global_interpretation(notes, score):
+        """
+        Interprétation globale affinée du score total (notes /10 des indicateurs), adaptée à
+        la détection de sous-évaluation.
+
+        Returns:
+            (niveau, signal ou None, message en texte brut)
+        """
+        bullish_signals = sum(note >= 7 for note in notes)
+        level, msg = next(
+            ((level, msg) for threshold, level, msg in IndicatorEvaluator.GLOBAL_LEVELS if score >= threshold),
+            IndicatorEvaluator.GLOBAL_LEVELS[-1][1:]
+        )
 
         # ✅ Renforcement du message si plusieurs indicateurs convergent
+        signal = None
         if bullish_signals >= 3 and score >= 70:
-            msg += Fore.GREEN + "\n✅ Plusieurs indicateurs convergent → signal fort de retournement probable."
-
+            signal = "convergence"
         elif bullish_signals <= 1 and score < 50:
-            msg += Fore.RED + "\n⚠️ Peu ou pas de signaux positifs → risque élevé de poursuite baissière."
+            signal = "faiblesse"
 
-        return msg + Style.RESET_ALL
\ No newline at end of file
+        if signal is not None:
+            msg += "\n" + IndicatorEvaluator.GLOBAL_SIGNALS[signal]
+        return level, signal, msg
\ No newline at end of file
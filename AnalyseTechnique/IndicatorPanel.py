@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from AnalyseTechnique.IndicatorEvaluator import IndicatorEvaluator
+from AnalyseTechnique.IndicatorRegistry import IndicatorRegistry
+
+
+class IndicatorPanel:
+    """
+    Indicateurs techniques de tout l'univers calculés en une fois sur un panel 2-D
+    (séances × tickers) : chaque indicateur est obtenu par quelques appels NumPy
+    colonne par colonne au lieu d'une boucle Python/pandas par ticker.
+
+    Chaque ticker conserve son propre calendrier de cotation (jours fériés différents
+    entre .PA, .MI, .F...) : ses séances valides sont compactées puis alignées sur la
+    dernière ligne du panel. Les historiques plus courts (cotation récente) sont
+    précédés de NaN, gérés colonne par colonne par IndicatorEngine.
+    """
+
+    FIELDS = ("High", "Low", "Close", "Volume")
+
+    def __init__(self, histories, weights=None):
+        """
+        Args:
+            histories: dict {ticker: DataFrame OHLCV}
+            weights: Pondération des indicateurs (seuls ceux de poids non nul sont calculés)
+        """
+        if weights is None:
+            weights = IndicatorEvaluator().weights
+        self.histories = {}
+        self.index = {}
+        for ticker, data in histories.items():
+            if data is None or data.empty:
+                continue
+            close = data["Close"].iloc[:, 0] if isinstance(data["Close"], pd.DataFrame) else data["Close"]
+            data = data.loc[close.notna().to_numpy()]
+            if not data.empty:
+                self.histories[ticker] = data
+                self.index[ticker] = data.index
+
+        self.tickers = list(self.histories)
+        self.columns = {ticker: j for j, ticker in enumerate(self.tickers)}
+        self.length = max((len(idx) for idx in self.index.values()), default=0)
+
+        # Construction des tableaux (séances × tickers), alignés sur la fin
+        inputs = {field: np.full((self.length, len(self.tickers)), np.nan) for field in self.FIELDS}
+        for ticker, data in self.histories.items():
+            j, n = self.columns[ticker], len(data)
+            block = np.column_stack([
+                (data[field].iloc[:, 0] if isinstance(data[field], pd.DataFrame) else data[field]).to_numpy(dtype=np.float64)
+                for field in self.FIELDS
+            ])
+            for k, field in enumerate(self.FIELDS):
+                inputs[field][self.length - n:, j] = block[:, k]
+
+        self.inputs = inputs
+        self._dates = None
+        self._positions = None
+        self.values = IndicatorRegistry.compute(*(inputs[field] for field in self.FIELDS), weights)
+
+    def __contains__(self, ticker):
+        return ticker in self.columns
+
+    def column(self, ticker, name):
+        """Série d'un indicateur (ou d'un champ OHLCV) pour un ticker : vue sur le panel, sans copie."""
+        array = self.values[name] if name in self.values else self.inputs[name]
+        return array[self.length - len(self.index[ticker]):, self.columns[ticker]]
+
+    def latest(self, ticker, name):
+        """Dernière valeur d'un indicateur pour un ticker."""
+        return float(self.values[name][-1, self.columns[ticker]])
+
+    def frame(self, ticker):
+        """Historique du ticker enrichi de ses indicateurs (même format que Utils.compute_indicators)."""
+        data = self.histories[ticker].copy()
+        for name in self.values:
+            data[name] = self.column(ticker, name)
+        return data.dropna()
+
+    def dates(self):
+        """Union des dates de cotation de l'univers (calculée une fois)."""
+        if self._dates is None:
+            if self.index:
+                values = np.unique(np.concatenate([idx.to_numpy() for idx in self.index.values()]))
+            else:
+                values = []
+            self._dates = pd.DatetimeIndex(values)
+        return self._dates
+
+    def scatter(self, array):
+        """
+        Réaligne un tableau du panel (séances × tickers) sur les dates calendaires
+        (dates × tickers), NaN les jours où le ticker ne cote pas.
+        """
+        dates = self.dates()
+        if self._positions is None:
+            self._positions = {ticker: dates.get_indexer(idx) for ticker, idx in self.index.items()}
+        out = np.full((len(dates), len(self.tickers)), np.nan)
+        for ticker, rows in self._positions.items():
+            j = self.columns[ticker]
+            out[rows, j] = array[self.length - len(rows):, j]
+        return out
+
+    def aligned(self, name):
+        """
+        Indicateur réaligné sur l'union des dates de cotation (dates × tickers),
+        NaN les jours où le ticker ne cote pas. Utile pour les comparaisons transversales.
+        """
+        array = self.values[name] if name in self.values else self.inputs[name]
+        return pd.DataFrame(self.scatter(array), index=self.dates(), columns=self.tickers)
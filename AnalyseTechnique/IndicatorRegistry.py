@@ -0,0 +1,203 @@
+import numpy as np
+from AnalyseTechnique.IndicatorEngine import IndicatorEngine
+
+
+class IndicatorNode:
+    """Étape de calcul du graphe : produit `outputs` à partir de `inputs` (champs OHLCV ou autres sorties)."""
+
+    def __init__(self, name, fn, inputs, outputs):
+        self.name = name
+        self.fn = fn
+        self.inputs = inputs
+        self.outputs = outputs
+
+
+class IndicatorSpec:
+    """
+    Déclaration d'un indicateur évalué par l'analyse technique.
+
+    Attributes:
+        name: Clé de pondération (IndicatorEvaluator.weights)
+        label: Libellé de la ligne du tableau
+        columns: Colonnes calculées nécessaires (sorties du graphe)
+        lookback: Entrées de LookbackPlanner déterminant l'historique nécessaire
+        evaluator: Méthode d'IndicatorEvaluator
+        args: fonction (get, close) -> arguments de l'évaluateur
+        display: fonction (args, get) -> valeur affichée
+        array_args: fonction (colonnes, close) -> arguments de la version vectorisée
+    """
+
+    def __init__(self, name, label, columns, lookback, evaluator, args, display, array_args):
+        self.name = name
+        self.label = label
+        self.columns = columns
+        self.lookback = lookback
+        self.evaluator = evaluator
+        self.args = args
+        self.display = display
+        self.array_args = array_args
+
+    def evaluate(self, evaluator, get, close):
+        """Retourne (valeur affichée, note, interprétation)."""
+        args = self.args(get, close)
+        return (self.display(args, get), *getattr(evaluator, self.evaluator)(*args))
+
+    def evaluate_array(self, evaluator, values, close):
+        """
+        Notes et codes d'interprétation sur des tableaux entiers (cf. IndicatorEvaluator.*_array).
+        Les notes valent NaN là où une entrée manque (période de chauffe).
+        """
+        return self.notes_from_args(evaluator, self.array_args(values, close))
+
+    def notes_from_args(self, evaluator, args):
+        """Comme `evaluate_array`, à partir des arguments déjà préparés."""
+        notes, codes = getattr(evaluator, self.evaluator + "_array")(*args)
+        missing = np.zeros(np.shape(notes), dtype=bool)
+        for arg in args:
+            missing |= np.isnan(arg)
+        return np.where(missing, np.nan, notes), codes
+
+
+class IndicatorRegistry:
+    """
+    Registre des indicateurs techniques : chaque indicateur déclare ses colonnes, son
+    historique nécessaire et son évaluateur ; les colonnes sont produites par un graphe
+    de calcul dont les intermédiaires (clôture précédente, variation, true range) sont
+    partagés.
+
+    Seuls les indicateurs de poids non nul sont calculés. Ajouter un indicateur revient
+    à déclarer ses nœuds et sa spécification ici, sans modifier TechnicalAnalysis.run.
+    """
+
+    FIELDS = ("High", "Low", "Close", "Volume")
+
+    NODES = [
+        IndicatorNode("prev_close", lambda close: {"prev_close": IndicatorEngine.shift(close)},
+                      ("Close",), ("prev_close",)),
+        IndicatorNode("diff", lambda close, prev: {"diff": IndicatorEngine.close_diff(close, prev)},
+                      ("Close", "prev_close"), ("diff",)),
+        IndicatorNode("true_range", lambda high, low, prev: {"true_range": IndicatorEngine.true_range(high, low, prev)},
+                      ("High", "Low", "prev_close"), ("true_range",)),
+        IndicatorNode("rsi", IndicatorEngine.rsi, ("Close", "diff"), ("RSI",)),
+        IndicatorNode("stochastic", IndicatorEngine.stochastic, ("High", "Low", "Close"), ("STOCH_K", "STOCH_D")),
+        IndicatorNode("macd", IndicatorEngine.macd, ("Close",), ("MACD", "Signal")),
+        IndicatorNode("obv", IndicatorEngine.obv, ("Close", "diff", "Volume"), ("OBV",)),
+        IndicatorNode("bollinger", IndicatorEngine.bollinger, ("Close",), ("BB_H", "BB_L", "BB_M")),
+        IndicatorNode("ema200", IndicatorEngine.ema200, ("Close",), ("EMA200",)),
+        IndicatorNode("adx", IndicatorEngine.adx, ("High", "Low", "true_range"), ("ADX",)),
+    ]
+
+    # Ordre = ordre des lignes du tableau d'analyse technique
+    INDICATORS = [
+        IndicatorSpec(
+            "RSI", "RSI (14)", ("RSI",), ("RSI",), "evaluate_rsi",
+            lambda get, close: (get("RSI", 50.0),),
+            lambda a, get: a[0],
+            lambda v, close: (v["RSI"],)),
+        IndicatorSpec(
+            "Stochastique", "Stochastique K/D", ("STOCH_K", "STOCH_D"), ("STOCH_K", "STOCH_D"), "evaluate_stoch",
+            lambda get, close: (get("STOCH_K", 50.0), get("STOCH_D", 50.0)),
+            lambda a, get: f"{a[0]:.2f}/{a[1]:.2f}",
+            lambda v, close: (v["STOCH_K"], v["STOCH_D"])),
+        IndicatorSpec(
+            "Bollinger", "Bandes de Bollinger", ("BB_L", "BB_M", "BB_H"), ("BB",), "evaluate_bollinger",
+            lambda get, close: (close, get("BB_L", close * 0.98), get("BB_M", close), get("BB_H", close * 1.02)),
+            lambda a, get: a[0],
+            lambda v, close: (close, v["BB_L"], v["BB_M"], v["BB_H"])),
+        IndicatorSpec(
+            "MACD", "MACD", ("MACD", "Signal"), ("Signal",), "evaluate_macd",
+            lambda get, close: (get("MACD", 0.0), get("Signal", 0.0)),
+            lambda a, get: a[0],
+            lambda v, close: (v["MACD"], v["Signal"])),
+        IndicatorSpec(
+            "OBV", "OBV", ("OBV",), ("OBV",), "evaluate_obv",
+            lambda get, close: IndicatorRegistry.obv_means(get("OBV_window", []), get("OBV", 0.0)),
+            lambda a, get: get("OBV", 0.0),
+            lambda v, close: IndicatorRegistry.obv_means_array(v["OBV"])),
+        IndicatorSpec(
+            "EMA200", "Décote vs EMA200", ("EMA200",), ("EMA200",), "evaluate_ema200",
+            lambda get, close: (close, get("EMA200", close)),
+            lambda a, get: f"{(a[0] - a[1]) / a[1] * 100:.2f}%",
+            lambda v, close: (close, v["EMA200"])),
+        IndicatorSpec(
+            "ADX", "ADX (14)", ("ADX",), ("ADX",), "evaluate_adx",
+            lambda get, close: (get("ADX", 25.0),),
+            lambda a, get: a[0],
+            lambda v, close: (v["ADX"],)),
+    ]
+
+    @staticmethod
+    def obv_means(window, obv):
+        """Moyennes OBV des 5 dernières barres et des 15 précédentes."""
+        recent = float(np.mean(window[-5:])) if len(window) >= 5 else obv
+        past = float(np.mean(window[-20:-5])) if len(window) >= 20 else obv
+        return recent, past
+
+    @staticmethod
+    def obv_means_array(obv):
+        """Version vectorisée de `obv_means` : moyennes glissantes sur 5 barres et sur les 15 précédentes."""
+        recent = IndicatorEngine.rolling_mean(obv, 5)
+        past = IndicatorEngine.shift(IndicatorEngine.rolling_mean(obv, 15), 5)
+        return recent, past
+
+    @staticmethod
+    def active(weights=None):
+        """Indicateurs à évaluer : tous, ou ceux de poids non nul."""
+        if weights is None:
+            return list(IndicatorRegistry.INDICATORS)
+        return [spec for spec in IndicatorRegistry.INDICATORS if weights.get(spec.name, 0)]
+
+    @staticmethod
+    def columns(weights=None):
+        """Colonnes calculées nécessaires aux indicateurs actifs (dans l'ordre du graphe)."""
+        needed = {c for spec in IndicatorRegistry.active(weights) for c in spec.columns}
+        return [c for node in IndicatorRegistry.NODES for c in node.outputs if c in needed]
+
+    @staticmethod
+    def lookbacks(weights=None):
+        """Entrées LookbackPlanner des indicateurs actifs (+ Fibonacci, calculé sur l'historique brut)."""
+        names = [name for spec in IndicatorRegistry.active(weights) for name in spec.lookback]
+        if weights is None or weights.get("Fibonacci", 0):
+            names.append("Fibonacci")
+        return names
+
+    @staticmethod
+    def plan(columns):
+        """Nœuds à exécuter, dans l'ordre, pour produire `columns` (dépendances incluses)."""
+        producer = {out: node for node in IndicatorRegistry.NODES for out in node.outputs}
+        ordered, seen = [], set()
+
+        def visit(name):
+            node = producer.get(name)
+            if node is None or node.name in seen:
+                return
+            seen.add(node.name)
+            for dependency in node.inputs:
+                visit(dependency)
+            ordered.append(node)
+
+        for column in columns:
+            if column not in producer:
+                raise KeyError(f"Aucun calcul ne produit la colonne '{column}'")
+            visit(column)
+        return ordered
+
+    @staticmethod
+    def compute(high, low, close, volume, weights=None):
+        """
+        Calcule les colonnes des indicateurs actifs (toutes si `weights` est None).
+
+        Returns:
+            dict: {colonne: tableau}
+        """
+        values = dict(zip(
+            IndicatorRegistry.FIELDS,
+            (np.asarray(a, dtype=np.float64) for a in (high, low, close, volume))
+        ))
+        columns = IndicatorRegistry.columns(weights)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for node in IndicatorRegistry.plan(columns):
+                values.update(node.fn(*(values[name] for name in node.inputs)))
+
+        return {column: values[column] for column in columns}
@@ -0,0 +1,333 @@
+import json
+import math
+import os
+from collections import deque
+import pandas as pd
+
+NAN = float("nan")
+
+
+class _Ewm:
+    """Moyenne exponentielle récursive incrémentale (mêmes conventions que IndicatorEngine.ewm)."""
+
+    def __init__(self, alpha, min_periods=1, seed_window=None, value=None, count=0, seed_sum=0.0):
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.seed_window = seed_window
+        self.value = value
+        self.count = count
+        self.seed_sum = seed_sum
+
+    def update(self, x):
+        if x is None or math.isnan(x):
+            return self.current()
+        self.count += 1
+        if self.seed_window and self.count <= self.seed_window:
+            # Amorçage de Wilder : moyenne simple des `seed_window` premières valeurs
+            self.seed_sum += x
+            if self.count == self.seed_window:
+                self.value = self.seed_sum / self.seed_window
+        elif self.value is None:
+            self.value = x
+        else:
+            self.value = (1 - self.alpha) * self.value + self.alpha * x
+        return self.current()
+
+    def current(self):
+        if self.value is None or self.count < self.min_periods:
+            return NAN
+        return self.value
+
+    def to_dict(self):
+        return {"value": self.value, "count": self.count, "seed_sum": self.seed_sum}
+
+    def load(self, state):
+        self.value, self.count, self.seed_sum = state["value"], state["count"], state["seed_sum"]
+
+
+class IndicatorState:
+    """
+    État récursif des indicateurs techniques d'un ticker, mis à jour barre par barre en O(1).
+
+    Conserve les moyennes exponentielles (MACD, EMA200), les moyennes de Wilder (RSI, ADX),
+    l'OBV cumulé et les fenêtres glissantes (Bollinger, Stochastique). L'état est stocké
+    en JSON à côté du cache des cours et reconstruit automatiquement si l'historique a été
+    révisé (dernière clôture connue différente).
+
+    L'OBV est cumulé depuis la création de l'état, alors que le recalcul complet le
+    cumule depuis le début de l'historique analysé : `sync` le ramène à cette origine
+    (`obv_offset`), pour que la note OBV ne dépende pas de l'âge de l'état.
+    """
+
+    WINDOWS = {"stoch": 14, "stoch_smooth": 3, "bb": 20, "obv": 20}
+    COLUMNS = ("RSI", "STOCH_K", "STOCH_D", "MACD", "Signal", "OBV",
+               "BB_H", "BB_L", "BB_M", "EMA200", "ADX", "Close")
+
+    def __init__(self):
+        self.last_date = None
+        self.last_close = None
+        self.prev = None  # (high, low, close) de la barre précédente
+        self.obv = 0.0
+        self.obv_marks = deque()  # (date, OBV - volume de la barre) : décalage si l'origine est cette barre
+        self.obv_offset = 0.0  # OBV à l'origine de l'historique analysé (fixé par `sync`)
+        self.ewms = {
+            "rsi_up": _Ewm(1 / 14, min_periods=14),
+            "rsi_down": _Ewm(1 / 14, min_periods=14),
+            "ema12": _Ewm(2 / 13, min_periods=12),
+            "ema26": _Ewm(2 / 27, min_periods=26),
+            "signal": _Ewm(2 / 10, min_periods=9),
+            "ema200": _Ewm(2 / 201, min_periods=200),
+            "trs": _Ewm(1 / 14, seed_window=14),
+            "dip": _Ewm(1 / 14, seed_window=14),
+            "din": _Ewm(1 / 14, seed_window=14),
+            "adx": _Ewm(1 / 14, seed_window=14),
+        }
+        self.highs = deque(maxlen=self.WINDOWS["stoch"])
+        self.lows = deque(maxlen=self.WINDOWS["stoch"])
+        self.stoch_k = deque(maxlen=self.WINDOWS["stoch_smooth"])
+        self.closes = deque(maxlen=self.WINDOWS["bb"])
+        self.obv_window = deque(maxlen=self.WINDOWS["obv"])
+        self.values = {}
+
+    # ------------------------------------------------------------------
+    # Mise à jour
+    # ------------------------------------------------------------------
+    def update(self, date, high, low, close, volume):
+        """
+        Intègre une nouvelle barre et retourne les valeurs des indicateurs. Une barre sans
+        clôture est ignorée (comme IndicatorPanel, qui ne garde que les séances cotées) ;
+        un volume manquant compte pour 0 dans l'OBV (comme IndicatorEngine.obv).
+        """
+        if math.isnan(close):
+            return self.values
+        if math.isnan(volume):
+            volume = 0.0
+        e = self.ewms
+        v = {}
+
+        if self.prev is None:
+            diff = NAN
+            up, down = 0.0, 0.0
+            true_range = plus_dm = minus_dm = NAN
+        else:
+            prev_high, prev_low, prev_close = self.prev
+            diff = close - prev_close
+            up, down = max(diff, 0.0), max(-diff, 0.0)
+            true_range = max(high, prev_close) - min(low, prev_close)
+            up_move, down_move = high - prev_high, prev_low - low
+            plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+            minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+
+        # --- RSI ---
+        avg_up, avg_down = e["rsi_up"].update(up), e["rsi_down"].update(down)
+        if math.isnan(avg_down):
+            v["RSI"] = NAN
+        else:
+            v["RSI"] = 100.0 if avg_down == 0 else 100 - 100 / (1 + avg_up / avg_down)
+
+        # --- Stochastique ---
+        self.highs.append(high)
+        self.lows.append(low)
+        k = NAN
+        if len(self.highs) == self.WINDOWS["stoch"]:
+            lowest, highest = min(self.lows), max(self.highs)
+            k = 100 * (close - lowest) / (highest - lowest) if highest != lowest else NAN
+        self.stoch_k.append(k)
+        v["STOCH_K"] = k
+        v["STOCH_D"] = (
+            sum(self.stoch_k) / len(self.stoch_k)
+            if len(self.stoch_k) == self.WINDOWS["stoch_smooth"] else NAN
+        )
+
+        # --- MACD ---
+        macd = e["ema12"].update(close) - e["ema26"].update(close)
+        v["MACD"] = macd
+        v["Signal"] = e["signal"].update(macd)
+
+        # --- OBV ---
+        self.obv += -volume if diff < 0 else volume
+        self.obv_window.append(self.obv)
+        self.obv_marks.append((pd.Timestamp(date).strftime("%Y-%m-%d"), self.obv - volume))
+        v["OBV"] = self.obv
+
+        # --- Bollinger ---
+        self.closes.append(close)
+        if len(self.closes) == self.WINDOWS["bb"]:
+            mean = sum(self.closes) / len(self.closes)
+            std = math.sqrt(sum((c - mean) ** 2 for c in self.closes) / len(self.closes))
+            v["BB_M"], v["BB_H"], v["BB_L"] = mean, mean + 2 * std, mean - 2 * std
+        else:
+            v["BB_M"] = v["BB_H"] = v["BB_L"] = NAN
+
+        # --- EMA200 ---
+        v["EMA200"] = e["ema200"].update(close)
+
+        # --- ADX ---
+        trs, dip, din = e["trs"].update(true_range), e["dip"].update(plus_dm), e["din"].update(minus_dm)
+        dx = NAN
+        if not math.isnan(trs):
+            di_plus = 100 * dip / trs if trs != 0 else 0.0
+            di_minus = 100 * din / trs if trs != 0 else 0.0
+            di_sum = di_plus + di_minus
+            dx = 100 * abs(di_plus - di_minus) / di_sum if di_sum != 0 else 0.0
+        v["ADX"] = e["adx"].update(dx)
+
+        self.prev = (high, low, close)
+        self.last_date = pd.Timestamp(date).strftime("%Y-%m-%d")
+        self.last_close = close
+        v["Close"] = close
+        self.values = v
+        return v
+
+    def snapshot(self):
+        """
+        Dernières valeurs des indicateurs (+ fenêtre OBV utilisée par l'analyse technique),
+        l'OBV étant compté depuis l'origine de l'historique analysé (cf. `rebase`).
+        """
+        values = dict(self.values, OBV_window=[obv - self.obv_offset for obv in self.obv_window])
+        if "OBV" in values:
+            values["OBV"] -= self.obv_offset
+        return values
+
+    def rebase(self, start):
+        """
+        Place l'origine de l'OBV sur la barre `start` (première séance de l'historique
+        analysé) : comme dans le recalcul complet, l'OBV y vaut le volume de cette barre.
+        Les repères antérieurs ne servent plus et sont oubliés.
+
+        Returns:
+            bool: False si l'état ne couvre pas `start` (état créé plus tard)
+        """
+        start = pd.Timestamp(start).strftime("%Y-%m-%d")
+        while self.obv_marks and self.obv_marks[0][0] < start:
+            self.obv_marks.popleft()
+        if not self.obv_marks or self.obv_marks[0][0] != start:
+            return False
+        self.obv_offset = self.obv_marks[0][1]
+        return True
+
+    # ------------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------------
+    def to_dict(self):
+        return {
+            "last_date": self.last_date,
+            "last_close": self.last_close,
+            "prev": self.prev,
+            "obv": self.obv,
+            "obv_marks": [list(mark) for mark in self.obv_marks],
+            "obv_offset": self.obv_offset,
+            "ewms": {name: ewm.to_dict() for name, ewm in self.ewms.items()},
+            "highs": list(self.highs),
+            "lows": list(self.lows),
+            "stoch_k": list(self.stoch_k),
+            "closes": list(self.closes),
+            "obv_window": list(self.obv_window),
+            "values": self.values,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        self = cls()
+        self.last_date = state["last_date"]
+        self.last_close = state["last_close"]
+        self.prev = tuple(state["prev"]) if state["prev"] else None
+        self.obv = state["obv"]
+        self.obv_marks.extend(tuple(mark) for mark in state.get("obv_marks", []))
+        self.obv_offset = state.get("obv_offset", 0.0)
+        for name, ewm_state in state["ewms"].items():
+            self.ewms[name].load(ewm_state)
+        self.highs.extend(state["highs"])
+        self.lows.extend(state["lows"])
+        self.stoch_k.extend(state["stoch_k"])
+        self.closes.extend(state["closes"])
+        self.obv_window.extend(state["obv_window"])
+        self.values = state["values"]
+        return self
+
+    def copy(self):
+        return IndicatorState.from_dict(json.loads(json.dumps(self.to_dict())))
+
+    # ------------------------------------------------------------------
+    # Persistance à côté du cache des cours
+    # ------------------------------------------------------------------
+    @staticmethod
+    def path(root, ticker):
+        return os.path.join(root, f"{ticker}.state.json")
+
+    @staticmethod
+    def load(root, ticker, warn=print):
+        path = IndicatorState.path(root, ticker)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return IndicatorState.from_dict(json.load(f))
+        except Exception as e:
+            warn(f"⚠️ État des indicateurs illisible pour {ticker} ({e}), reconstruction.")
+            return None
+
+    def save(self, root, ticker):
+        with open(IndicatorState.path(root, ticker), "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @staticmethod
+    def sync(root, ticker, history, tolerance=1e-4, warn=print):
+        """
+        Met l'état persistant du ticker à jour avec `history` et retourne l'état courant.
+
+        Seules les barres postérieures à la dernière barre connue sont intégrées. Si cette
+        barre a disparu ou a changé (historique révisé), l'état est reconstruit depuis le début.
+        La barre du jour (potentiellement incomplète) est appliquée à une copie non persistée.
+        L'OBV est ramené à la première séance de `history` (cf. `rebase`) ; un état créé
+        après cette séance est lui aussi reconstruit.
+        `warn` reçoit les avertissements (état illisible).
+        """
+        high, low, close, volume = (
+            history[col].iloc[:, 0] if isinstance(history[col], pd.DataFrame) else history[col]
+            for col in ("High", "Low", "Close", "Volume")
+        )
+
+        quoted = close.index[close.notna().to_numpy()]
+        origin = quoted[0].strftime("%Y-%m-%d") if len(quoted) else None
+
+        state = IndicatorState.load(root, ticker, warn)
+        if state is not None and (not state.obv_marks or (origin and state.obv_marks[0][0] > origin)):
+            state = None
+        start = 0
+        if state is not None and state.last_date is not None:
+            last = pd.Timestamp(state.last_date)
+            if last in history.index and abs(float(close.loc[last]) - state.last_close) <= tolerance * abs(state.last_close):
+                start = history.index.get_loc(last) + 1
+            else:
+                state = None
+        if state is None:
+            state = IndicatorState()
+
+        today = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+        settled_end = int((history.index < today).sum())
+
+        def apply(target, begin, end):
+            for i in range(begin, end):
+                target.update(history.index[i], float(high.iloc[i]), float(low.iloc[i]),
+                              float(close.iloc[i]), float(volume.iloc[i]))
+
+        offset = state.obv_offset
+        if settled_end > start:
+            apply(state, start, settled_end)
+        if origin and settled_end > 0 and not state.rebase(origin):
+            # Origine absente des repères (séance révisée) : reconstruction complète
+            state = IndicatorState()
+            start = 0
+            apply(state, 0, settled_end)
+            state.rebase(origin)
+        if settled_end > start or state.obv_offset != offset:
+            state.save(root, ticker)
+
+        if len(history) > max(start, settled_end):
+            current = state.copy()
+            apply(current, max(start, settled_end), len(history))
+            if origin:
+                current.rebase(origin)
+            return current
+        return state
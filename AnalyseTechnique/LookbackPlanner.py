@@ -0,0 +1,69 @@
+import math
+
+
+class LookbackPlanner:
+    """
+    Calcule la profondeur d'historique nécessaire aux indicateurs techniques.
+
+    Chaque indicateur déclare :
+    - `warmup` : nombre de barres avant sa première valeur publiée (cf. IndicatorEngine) ;
+    - `lag` / `seed` : barres avant le début de sa récurrence et taille de la fenêtre
+      d'amorçage (lissage de Wilder) ;
+    - `alphas` : facteurs de lissage des moyennes exponentielles enchaînées.
+
+    Une moyenne exponentielle dépend de sa valeur initiale avec un poids (1 - alpha)^k
+    après k barres : on télécharge assez de barres pour que ce poids résiduel passe
+    sous `tolerance` sur toutes les lignes analysées.
+    """
+
+    INDICATORS = {
+        "RSI": {"warmup": 15, "lag": 0, "seed": 1, "alphas": (1 / 14,)},
+        "STOCH_K": {"warmup": 14},
+        "STOCH_D": {"warmup": 16},
+        "MACD": {"warmup": 26, "lag": 0, "seed": 1, "alphas": (2 / 27,)},
+        "Signal": {"warmup": 34, "lag": 0, "seed": 1, "alphas": (2 / 27, 2 / 10)},
+        "OBV": {"warmup": 1},
+        "BB": {"warmup": 20},
+        "EMA200": {"warmup": 200, "lag": 0, "seed": 1, "alphas": (2 / 201,)},
+        "ADX": {"warmup": 28, "lag": 1, "seed": 28, "alphas": (1 / 14, 1 / 14)},
+        "Fibonacci": {"warmup": 50},  # Fenêtre de calcul des niveaux (TechnicalAnalysis)
+    }
+
+    TOLERANCE = 0.01  # Poids résiduel maximal de la valeur d'amorçage
+    SESSIONS_PER_YEAR = 252
+    CALENDAR_SLACK_DAYS = 10  # Marge pour les jours fériés propres à chaque place
+
+    @staticmethod
+    def convergence(alpha, tolerance=TOLERANCE):
+        """Nombre de barres pour que le poids de l'amorçage (1 - alpha)^k passe sous `tolerance`."""
+        return math.ceil(math.log(tolerance) / math.log(1 - alpha))
+
+    @staticmethod
+    def bars_for(name, tolerance=TOLERANCE):
+        """Nombre de barres nécessaires pour une valeur publiée et convergée de l'indicateur."""
+        spec = LookbackPlanner.INDICATORS[name]
+        alphas = spec.get("alphas", ())
+        if not alphas:
+            return spec["warmup"]
+        converged = spec["lag"] + spec["seed"] + sum(LookbackPlanner.convergence(a, tolerance) for a in alphas)
+        return max(spec["warmup"], converged)
+
+    @staticmethod
+    def required_bars(indicators=None, tolerance=TOLERANCE, rows=1):
+        """
+        Nombre de barres à télécharger.
+
+        Args:
+            indicators: Indicateurs utilisés (tous par défaut)
+            tolerance: Poids résiduel maximal de l'amorçage des moyennes exponentielles
+            rows: Nombre de dernières lignes sur lesquelles les indicateurs doivent être convergés
+        """
+        names = indicators or LookbackPlanner.INDICATORS
+        return max(LookbackPlanner.bars_for(name, tolerance) for name in names) + rows - 1
+
+    @staticmethod
+    def period(indicators=None, tolerance=TOLERANCE, rows=1):
+        """Profondeur d'historique exprimée en jours calendaires (ex: '689d')."""
+        bars = LookbackPlanner.required_bars(indicators, tolerance, rows)
+        days = math.ceil(bars * 365.25 / LookbackPlanner.SESSIONS_PER_YEAR) + LookbackPlanner.CALENDAR_SLACK_DAYS
+        return f"{days}d"
@@ -0,0 +1,245 @@
+import json
+import math
+import os
+import pandas as pd
+
+NAN = float("nan")
+
+
+class SwingPivots:
+    """
+    Détection des points pivots (ZigZag) d'un ticker, barre par barre en O(1).
+
+    Un pivot haut (resp. bas) est confirmé quand le cours repart de l'extrême courant
+    d'au moins `threshold` : un pourcentage de l'extrême (mode "percent") ou un
+    multiple de l'ATR de Wilder (mode "atr", pourcentage utilisé pendant la chauffe
+    de l'ATR). Le dernier swing relie le dernier pivot confirmé à l'extrême atteint
+    depuis : c'est l'ancrage des retracements de Fibonacci (cf.
+    TechnicalAnalysis.calculate_fibonacci_levels).
+
+    Seuls les `max_pivots` derniers pivots sont conservés. L'état est stocké en JSON à
+    côté du cache des cours, comme IndicatorState, et reconstruit si l'historique a été
+    révisé.
+    """
+
+    MODES = ("percent", "atr")
+    ATR_PERIOD = 14
+
+    def __init__(self, mode="percent", threshold=0.08, atr_multiple=3.0, max_pivots=32):
+        if mode not in self.MODES:
+            raise ValueError(f"Mode de pivot inconnu : '{mode}'")
+        self.mode = mode
+        self.threshold = threshold  # Retournement minimal en fraction du prix (mode percent)
+        self.atr_multiple = atr_multiple  # Retournement minimal en multiples d'ATR (mode atr)
+        self.max_pivots = max_pivots
+
+        self.pivots = []  # [date, prix, "H" / "L"], du plus ancien au plus récent
+        self.direction = 0  # 1 : recherche d'un sommet, -1 : d'un creux, 0 : pas encore de pivot
+        self.extreme = None  # [date, prix] de l'extrême de la jambe en cours
+        self.start_high = None  # Extrêmes depuis le début, tant qu'aucun pivot n'est confirmé
+        self.start_low = None
+        self.atr = NAN
+        self.tr_sum = 0.0
+        self.bars = 0
+        self.prev_close = None
+        self.last_date = None
+        self.last_close = None
+
+    # ------------------------------------------------------------------
+    # Mise à jour
+    # ------------------------------------------------------------------
+    def _reversal(self, price):
+        """Amplitude de retournement requise depuis l'extrême `price`."""
+        if self.mode == "atr" and not math.isnan(self.atr):
+            return self.atr_multiple * self.atr
+        return self.threshold * abs(price)
+
+    def _confirm(self, date, price, kind):
+        self.pivots.append([date, price, kind])
+        if len(self.pivots) > self.max_pivots:
+            del self.pivots[0]
+
+    def update(self, date, high, low, close):
+        """Intègre une nouvelle barre ; retourne le pivot confirmé par cette barre, ou None."""
+        if not isinstance(date, str):
+            date = pd.Timestamp(date).strftime("%Y-%m-%d")
+
+        # --- ATR de Wilder (amorçage par moyenne simple) ---
+        true_range = high - low if self.prev_close is None else max(high, self.prev_close) - min(low, self.prev_close)
+        self.bars += 1
+        if self.bars <= self.ATR_PERIOD:
+            self.tr_sum += true_range
+            if self.bars == self.ATR_PERIOD:
+                self.atr = self.tr_sum / self.ATR_PERIOD
+        else:
+            self.atr += (true_range - self.atr) / self.ATR_PERIOD
+
+        confirmed = None
+        if self.direction == 0:
+            if self.start_high is None or high > self.start_high[1]:
+                self.start_high = [date, high]
+            if self.start_low is None or low < self.start_low[1]:
+                self.start_low = [date, low]
+            if self.start_high[1] - low >= self._reversal(self.start_high[1]) and self.start_high[0] != date:
+                confirmed = self.start_high + ["H"]
+                self.direction, self.extreme = -1, [date, low]
+            elif high - self.start_low[1] >= self._reversal(self.start_low[1]) and self.start_low[0] != date:
+                confirmed = self.start_low + ["L"]
+                self.direction, self.extreme = 1, [date, high]
+        elif self.direction == 1:
+            if high > self.extreme[1]:
+                self.extreme = [date, high]
+            elif self.extreme[1] - low >= self._reversal(self.extreme[1]):
+                confirmed = self.extreme + ["H"]
+                self.direction, self.extreme = -1, [date, low]
+        else:
+            if low < self.extreme[1]:
+                self.extreme = [date, low]
+            elif high - self.extreme[1] >= self._reversal(self.extreme[1]):
+                confirmed = self.extreme + ["L"]
+                self.direction, self.extreme = 1, [date, high]
+
+        if confirmed is not None:
+            self._confirm(*confirmed)
+            self.start_high = self.start_low = None
+
+        self.prev_close = close
+        self.last_date = date
+        self.last_close = close
+        return confirmed
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def last_swing(self):
+        """
+        Dernier swing : du dernier pivot confirmé à l'extrême atteint depuis.
+
+        Returns:
+            dict: high, low, trend ('haussier' / 'baissier'), start, end ; None sans pivot
+        """
+        if not self.pivots:
+            return None
+        date, price, kind = self.pivots[-1]
+        end_date, end_price = self.extreme
+        if kind == "L":
+            return {"high": end_price, "low": price, "trend": "haussier", "start": date, "end": end_date}
+        return {"high": price, "low": end_price, "trend": "baissier", "start": date, "end": end_date}
+
+    # ------------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------------
+    def to_dict(self):
+        return {
+            "params": {"mode": self.mode, "threshold": self.threshold,
+                       "atr_multiple": self.atr_multiple, "max_pivots": self.max_pivots},
+            "pivots": self.pivots,
+            "direction": self.direction,
+            "extreme": self.extreme,
+            "start_high": self.start_high,
+            "start_low": self.start_low,
+            "atr": None if math.isnan(self.atr) else self.atr,
+            "tr_sum": self.tr_sum,
+            "bars": self.bars,
+            "prev_close": self.prev_close,
+            "last_date": self.last_date,
+            "last_close": self.last_close,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        self = cls(**state["params"])
+        self.pivots = [list(p) for p in state["pivots"]]
+        self.direction = state["direction"]
+        self.extreme = state["extreme"]
+        self.start_high = state["start_high"]
+        self.start_low = state["start_low"]
+        self.atr = NAN if state["atr"] is None else state["atr"]
+        self.tr_sum = state["tr_sum"]
+        self.bars = state["bars"]
+        self.prev_close = state["prev_close"]
+        self.last_date = state["last_date"]
+        self.last_close = state["last_close"]
+        return self
+
+    def copy(self):
+        return SwingPivots.from_dict(json.loads(json.dumps(self.to_dict())))
+
+    # ------------------------------------------------------------------
+    # Construction et persistance à côté du cache des cours
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _columns(history):
+        return (
+            history[col].iloc[:, 0] if isinstance(history[col], pd.DataFrame) else history[col]
+            for col in ("High", "Low", "Close")
+        )
+
+    def apply(self, history, begin=0, end=None):
+        """Intègre les barres [begin, end) de `history`."""
+        end = len(history) if end is None else end
+        high, low, close = (s.iloc[begin:end].to_numpy(dtype=float).tolist() for s in self._columns(history))
+        dates = history.index[begin:end].strftime("%Y-%m-%d")
+        for i, date in enumerate(dates):
+            if not math.isnan(close[i]):
+                self.update(date, high[i], low[i], close[i])
+        return self
+
+    @classmethod
+    def from_history(cls, history, **params):
+        """Pivots de tout l'historique, sans persistance."""
+        return cls(**params).apply(history)
+
+    @staticmethod
+    def path(root, ticker):
+        return os.path.join(root, f"{ticker}.pivots.json")
+
+    @staticmethod
+    def load(root, ticker, warn=print):
+        path = SwingPivots.path(root, ticker)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return SwingPivots.from_dict(json.load(f))
+        except Exception as e:
+            warn(f"⚠️ Pivots illisibles pour {ticker} ({e}), reconstruction.")
+            return None
+
+    def save(self, root, ticker):
+        with open(SwingPivots.path(root, ticker), "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @staticmethod
+    def sync(root, ticker, history, tolerance=1e-4, warn=print, **params):
+        """
+        Met les pivots persistants du ticker à jour avec `history` et retourne l'état courant
+        (mêmes règles que IndicatorState.sync : barres nouvelles seulement, reconstruction si
+        l'historique a été révisé ou si les paramètres ont changé, barre du jour non persistée).
+        `warn` reçoit les avertissements (pivots illisibles).
+        """
+        _, _, close = SwingPivots._columns(history)
+
+        state = SwingPivots.load(root, ticker, warn)
+        start = 0
+        if state is not None and state.to_dict()["params"] != SwingPivots(**params).to_dict()["params"]:
+            state = None
+        if state is not None and state.last_date is not None:
+            last = pd.Timestamp(state.last_date)
+            if last in history.index and abs(float(close.loc[last]) - state.last_close) <= tolerance * abs(state.last_close):
+                start = history.index.get_loc(last) + 1
+            else:
+                state = None
+        if state is None:
+            state = SwingPivots(**params)
+
+        today = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+        settled_end = int((history.index < today).sum())
+
+        if settled_end > start:
+            state.apply(history, start, settled_end)
+            state.save(root, ticker)
+
+        if len(history) > max(start, settled_end):
+            return state.copy().apply(history, max(start, settled_end))
+        return state
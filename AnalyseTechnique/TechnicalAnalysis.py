@@ -1,18 +1,31 @@
 import pandas as pd
 import numpy as np
 from AnalyseTechnique.IndicatorEvaluator import IndicatorEvaluator
-from AnalyseTechnique.Utils import Utils
+from AnalyseTechnique.FibonacciLevels import FibonacciLevels
+from AnalyseTechnique.IndicatorRegistry import IndicatorRegistry
+from AnalyseTechnique.SwingPivots import SwingPivots
+from Donnees.TickerContext import TickerContext
+from AnalysisResults import FibonacciResult, IndicatorRow, TechnicalResult
 import os
 
 
 class TechnicalAnalysis:
     """Analyse technique des points d'entrée avec évaluation pondérée."""
 
-    def __init__(self, ticker_symbol):
+    # Ancrage des retracements de Fibonacci : "range" (plus haut / plus bas de la période)
+    # ou "swing" (dernier swing ZigZag, cf. SwingPivots, paramétré par SWING_PARAMS)
+    FIB_ANCHOR = "range"
+    SWING_PARAMS = {}
+
+    def __init__(self, ticker_symbol, context=None):
         self.ticker_symbol = ticker_symbol
+        self.context = context if context is not None else TickerContext(ticker_symbol)
         self.evaluator = IndicatorEvaluator()
+        # Avertissements des calculs (valeurs par défaut, erreurs rattrapées), partagés avec
+        # le contexte du ticker et affichés avec le rapport (Renderer)
+        self.warnings = self.context.warnings
 
-    def calculate_fibonacci_levels(self, data, period=50):
+    def calculate_fibonacci_levels(self, data, period=50, anchor=None):
         """
         Calcule les niveaux de Fibonacci basés sur le plus haut et le plus bas de la période.
         Version améliorée avec validation et détection de tendance.
@@ -20,6 +33,9 @@ class TechnicalAnalysis:
         Args:
             data: DataFrame avec les données de prix
             period: Nombre de jours pour calculer le range (défaut: 50)
+            anchor: "range" ou "swing" (défaut: FIB_ANCHOR). En mode swing, les niveaux
+                s'appuient sur le dernier swing ZigZag et la tendance est celle du swing ;
+                sans pivot confirmé, retour au range de la période.
             
         Returns:
             dict: Dictionnaire contenant les niveaux de Fibonacci et l'analyse
@@ -57,6 +73,12 @@ class TechnicalAnalysis:
             else:
                 current_price = float(close_series)
             
+            swing = None
+            if (anchor or self.FIB_ANCHOR) == "swing":
+                swing = self._last_swing(data)
+                if swing is not None:
+                    high, low = float(swing["high"]), float(swing["low"])
+
             diff = high - low
             
         except Exception as e:
@@ -76,9 +98,9 @@ class TechnicalAnalysis:
         
         # Détection de la tendance
         try:
-            trend = self._detect_trend(data, period)
+            trend = swing["trend"] if swing is not None else self._detect_trend(data, period)
         except Exception as e:
-            print(f"⚠️ Erreur détection tendance: {e}")
+            self.warnings.append(f"⚠️ Erreur détection tendance: {e}")
             trend = "neutre"
         
         # Niveaux de retracement de Fibonacci (corrigés)
@@ -102,8 +124,9 @@ class TechnicalAnalysis:
             "Ext 100%": high,
         }
         
-        # Déterminer les zones clés
-        analysis = self._analyze_fibonacci_position(current_price, levels, extensions, diff, trend)
+        # Déterminer les zones clés (niveaux triés une fois pour toutes les recherches)
+        index = FibonacciLevels(levels)
+        analysis = self._analyze_fibonacci_position(current_price, index, FibonacciLevels(extensions), diff, trend)
         
         return {
             "levels": levels,
@@ -114,9 +137,18 @@ class TechnicalAnalysis:
             "current_price": current_price,
             "trend": trend,
             "analysis": analysis,
+            "index": index,
             "valid": True
         }
     
+    def _last_swing(self, data):
+        """Dernier swing ZigZag de `data` (pivots du contexte si `data` est son historique)."""
+        if self.context._history is data:
+            pivots = self.context.pivots(**self.SWING_PARAMS)
+        else:
+            pivots = SwingPivots.from_history(data, **self.SWING_PARAMS)
+        return pivots.last_swing()
+
     def _detect_trend(self, data, period):
         """
         Détecte la tendance sur la période donnée.
@@ -160,7 +192,7 @@ class TechnicalAnalysis:
             else:
                 return "neutre"
         except Exception as e:
-            print(f"⚠️ Erreur dans _detect_trend: {e}")
+            self.warnings.append(f"⚠️ Erreur dans _detect_trend: {e}")
             return "neutre"
     
     def _create_invalid_fibonacci_result(self, current_price, reason):
@@ -198,32 +230,13 @@ class TechnicalAnalysis:
         """
         # Tolérance pour considérer qu'on est "sur" un niveau (1% du range)
         tolerance = range_size * 0.01
-        
-        # Identifier le niveau le plus proche en dessous (support)
-        support = None
-        support_name = None
-        support_distance = float('inf')
-        
-        for name, level in levels.items():
-            if level < price - tolerance:
-                distance = price - level
-                if distance < support_distance:
-                    support = level
-                    support_name = name
-                    support_distance = distance
-        
-        # Identifier le niveau le plus proche au-dessus (résistance)
-        resistance = None
-        resistance_name = None
-        resistance_distance = float('inf')
-        
-        for name, level in levels.items():
-            if level > price + tolerance:
-                distance = level - price
-                if distance < resistance_distance:
-                    resistance = level
-                    resistance_name = name
-                    resistance_distance = distance
+        index = levels if isinstance(levels, FibonacciLevels) else FibonacciLevels(levels)
+        ext_index = extensions if isinstance(extensions, FibonacciLevels) else FibonacciLevels(extensions)
+        levels = index.by_name
+
+        # Niveaux les plus proches en dessous (support) et au-dessus (résistance)
+        support, support_name = index.support(price, tolerance)
+        resistance, resistance_name = index.resistance(price, tolerance)
         
         # Déterminer la zone d'entrée selon la tendance
         if trend == "haussier":
@@ -248,12 +261,9 @@ class TechnicalAnalysis:
         if trend == "haussier":
             # Stop sous le prochain niveau Fibonacci important
             if support:
-                # Trouver le niveau Fibonacci en dessous du support actuel
-                next_support = None
-                for name, level in sorted(levels.items(), key=lambda x: x[1], reverse=True):
-                    if level < support - tolerance:
-                        next_support = level
-                        break
+                # Niveau Fibonacci en dessous du support actuel
+                below = index.below(support, tolerance, count=1)
+                next_support = below[0][0] if below else None
                 stop_loss = next_support * 0.99 if next_support else support * 0.97
             else:
                 stop_loss = price * 0.95
@@ -266,72 +276,41 @@ class TechnicalAnalysis:
         
         # Objectifs de sortie basés sur la tendance
         targets = []
+
+        def target(level, name, kind, gain):
+            return {"level": level, "name": name, "type": kind, "gain_potential": gain}
+
+        def resistance_targets():
+            # Résistance puis niveaux supérieurs (3 objectifs au plus)
+            if resistance and resistance > price:
+                targets.append(target(resistance, resistance_name, "Résistance Fibonacci",
+                                      ((resistance - price) / price) * 100))
+            for level, name in index.above(price, count=3):
+                if len(targets) >= 3:
+                    break
+                if not (targets and level == targets[0]["level"]):
+                    targets.append(target(level, name, "Résistance Fibonacci", ((level - price) / price) * 100))
         
         if trend == "haussier":
             # Objectifs : prochaines résistances puis extensions
-            if resistance and resistance > price:
-                targets.append({
-                    "level": resistance,
-                    "name": resistance_name,
-                    "type": "Résistance Fibonacci",
-                    "gain_potential": ((resistance - price) / price) * 100
-                })
-            
-            # Ajouter les niveaux supérieurs
-            for name, level in sorted(levels.items(), key=lambda x: x[1]):
-                if level > price and len(targets) < 3:
-                    if not any(t["level"] == level for t in targets):
-                        targets.append({
-                            "level": level,
-                            "name": name,
-                            "type": "Résistance Fibonacci",
-                            "gain_potential": ((level - price) / price) * 100
-                        })
+            resistance_targets()
             
             # Ajouter extensions (augmenté de 3 à 5 objectifs max)
-            for ext_name, ext_level in sorted(extensions.items(), key=lambda x: x[1]):
-                if ext_level > price and len(targets) < 5:
-                    targets.append({
-                        "level": ext_level,
-                        "name": ext_name,
-                        "type": "Extension Fibonacci",
-                        "gain_potential": ((ext_level - price) / price) * 100
-                    })
+            for ext_level, ext_name in ext_index.above(price, count=5 - len(targets)):
+                targets.append(target(ext_level, ext_name, "Extension Fibonacci", ((ext_level - price) / price) * 100))
         
         elif trend == "baissier":
             # En baissier, objectifs = supports en dessous (augmenté à 5 objectifs)
-            for name, level in sorted(levels.items(), key=lambda x: x[1], reverse=True):
-                if level < price and len(targets) < 5:
-                    targets.append({
-                        "level": level,
-                        "name": name,
-                        "type": "Support Fibonacci (Short)",
-                        "gain_potential": ((price - level) / price) * 100  # Gain en short
-                    })
+            for level, name in index.below(price, count=5):
+                targets.append(target(level, name, "Support Fibonacci (Short)",
+                                      ((price - level) / price) * 100))  # Gain en short
         else:
             # Neutre : objectifs modérés (augmenté à 3 objectifs)
-            if resistance:
-                targets.append({
-                    "level": resistance,
-                    "name": resistance_name,
-                    "type": "Résistance Fibonacci",
-                    "gain_potential": ((resistance - price) / price) * 100
-                })
-            
-            # Ajouter d'autres niveaux au-dessus
-            for name, level in sorted(levels.items(), key=lambda x: x[1]):
-                if level > price and len(targets) < 3:
-                    if not any(t["level"] == level for t in targets):
-                        targets.append({
-                            "level": level,
-                            "name": name,
-                            "type": "Résistance Fibonacci",
-                            "gain_potential": ((level - price) / price) * 100
-                        })
+            resistance_targets()
         
         # Évaluation de la position - score amélioré
         position_score, interpretation = self._evaluate_fibonacci_position(
-            price, levels, support, resistance, trend, range_size
+            price, index, support, resistance, trend, range_size
         )
         
         # Calcul du ratio risque/récompense
@@ -350,9 +329,12 @@ class TechnicalAnalysis:
             "risk_reward": risk_reward
         }
     
-    def _evaluate_fibonacci_position(self, price, levels, support, resistance, trend, range_size):
+    def _evaluate_fibonacci_position(self, price, index, support, resistance, trend, range_size):
         """
         Évalue la qualité de la position actuelle selon Fibonacci.
+
+        Args:
+            index: FibonacciLevels des niveaux de retracement
         
         Returns:
             tuple: (score, interpretation)
@@ -362,15 +344,15 @@ class TechnicalAnalysis:
         
         try:
             # Calcul de la position relative dans le range
-            high = float(levels["High (100%)"])
-            low = float(levels["Low (0%)"])
+            high = float(index.by_name["High (100%)"])
+            low = float(index.by_name["Low (0%)"])
             
             if high == low:
                 return 5.0, "Position neutre - range trop faible"
             
             position_pct = ((price - low) / (high - low)) * 100
         except Exception as e:
-            print(f"⚠️ Erreur calcul position: {e}")
+            self.warnings.append(f"⚠️ Erreur calcul position: {e}")
             return 5.0, f"Erreur évaluation position: {str(e)}"
         
         # Évaluation selon la position et la tendance
@@ -386,13 +368,12 @@ class TechnicalAnalysis:
                 score -= 2
                 reasons.append("⚠️ Prix proche du plus haut - risque de correction")
             
-            # Proximité d'un niveau clé
-            for name, level in levels.items():
-                if abs(price - level) / range_size < 0.03:  # À 3% du niveau
-                    if "61.8%" in name or "50%" in name:
-                        score += 1
-                        reasons.append(f"✅ Prix proche du niveau clé {name}")
-                        break
+            # Proximité d'un niveau clé (à 3% du range), le plus haut d'abord
+            for name in reversed(index.near(price, range_size * 0.03)):
+                if "61.8%" in name or "50%" in name:
+                    score += 1
+                    reasons.append(f"✅ Prix proche du niveau clé {name}")
+                    break
         
         elif trend == "baissier":
             # En tendance baissière, méfiance, attendre les rebonds
@@ -468,18 +449,17 @@ class TechnicalAnalysis:
 
     def run(self):
         try:
-            data = Utils.fetch_data(self.ticker_symbol)
-            data = Utils.compute_indicators(data)
+            data = self.context.history
         except Exception as e:
-            return pd.DataFrame(), 0, f"❌ {e}", None, None
+            return TechnicalResult(self.ticker_symbol, [], 0, f"❌ {e}")
 
         if data is None or len(data) == 0:
-            return pd.DataFrame(), 0, "❌ Aucune donnée disponible", None, None
+            return TechnicalResult(self.ticker_symbol, [], 0, "❌ Aucune donnée disponible")
 
         try:
-            last = data.iloc[-1]
+            last = self.context.latest_indicators
         except Exception as e:
-            return pd.DataFrame(), 0, f"❌ Erreur d'accès aux données: {e}", None, None
+            return TechnicalResult(self.ticker_symbol, [], 0, f"❌ Erreur d'accès aux données: {e}")
         
         ev = self.evaluator
         results = []
@@ -489,227 +469,81 @@ class TechnicalAnalysis:
             """Convertit une valeur en float de manière sécurisée."""
             try:
                 if value is None:
-                    print(f"⚠️ Valeur None pour {column_name}, utilisation de {default}")
+                    self.warnings.append(f"⚠️ Valeur None pour {column_name}, utilisation de {default}")
                     return default
                 
                 if isinstance(value, pd.Series):
                     if len(value) == 0:
-                        print(f"⚠️ Series vide pour {column_name}, utilisation de {default}")
+                        self.warnings.append(f"⚠️ Series vide pour {column_name}, utilisation de {default}")
                         return default
                     value = value.iloc[0]
                 
                 if pd.isna(value):
-                    print(f"⚠️ Valeur NaN pour {column_name}, utilisation de {default}")
+                    self.warnings.append(f"⚠️ Valeur NaN pour {column_name}, utilisation de {default}")
                     return default
                 
                 return float(value)
             except (ValueError, TypeError, AttributeError) as e:
-                print(f"⚠️ Erreur conversion {column_name}: {e}, utilisation de {default}")
+                self.warnings.append(f"⚠️ Erreur conversion {column_name}: {e}, utilisation de {default}")
                 return default
         
-        try:
-            rsi = safe_float(last["RSI"], "RSI", 50.0)
-            stoch_k = safe_float(last["STOCH_K"], "STOCH_K", 50.0)
-            stoch_d = safe_float(last["STOCH_D"], "STOCH_D", 50.0)
-            close = safe_float(last["Close"], "Close")
-            bb_l = safe_float(last["BB_L"], "BB_L", close * 0.98)
-            bb_m = safe_float(last["BB_M"], "BB_M", close)
-            bb_h = safe_float(last["BB_H"], "BB_H", close * 1.02)
-            macd_val = safe_float(last["MACD"], "MACD", 0.0)
-            signal_val = safe_float(last["Signal"], "Signal", 0.0)
-            obv = safe_float(last["OBV"], "OBV", 0.0)
-            ema200 = safe_float(last["EMA200"], "EMA200", close)
-            adx = safe_float(last["ADX"], "ADX", 25.0)
-        except KeyError as e:
-            return pd.DataFrame(), 0, f"❌ Colonne manquante dans les données: {e}", None, None
-        except Exception as e:
-            return pd.DataFrame(), 0, f"❌ Erreur lors de l'extraction des indicateurs: {e}", None, None
+        close = safe_float(self.context.current_price, "Close")
+
+        def get(column, default=0.0):
+            """Valeur du dernier point pour une colonne (fenêtres renvoyées telles quelles)."""
+            if column not in last:
+                self.warnings.append(f"⚠️ Colonne {column} absente, utilisation de {default}")
+                return default
+            value = last[column]
+            return value if isinstance(value, list) else safe_float(value, column, default)
 
         # Calcul de Fibonacci amélioré avec gestion d'erreur
         try:
             fib_data = self.calculate_fibonacci_levels(data, period=50)
             fib_analysis = fib_data["analysis"]
         except Exception as e:
-            print(f"⚠️ Erreur lors du calcul Fibonacci: {e}")
+            self.warnings.append(f"⚠️ Erreur lors du calcul Fibonacci: {e}")
             fib_data = self._create_invalid_fibonacci_result(close, f"Erreur calcul: {str(e)}")
             fib_analysis = fib_data["analysis"]
 
-        # Évaluations avec gestion d'erreur
-        try:
-            results.append(self._make_row("RSI (14)", rsi, *ev.evaluate_rsi(rsi), ev.weights["RSI"]))
-        except Exception as e:
-            print(f"⚠️ Erreur évaluation RSI: {e}")
-        
-        try:
-            results.append(self._make_row("Stochastique K/D", f"{stoch_k:.2f}/{stoch_d:.2f}",
-                                        *ev.evaluate_stoch(stoch_k, stoch_d), ev.weights["Stochastique"]))
-        except Exception as e:
-            print(f"⚠️ Erreur évaluation Stochastique: {e}")
-        
-        try:
-            results.append(self._make_row("Bandes de Bollinger", close,
-                                        *ev.evaluate_bollinger(close, bb_l, bb_m, bb_h), ev.weights["Bollinger"]))
-        except Exception as e:
-            print(f"⚠️ Erreur évaluation Bollinger: {e}")
-        
-        try:
-            results.append(self._make_row("MACD", macd_val,
-                                        *ev.evaluate_macd(macd_val, signal_val), ev.weights["MACD"]))
-        except Exception as e:
-            print(f"⚠️ Erreur évaluation MACD: {e}")
-        
-        try:
-            obv_recent = data["OBV"].iloc[-5:].mean() if len(data) >= 5 else obv
-            obv_past = data["OBV"].iloc[-20:-5].mean() if len(data) >= 20 else obv
-            results.append(self._make_row("OBV", obv,
-                                        *ev.evaluate_obv(obv_recent, obv_past), ev.weights["OBV"]))
-        except Exception as e:
-            print(f"⚠️ Erreur évaluation OBV: {e}")
-        
-        try:
-            results.append(self._make_row("Décote vs EMA200", f"{(close - ema200) / ema200 * 100:.2f}%",
-                                        *ev.evaluate_ema200(close, ema200), ev.weights["EMA200"]))
-        except Exception as e:
-            print(f"⚠️ Erreur évaluation EMA200: {e}")
-        
-        try:
-            results.append(self._make_row("ADX (14)", adx,
-                                        *ev.evaluate_adx(adx), ev.weights["ADX"]))
-        except Exception as e:
-            print(f"⚠️ Erreur évaluation ADX: {e}")
-        
+        # Évaluations des indicateurs actifs du registre (poids non nul)
+        for spec in IndicatorRegistry.active(ev.weights):
+            try:
+                results.append(self._make_row(spec.label, *spec.evaluate(ev, get, close), ev.weights[spec.name]))
+            except Exception as e:
+                self.warnings.append(f"⚠️ Erreur évaluation {spec.name}: {e}")
+
         # Ajout de l'analyse Fibonacci (seulement si valide)
         try:
-            if fib_data.get("valid", True):
-                results.append(self._make_row("Niveaux Fibonacci", f"{close:.2f}",
-                                            fib_analysis["score"], fib_analysis["interpretation"], 10.0))
+            if fib_data.get("valid", True) and ev.weights.get("Fibonacci", 0):
+                results.append(self._make_row("Niveaux Fibonacci", close,
+                                            fib_analysis["score"], fib_analysis["interpretation"],
+                                            float(ev.weights["Fibonacci"])))
         except Exception as e:
-            print(f"⚠️ Erreur ajout Fibonacci: {e}")
+            self.warnings.append(f"⚠️ Erreur ajout Fibonacci: {e}")
 
         if len(results) == 0:
-            return pd.DataFrame(), 0, "❌ Aucun indicateur n'a pu être calculé", None, None
+            return TechnicalResult(self.ticker_symbol, [], 0, "❌ Aucun indicateur n'a pu être calculé")
 
-        df = pd.DataFrame(results)
-        df["Score pondéré"] = df["Note (/10)"] * df["Poids (%)"] / 10
-        score_total = df["Score pondéré"].sum()
+        notes = np.array([row.note for row in results], dtype=float)
+        poids = np.array([row.weight for row in results], dtype=float)
+        score_total = np.nansum(notes * poids / 10)
 
+        level = signal = None
         try:
-            reco = IndicatorEvaluator._global_interpretation(df, score_total)
+            level, signal, reco = IndicatorEvaluator._global_interpretation(notes, score_total)
         except Exception as e:
             reco = f"Analyse technique (score: {score_total:.1f}/10) - Erreur interprétation: {e}"
 
-        # Ajout des informations Fibonacci à la recommandation
-        try:
-            fib_info = self._format_fibonacci_info(fib_data)
-        except Exception as e:
-            fib_info = f"\n⚠️ Erreur formatage Fibonacci: {e}\n"
-
-        llm_reco = close
-        print(f"Prix Actuel en bourse : {close}")
-        print(fib_info)
-        
-        return df, score_total, reco, llm_reco, fib_data
-
-    def _format_fibonacci_info(self, fib_data):
-        """Formate les informations Fibonacci pour l'affichage."""
-        try:
-            if not fib_data.get("valid", True):
-                return f"\n⚠️ FIBONACCI NON APPLICABLE\n{fib_data['analysis']['interpretation']}\n"
-            
-            analysis = fib_data["analysis"]
-            trend_emoji = {"haussier": "📈", "baissier": "📉", "neutre": "➡️"}
-            
-            info = "\n" + "="*60
-            info += "\n📊 ANALYSE FIBONACCI (50 jours)\n"
-            info += "="*60 + "\n"
-            
-            info += f"\n📍 Prix actuel : {fib_data['current_price']:.2f}€"
-            info += f"\n{trend_emoji.get(fib_data['trend'], '📊')} Tendance : {fib_data['trend'].upper()}"
-            info += f"\n📈 Plus haut (50j) : {fib_data['high']:.2f}€"
-            info += f"\n📉 Plus bas (50j) : {fib_data['low']:.2f}€"
-            info += f"\n📏 Range : {fib_data['range']:.2f}€ ({(fib_data['range']/fib_data['current_price']*100):.1f}%)"
-            
-            # Position relative avec gestion d'erreur
-            try:
-                high = float(fib_data['high'])
-                low = float(fib_data['low'])
-                current = float(fib_data['current_price'])
-                if high != low:
-                    position_pct = ((current - low) / (high - low) * 100)
-            except Exception as e:
-                print(f"⚠️ Erreur calcul position relative: {e}")
-        except Exception as e:
-            return f"\n⚠️ Erreur formatage informations Fibonacci: {e}\n"
-        
-        info += "\n\n🎯 NIVEAUX DE RETRACEMENT FIBONACCI :"
-        for name, level in fib_data["levels"].items():
-            distance_pct = abs(level - fib_data['current_price']) / fib_data['range'] * 100
-            marker = " ← 🎯 PRIX ACTUEL ICI" if distance_pct < 2 else ""
-            info += f"\n  {name:15} : {level:.2f}€{marker}"
-        
-        if fib_data['trend'] == "haussier":
-            info += "\n\n🚀 EXTENSIONS FIBONACCI (Objectifs haussiers) :"
-            for name, level in fib_data["extensions"].items():
-                gain = ((level - fib_data['current_price']) / fib_data['current_price']) * 100
-                info += f"\n  {name:15} : {level:.2f}€ (+{gain:.1f}%)"
-        
-        info += "\n\n" + "-"*60
-        info += "\n💡 RECOMMANDATIONS DE TRADING :"
-        info += "\n" + "-"*60
-        
-        if analysis["support"]:
-            distance = ((fib_data['current_price'] - analysis['support']) / analysis['support']) * 100
-            info += f"\n🛡️  Support proche : {analysis['support']:.2f}€ ({analysis['support_name']}) [-{distance:.1f}%]"
-        if analysis["resistance"]:
-            distance = ((analysis['resistance'] - fib_data['current_price']) / fib_data['current_price']) * 100
-            info += f"\n⚔️  Résistance proche : {analysis['resistance']:.2f}€ ({analysis['resistance_name']}) [+{distance:.1f}%]"
-        
-        entry_low, entry_high = analysis["entry_zone"]
-        info += f"\n\n✅ Zone d'entrée recommandée : {entry_low:.2f}€ - {entry_high:.2f}€"
-        
-        # Indiquer si on est dans la zone
-        if entry_low <= fib_data['current_price'] <= entry_high:
-            info += " ✓ (DANS LA ZONE)"
-        elif fib_data['current_price'] < entry_low:
-            info += f" (attendre {((entry_low - fib_data['current_price'])/fib_data['current_price']*100):.1f}% de hausse)"
-        else:
-            info += f" (attendre {((fib_data['current_price'] - entry_high)/fib_data['current_price']*100):.1f}% de baisse)"
-        
-        info += f"\n🛑 Stop Loss recommandé : {analysis['stop_loss']:.2f}€"
-        stop_distance = abs(fib_data['current_price'] - analysis['stop_loss']) / fib_data['current_price'] * 100
-        info += f" ({stop_distance:.1f}% {'au-dessus' if analysis['stop_loss'] > fib_data['current_price'] else 'en dessous'})"
-        
-        if analysis["targets"]:
-            info += "\n\n🎯 Objectifs de sortie :"
-            for i, target in enumerate(analysis["targets"], 1):
-                info += f"\n   Objectif {i} : {target['level']:.2f}€ ({target['name']})"
-                info += f" | {target['type']} | Potentiel: {'+' if target['gain_potential'] > 0 else ''}{target['gain_potential']:.1f}%"
-        
-        if analysis["risk_reward"] and analysis["risk_reward"]["ratio"] > 0:
-            rr = analysis["risk_reward"]
-            info += f"\n\n⚖️  Ratio Risque/Récompense : 1:{rr['ratio']:.2f}"
-            info += f"\n   💸 Risque : {rr['risk']:.2f}€ | 💰 Récompense : {rr['reward']:.2f}€"
-            if rr['ratio'] >= 2:
-                info += " ✅ Excellent"
-            elif rr['ratio'] >= 1.5:
-                info += " ✓ Bon"
-            elif rr['ratio'] >= 1:
-                info += " ~ Acceptable"
-            else:
-                info += " ⚠️ Défavorable"
-        
-        info += f"\n\n📝 {analysis['interpretation']}"
-        info += f"\n⭐ Score Fibonacci : {analysis['score']:.1f}/10"
-        
-        info += "\n" + "="*60 + "\n"
-        
-        return info
+        return TechnicalResult(
+            self.ticker_symbol, results, score_total, reco,
+            level=level,
+            signal=signal,
+            price=close,
+            fibonacci=FibonacciResult.from_dict(fib_data, anchor=self.FIB_ANCHOR,
+                                                date=pd.Timestamp(data.index[-1]).strftime("%Y-%m-%d"))
+        )
 
     def _make_row(self, name, value, note, interp, weight):
-        return {
-            "Indicateur": name,
-            "Valeur": f"{value:.2f}" if isinstance(value, (int, float, np.floating)) else str(value),
-            "Note (/10)": note,
-            "Poids (%)": weight,
-            "Interprétation": interp,
-        }
\ No newline at end of file
+        # Valeur brute, mise en forme au rendu (Renderer.VALUE_FORMATS["num"])
+        return IndicatorRow(name, value, "num", note, weight, interp)
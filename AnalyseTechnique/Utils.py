@@ -1,28 +1,60 @@
-import yfinance as yf
 import pandas as pd
-import ta
+from AnalyseTechnique.IndicatorEvaluator import IndicatorEvaluator
+from AnalyseTechnique.IndicatorRegistry import IndicatorRegistry
+from AnalyseTechnique.LookbackPlanner import LookbackPlanner
+from Donnees.DataProvider import DataProvider
 from OllamaSession import OllamaSession
 
 class Utils:
 
     @staticmethod
-    def fetch_data(ticker):
+    def history_period():
+        """Profondeur d'historique nécessaire aux indicateurs de poids non nul."""
+        return LookbackPlanner.period(IndicatorRegistry.lookbacks(IndicatorEvaluator().weights))
+
+    @staticmethod
+    def fetch_data(ticker, period=None):
         try:
-            data = yf.download(
-                ticker,
-                period="12mo",
-                interval="1d",
-                auto_adjust=True,
-                progress=False
-            )
-
-            if data.empty:
+            period = period or Utils.history_period()
+            data = DataProvider.current().history([ticker], period=period).get(ticker)
+
+            if data is None or data.empty:
                 raise ValueError("Données historiques non disponibles")
 
             return data
 
         except Exception as e:
             raise RuntimeError(f"Erreur de téléchargement : {e}")
+
+    @staticmethod
+    def fetch_data_bulk(tickers, chunk_size=50, period=None, start=None):
+        """
+        Télécharge l'historique OHLCV de plusieurs tickers en requêtes groupées
+        et découpe le résultat en un DataFrame par ticker.
+
+        Args:
+            tickers: Liste des tickers à télécharger
+            chunk_size: Nombre de tickers par requête yfinance
+            period: Profondeur d'historique (par défaut : Utils.history_period(),
+                ignorée si start est fourni)
+            start: Date de début (téléchargement incrémental)
+
+        Returns:
+            dict: {ticker: DataFrame} (les tickers sans données sont absents)
+        """
+        frames = {}
+        tickers = list(dict.fromkeys(tickers))
+        provider = DataProvider.current()
+        period = period or Utils.history_period()
+
+        for i in range(0, len(tickers), chunk_size):
+            chunk = tickers[i:i + chunk_size]
+            try:
+                frames.update(provider.history(chunk, period=period, start=start))
+            except Exception as e:
+                print(f"⚠️ Erreur de téléchargement groupé ({', '.join(chunk)}) : {e}")
+
+        return frames
         
     @staticmethod
     def _to_series(data, col):
@@ -32,28 +64,30 @@ class Utils:
         return data[col].astype(float)
     
     @staticmethod
-    def compute_indicators(data):
-        """Ajoute les indicateurs techniques au DataFrame."""
-        open_, high, low, close, volume = (
-            Utils._to_series(data, "Open"),
-            Utils._to_series(data, "High"),
-            Utils._to_series(data, "Low"),
-            Utils._to_series(data, "Close"),
-            Utils._to_series(data, "Volume"),
+    def compute_indicators(data, weights=None):
+        """
+        Ajoute au DataFrame les indicateurs techniques de poids non nul
+        (pondération d'IndicatorEvaluator par défaut, cf. IndicatorRegistry).
+        """
+        if weights is None:
+            weights = IndicatorEvaluator().weights
+        # Séances cotées uniquement, comme IndicatorPanel et IndicatorState
+        quoted = Utils._to_series(data, "Close").notna().to_numpy()
+        if not quoted.all():
+            data = data.loc[quoted].copy()
+        high, low, close, volume = (
+            Utils._to_series(data, "High").to_numpy(),
+            Utils._to_series(data, "Low").to_numpy(),
+            Utils._to_series(data, "Close").to_numpy(),
+            Utils._to_series(data, "Volume").to_numpy(),
         )
 
-        data["RSI"] = ta.momentum.RSIIndicator(close, 14).rsi()
-        stoch = ta.momentum.StochasticOscillator(high, low, close, 14, 3)
-        data["STOCH_K"], data["STOCH_D"] = stoch.stoch(), stoch.stoch_signal()
-        macd = ta.trend.MACD(close)
-        data["MACD"], data["Signal"] = macd.macd(), macd.macd_signal()
-        data["OBV"] = ta.volume.OnBalanceVolumeIndicator(close, volume).on_balance_volume()
-        bb = ta.volatility.BollingerBands(close, 20, 2)
-        data["BB_H"], data["BB_L"], data["BB_M"] = bb.bollinger_hband(), bb.bollinger_lband(), bb.bollinger_mavg()
-        data["EMA200"] = ta.trend.EMAIndicator(close, 200).ema_indicator()
-        data["ADX"] = ta.trend.ADXIndicator(high, low, close, 14).adx()
-
-        return data.dropna().bfill().ffill()
+        for column, values in IndicatorRegistry.compute(high, low, close, volume, weights).items():
+            data[column] = values
+
+        # L'historique couvre déjà la période de chauffe (LookbackPlanner) : il suffit
+        # d'écarter les lignes incomplètes, sans recopie bfill/ffill de tout le tableau
+        return data.dropna()
     
 
 
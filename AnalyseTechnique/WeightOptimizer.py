@@ -0,0 +1,351 @@
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from colorama import Fore, Style
+from AnalyseTechnique.Backtester import Backtester
+from AnalyseTechnique.IndicatorEvaluator import IndicatorEvaluator
+from AnalyseTechnique.IndicatorPanel import IndicatorPanel
+from AnalyseTechnique.IndicatorRegistry import IndicatorRegistry
+from AnalyseTechnique.LookbackPlanner import LookbackPlanner
+
+# Tableaux partagés, attachés une fois par processus de travail (cf. WeightOptimizer._attach)
+_ARRAYS = {}
+_BLOCKS = []
+
+
+class WeightOptimizer:
+    """
+    Optimisation walk-forward des poids et des seuils du score technique.
+
+    L'historique est découpé en fenêtres glissantes (apprentissage `train_years`, test
+    `test_years`). Chaque configuration candidate (poids, seuils de l'évaluateur, seuils
+    d'entrée / sortie du Backtester) est backtestée sur toutes les fenêtres
+    d'apprentissage ; la meilleure de chaque fenêtre est ensuite mesurée hors échantillon
+    sur la fenêtre de test qui suit.
+
+    Les indicateurs et les niveaux Fibonacci ne dépendent pas des candidats : ils sont
+    calculés une fois par le processus principal puis placés en mémoire partagée, que les
+    processus de travail lisent sans copie. Seul le score pondéré et la simulation sont
+    refaits pour chaque candidat.
+
+    Le rapport (meilleure configuration par fenêtre, stabilité des paramètres,
+    configuration recommandée) se recharge avec IndicatorEvaluator.use.
+    """
+
+    # Espace de recherche des paramètres hors poids : (min, max) en recherche aléatoire
+    RANGES = {
+        "rsi_shift": (-5.0, 5.0),  # Décalage de tous les seuils RSI
+        "bollinger_deep": (0.94, 0.99),  # Facteur de la bande basse « très en dessous »
+        "ema200_scale": (0.7, 1.3),  # Échelle des seuils de décote EMA200
+        "adx_shift": (-5.0, 5.0),  # Décalage des seuils ADX
+        "entry": (60.0, 80.0),
+        "exit": (40.0, 55.0),
+    }
+
+    # Grille des mêmes paramètres (recherche exhaustive)
+    GRID = {
+        "rsi_shift": (-4.0, 0.0, 4.0),
+        "bollinger_deep": (0.95, 0.97),
+        "ema200_scale": (0.8, 1.0, 1.2),
+        "adx_shift": (0.0,),
+        "entry": (65.0, 70.0, 75.0),
+        "exit": (45.0, 50.0),
+    }
+
+    OBJECTIVES = ("calmar", "cagr", "hit_rate", "avg_return")
+
+    def __init__(self, candidates=64, method="random", train_years=3, test_years=1, objective="calmar",
+                 workers=None, min_trades=20, max_holding=120, fib_period=50, seed=0):
+        if method not in ("random", "grid"):
+            raise ValueError(f"Méthode de recherche inconnue : '{method}'")
+        if objective not in self.OBJECTIVES:
+            raise ValueError(f"Objectif inconnu : '{objective}'")
+        self.candidates = candidates
+        self.method = method
+        self.train_years = train_years
+        self.test_years = test_years
+        self.objective = objective
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.min_trades = min_trades  # En dessous, la fenêtre d'apprentissage n'est pas notée
+        self.max_holding = max_holding
+        self.fib_period = fib_period
+        self.rng = np.random.default_rng(seed)
+        self.base = IndicatorEvaluator()
+
+    # ------------------------------------------------------------------
+    # Candidats
+    # ------------------------------------------------------------------
+    def default_params(self):
+        """Paramètres de la configuration actuelle (toujours évaluée, en premier)."""
+        params = {f"weights.{name}": float(w) for name, w in self.base.weights.items()}
+        params.update(rsi_shift=0.0, bollinger_deep=self.base.BOLLINGER_DEEP, ema200_scale=1.0,
+                      adx_shift=0.0, entry=70.0, exit=50.0)
+        return params
+
+    def sample(self):
+        """Jeux de paramètres candidats (le premier est la configuration actuelle)."""
+        default = self.default_params()
+        names = list(self.base.weights)
+        total = sum(self.base.weights.values())
+
+        if self.method == "grid":
+            # Poids : configuration actuelle, puis chaque indicateur renforcé (×2, renormalisé)
+            vectors = [dict(self.base.weights)]
+            for name in names:
+                boosted = {n: w * (2 if n == name else 1) for n, w in self.base.weights.items()}
+                scale = total / sum(boosted.values())
+                vectors.append({n: w * scale for n, w in boosted.items()})
+            keys = list(self.GRID)
+            grid = []
+            for weights, values in itertools.product(vectors, itertools.product(*self.GRID.values())):
+                params = {f"weights.{n}": round(float(w), 2) for n, w in weights.items()}
+                params.update(zip(keys, values))
+                if params["exit"] < params["entry"]:
+                    grid.append(params)
+            if len(grid) > self.candidates:
+                picked = self.rng.choice(len(grid), self.candidates - 1, replace=False)
+                grid = [grid[i] for i in sorted(picked)]
+            return [default] + [p for p in grid if p != default]
+
+        candidates = [default]
+        while len(candidates) < self.candidates:
+            weights = self.rng.dirichlet(np.ones(len(names))) * total
+            params = {f"weights.{n}": round(float(w), 2) for n, w in zip(names, weights)}
+            for key, (low, high) in self.RANGES.items():
+                params[key] = round(float(self.rng.uniform(low, high)), 3)
+            if params["exit"] < params["entry"]:
+                candidates.append(params)
+        return candidates
+
+    @staticmethod
+    def config(params):
+        """Paramètres plats -> configuration {"weights", "thresholds", "entry", "exit"}."""
+        e = IndicatorEvaluator
+        return {
+            "weights": {k.split(".", 1)[1]: v for k, v in params.items() if k.startswith("weights.")},
+            "thresholds": {
+                "RSI_BINS": [b + params["rsi_shift"] for b in e.RSI_BINS],
+                "BOLLINGER_DEEP": params["bollinger_deep"],
+                "EMA200_BINS": [b * params["ema200_scale"] for b in e.EMA200_BINS],
+                "ADX_BINS": [b + params["adx_shift"] for b in e.ADX_BINS],
+            },
+            "entry": params["entry"],
+            "exit": params["exit"],
+        }
+
+    # ------------------------------------------------------------------
+    # Fenêtres walk-forward
+    # ------------------------------------------------------------------
+    def folds(self, length):
+        """
+        Fenêtres (début apprentissage, début test, fin test) en lignes du calendrier,
+        après la période de chauffe des indicateurs.
+        """
+        train = int(self.train_years * LookbackPlanner.SESSIONS_PER_YEAR)
+        test = int(self.test_years * LookbackPlanner.SESSIONS_PER_YEAR)
+        start = LookbackPlanner.required_bars()
+        folds = []
+        while start + train + test <= length:
+            folds.append((start, start + train, start + train + test))
+            start += test
+        return folds
+
+    # ------------------------------------------------------------------
+    # Évaluation (processus de travail)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _attach(manifest):
+        """Initialisation d'un processus de travail : attache les tableaux partagés."""
+        _ARRAYS.clear()
+        for key, (name, shape, dtype) in manifest.items():
+            # Les processus de travail partagent le suivi des ressources du processus
+            # principal, seul responsable de la libération (unlink)
+            block = shared_memory.SharedMemory(name=name)
+            _BLOCKS.append(block)
+            _ARRAYS[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+    @staticmethod
+    def _score(result, objective, min_trades):
+        """Valeur de l'objectif (-inf si trop peu de trades pour être significative)."""
+        if len(result["trades"]) < min_trades:
+            return float("-inf")
+        if objective == "calmar":
+            drawdown = abs(result["max_drawdown"])
+            value = result["cagr"] / drawdown if drawdown > 0 else result["cagr"]
+        else:
+            value = result[objective]
+        return float(value) if np.isfinite(value) else float("-inf")
+
+    @staticmethod
+    def _evaluate(params, windows, objective, min_trades, max_holding, fib_period):
+        """Backteste un candidat sur chaque fenêtre ; retourne [(objectif, métriques)]."""
+        config = WeightOptimizer.config(params)
+        evaluator = IndicatorEvaluator(config["weights"], config["thresholds"])
+        backtester = Backtester(config["entry"], config["exit"], max_holding, fib_period, evaluator=evaluator)
+        score = backtester.weighted_score(_ARRAYS)
+        dates = pd.DatetimeIndex(_ARRAYS["dates"])
+        tickers = list(range(score.shape[1]))
+
+        results = []
+        for start, end in windows:
+            result = backtester.simulate(_ARRAYS, score, dates, tickers, start, end)
+            metrics = {k: result[k] for k in ("cagr", "max_drawdown", "hit_rate", "avg_return", "exposure")}
+            metrics["trades"] = len(result["trades"])
+            results.append((WeightOptimizer._score(result, objective, min_trades), metrics))
+        return results
+
+    # ------------------------------------------------------------------
+    # Optimisation
+    # ------------------------------------------------------------------
+    def run(self, histories):
+        """
+        Args:
+            histories: dict {ticker: DataFrame OHLCV} (plusieurs années)
+
+        Returns:
+            dict: rapport (cf. print_report / save)
+        """
+        # Tous les indicateurs : un candidat peut pondérer ceux que la configuration actuelle ignore
+        panel = IndicatorPanel(histories, {spec.name: 1 for spec in IndicatorRegistry.INDICATORS})
+        backtester = Backtester(max_holding=self.max_holding, fib_period=self.fib_period)
+        arrays = backtester.arrays(panel, specs=IndicatorRegistry.active())
+        dates = panel.dates()
+        arrays["dates"] = dates.to_numpy(dtype="datetime64[ns]")
+
+        folds = self.folds(len(dates))
+        if not folds:
+            raise RuntimeError(
+                f"Historique trop court pour une optimisation walk-forward "
+                f"({len(dates)} séances, {self.train_years} an(s) + {self.test_years} an(s) requis après chauffe)"
+            )
+
+        candidates = self.sample()
+        print(f"🔍 {len(candidates)} candidats × {len(folds)} fenêtres ({self.workers} processus)...")
+        task = (self.objective, self.min_trades, self.max_holding, self.fib_period)
+        # Hors échantillon, l'objectif brut est toujours rapporté (comparaison avec la
+        # configuration actuelle) ; le seuil de trades, proportionnel à la durée de la
+        # fenêtre de test, ne sert qu'à signaler les mesures peu significatives
+        test_task = (self.objective, 0, self.max_holding, self.fib_period)
+        test_min_trades = max(1, round(self.min_trades * self.test_years / self.train_years))
+        train_windows = [(a, b) for a, b, _ in folds]
+        test_windows = [(b, c) for _, b, c in folds]
+
+        blocks = []
+        try:
+            manifest = {}
+            for key, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                manifest[key] = (block.name, array.shape, array.dtype.str)
+
+            if self.workers > 1:
+                with ProcessPoolExecutor(self.workers, initializer=self._attach, initargs=(manifest,)) as pool:
+                    train = list(pool.map(self._evaluate, candidates, itertools.repeat(train_windows),
+                                          *(itertools.repeat(arg) for arg in task)))
+                self._attach(manifest)
+            else:
+                self._attach(manifest)
+                train = [self._evaluate(params, train_windows, *task) for params in candidates]
+
+            # --- Meilleur candidat par fenêtre, mesuré hors échantillon ---
+            report_folds = []
+            for k, (a, b, c) in enumerate(folds):
+                best = max(range(len(candidates)), key=lambda i: train[i][k][0])
+                (test_value, test_metrics), = self._evaluate(candidates[best], [test_windows[k]], *test_task)
+                (base_value, base_metrics), = self._evaluate(candidates[0], [test_windows[k]], *test_task)
+                report_folds.append({
+                    "train_period": [str(dates[a].date()), str(dates[b - 1].date())],
+                    "test_period": [str(dates[b].date()), str(dates[c - 1].date())],
+                    "candidate": best,
+                    "params": candidates[best],
+                    "train_objective": train[best][k][0],
+                    "test_objective": test_value,
+                    "test": test_metrics,
+                    "test_significant": test_metrics["trades"] >= test_min_trades,
+                    "baseline_test_objective": base_value,
+                    "baseline_test": base_metrics,
+                    "baseline_test_significant": base_metrics["trades"] >= test_min_trades,
+                })
+        finally:
+            _ARRAYS.clear()
+            for block in _BLOCKS:
+                block.close()
+            _BLOCKS.clear()
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        return {
+            "objective": self.objective,
+            "method": self.method,
+            "candidates": len(candidates),
+            "tickers": len(panel.tickers),
+            "test_min_trades": test_min_trades,
+            "folds": report_folds,
+            "stability": self.stability(report_folds),
+            "recommended": self.recommend(report_folds),
+        }
+
+    # ------------------------------------------------------------------
+    # Rapport
+    # ------------------------------------------------------------------
+    @staticmethod
+    def stability(folds):
+        """Dispersion de chaque paramètre entre les meilleures configurations des fenêtres."""
+        stability = {}
+        for key in folds[0]["params"]:
+            values = np.array([fold["params"][key] for fold in folds], dtype=float)
+            mean, std = float(values.mean()), float(values.std())
+            stability[key] = {"mean": mean, "std": std, "cv": std / abs(mean) if mean else float("nan")}
+        return stability
+
+    @staticmethod
+    def recommend(folds):
+        """Configuration recommandée : médiane des meilleurs paramètres (poids renormalisés)."""
+        params = {key: float(np.median([fold["params"][key] for fold in folds])) for key in folds[0]["params"]}
+        weights = [key for key in params if key.startswith("weights.")]
+        total = sum(IndicatorEvaluator().weights.values())
+        scale = total / sum(params[key] for key in weights)
+        for key in weights:
+            params[key] = round(params[key] * scale, 2)
+        return WeightOptimizer.config(params)
+
+    @staticmethod
+    def save(report, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def print_report(report):
+        """Affiche la synthèse de l'optimisation."""
+        print(Fore.CYAN + "\n=== 🧬 OPTIMISATION WALK-FORWARD DU SCORE TECHNIQUE ===" + Style.RESET_ALL)
+        print(f"🎯 Objectif : {report['objective']} | {report['candidates']} candidats ({report['method']}) "
+              f"| {report['tickers']} tickers")
+
+        minimum = report.get("test_min_trades", 0)
+        for k, fold in enumerate(report["folds"], 1):
+            test, base = fold["test"], fold["baseline_test"]
+            print(f"\n📅 Fenêtre {k} : apprentissage {fold['train_period'][0]} → {fold['train_period'][1]}, "
+                  f"test {fold['test_period'][0]} → {fold['test_period'][1]}")
+            print(f"   🏆 Candidat #{fold['candidate']} | objectif apprentissage {fold['train_objective']:.2f} "
+                  f"| test {fold['test_objective']:.2f} (actuel {fold['baseline_test_objective']:.2f})")
+            print(f"   📈 Test : CAGR {test['cagr']:.2%} | drawdown {test['max_drawdown']:.2%} "
+                  f"| {test['trades']} trades (actuel : CAGR {base['cagr']:.2%}, {base['trades']} trades)")
+            if not (fold.get("test_significant", True) and fold.get("baseline_test_significant", True)):
+                print(f"   ⚠️ Moins de {minimum} trades sur la fenêtre de test : comparaison peu significative")
+
+        print(Fore.CYAN + "\n--- Stabilité des paramètres (entre fenêtres) ---" + Style.RESET_ALL)
+        for key, stats in report["stability"].items():
+            flag = "⚠️ " if stats["cv"] > 0.5 else ""
+            print(f"   {flag}{key:<22} moyenne {stats['mean']:8.3f} | écart-type {stats['std']:7.3f} | cv {stats['cv']:.2f}")
+
+        recommended = report["recommended"]
+        print(Fore.CYAN + "\n--- Configuration recommandée ---" + Style.RESET_ALL)
+        print("   ⚖️ Poids : " + ", ".join(f"{k} {v:g}" for k, v in recommended["weights"].items()))
+        print(f"   🚪 Entrée {recommended['entry']:g} | Sortie {recommended['exit']:g}")
@@ -0,0 +1,185 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from StockAnalyzer import StockAnalyzer
+
+
+class AnalysisPipeline:
+    """
+    Exécution de StockAnalyzer en pipeline asyncio, par étapes reliées par des files
+    bornées :
+
+    1. téléchargement : cours et `info` par lots de `batch_size` tickers, appels
+       yfinance bloquants exécutés dans des threads (run_in_executor) ;
+    2. analyse : fondamentale, indicateurs et Fibonacci dans `workers` processus
+       (StockAnalyzer._analyze_task, résultat sans mise en forme) ;
+    3. rendu : rapports dans l'ordre des tickers (Renderer), index Fibonacci et
+       notifications.
+
+    Le lot suivant se télécharge pendant l'analyse du précédent. La file de
+    téléchargement (`queue_size` tickers) et la fenêtre des résultats en attente de
+    rendu (même taille) bloquent les étapes amont quand l'aval prend du retard : la
+    mémoire reste bornée quelle que soit la taille de l'univers.
+    """
+
+    def __init__(self, analyzer, batch_size=25, queue_size=32):
+        self.analyzer = analyzer
+        self.batch_size = batch_size
+        self.queue_size = max(queue_size, 1)
+
+    def run(self):
+        return asyncio.run(self._run())
+
+    async def _run(self):
+        a = self.analyzer
+        workers = max(a.workers, 1)
+        print(f"🔀 Pipeline : lots de {self.batch_size} tickers, {workers} processus d'analyse, file de {self.queue_size}")
+
+        fib_index = None
+        if a.fib_index:
+            from AnalyseTechnique.FibonacciIndex import FibonacciIndex
+            fib_index = FibonacciIndex.load(a.fib_index)
+
+        fetched = asyncio.Queue(maxsize=self.queue_size)
+        window = asyncio.Semaphore(self.queue_size)  # Résultats analysés non encore rendus
+        results = {}
+        ready = asyncio.Condition()
+
+        io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline-io")
+        self._settings = StockAnalyzer._settings()
+        self._pool = self._new_pool(workers)
+        self._stuck = []  # Processus des pools où une analyse a dépassé le délai
+        try:
+            stages = [asyncio.create_task(self._fetch(fetched, io_pool, workers))]
+            stages += [asyncio.create_task(self._analyze(fetched, window, results, ready)) for _ in range(workers)]
+            await self._render(results, ready, window, fib_index)
+            await asyncio.gather(*stages)
+        finally:
+            io_pool.shutdown(wait=False, cancel_futures=True)
+            self._pool.shutdown(wait=not self._stuck, cancel_futures=True)
+            for process in self._stuck:
+                # Processus bloqués : arrêtés pour ne pas retenir la fin du programme
+                process.terminate()
+
+        if fib_index is not None:
+            fib_index.save(a.fib_index)
+            print(f"💾 Index Fibonacci mis à jour ({len(fib_index)} tickers) : {a.fib_index}")
+
+    def _new_pool(self, workers):
+        return ProcessPoolExecutor(workers, initializer=StockAnalyzer._init_worker, initargs=(self._settings,))
+
+    # ------------------------------------------------------------------
+    # Étapes
+    # ------------------------------------------------------------------
+    async def _fetch(self, fetched, io_pool, workers):
+        """Télécharge les lots de tickers et alimente la file d'analyse (bloque si elle est pleine)."""
+        loop = asyncio.get_running_loop()
+        a = self.analyzer
+        fetch_prices, fetch_infos = self._fetchers()
+
+        tickers = list(enumerate(a.tickers))
+        for start in range(0, len(tickers), self.batch_size):
+            batch = tickers[start:start + self.batch_size]
+            symbols = list(dict.fromkeys(t for _, t in batch))
+            prices, infos = await asyncio.gather(
+                loop.run_in_executor(io_pool, fetch_prices, symbols),
+                loop.run_in_executor(io_pool, fetch_infos, symbols),
+                return_exceptions=True
+            )
+            for name, data in (("cours", prices), ("données fondamentales", infos)):
+                if isinstance(data, BaseException):
+                    print(f"⚠️ Téléchargement des {name} impossible pour le lot {start // self.batch_size + 1} : {data}")
+            for i, ticker in batch:
+                history = None if isinstance(prices, BaseException) else prices.get(ticker)
+                info = infos if isinstance(infos, BaseException) else infos.get(ticker)
+                await fetched.put((i, ticker, history, info))
+
+        for _ in range(workers):
+            await fetched.put(None)  # Fin de flux, une par processus d'analyse
+
+    def _fetchers(self):
+        """Fonctions (bloquantes) de téléchargement d'un lot : cours et `info`, avec ou sans cache."""
+        from AnalyseTechnique.Utils import Utils
+        from Donnees.DataProvider import DataProvider
+        from Donnees.FetchExecutor import FetchExecutor
+        a = self.analyzer
+        executor = FetchExecutor(max_workers=a.concurrency, rate=a.rate, timeout=a.timeout)
+
+        if a.cache_dir:
+            from Donnees.PriceCache import PriceCache
+            fetch_prices = PriceCache(a.cache_dir).get_many
+        else:
+            fetch_prices = Utils.fetch_data_bulk
+
+        if a.info_cache_dir:
+            from Donnees.InfoCache import InfoCache
+            info_cache = InfoCache(a.info_cache_dir, ttl=a.info_ttl)
+            fetch_infos = lambda symbols: info_cache.get_many(symbols, refresh=a.refresh, executor=executor)
+        else:
+            fetch_infos = lambda symbols: executor.map(DataProvider.current().info, symbols)
+        return fetch_prices, fetch_infos
+
+    async def _analyze(self, fetched, window, results, ready):
+        """Analyse les tickers de la file dans le pool de processus."""
+        a = self.analyzer
+        limit = 2 * a.ticker_timeout if a.ticker_timeout else None  # Filet si l'alarme du processus échoue
+
+        while True:
+            # Place réservée avant de prendre un ticker : les tickers sont pris dans l'ordre,
+            # le prochain à afficher n'attend donc jamais une place
+            await window.acquire()
+            item = await fetched.get()
+            if item is None:
+                window.release()
+                return
+            i, ticker, history, info = item
+
+            try:
+                result = await self._submit(self._pool, ticker, history, info, limit)
+            except BrokenProcessPool:
+                # Un processus est mort : le pool partagé est remplacé, et le ticker relancé
+                # seul dans un processus dédié pour ne pas faire échouer ses voisins
+                self._replace_pool()
+                retry = self._new_pool(1)
+                try:
+                    result = await self._submit(retry, ticker, history, info, limit)
+                except BrokenProcessPool:
+                    result = a._failed(ticker, "processus d'analyse interrompu")
+                finally:
+                    retry.shutdown(wait=False, cancel_futures=True)
+
+            async with ready:
+                results[i] = result
+                ready.notify_all()
+
+    async def _submit(self, pool, ticker, history, info, limit):
+        """Analyse d'un ticker dans `pool` ; les erreurs autres qu'un pool cassé donnent un échec."""
+        loop = asyncio.get_running_loop()
+        a = self.analyzer
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(pool, a._analyze_task, ticker, history, info), limit)
+        except BrokenProcessPool:
+            raise
+        except asyncio.TimeoutError:
+            self._stuck.extend((pool._processes or {}).values())
+            return a._failed(ticker, f"délai de {a.ticker_timeout:.0f}s dépassé")
+        except Exception as e:
+            return a._failed(ticker, e)
+
+    def _replace_pool(self):
+        """Remplace le pool partagé cassé (une seule fois pour tous les analyseurs)."""
+        if self._pool._broken:
+            broken, self._pool = self._pool, self._new_pool(self._pool._max_workers)
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    async def _render(self, results, ready, window, fib_index):
+        """Affiche les résultats dans l'ordre des tickers, met à jour l'index et notifie."""
+        loop = asyncio.get_running_loop()
+        a = self.analyzer
+        for i in range(len(a.tickers)):
+            async with ready:
+                await ready.wait_for(lambda: i in results)
+                result = results.pop(i)
+            window.release()
+            # Notification (requête HTTP) hors de la boucle d'événements
+            await loop.run_in_executor(None, a.report, result, fib_index)
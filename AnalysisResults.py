@@ -0,0 +1,134 @@
+from dataclasses import asdict, dataclass, field
+
+
+@dataclass(slots=True)
+class IndicatorRow:
+    """
+    Ligne d'indicateur d'une analyse : valeur brute et unité d'affichage (cf.
+    Renderer.VALUE_FORMATS), la mise en forme n'ayant lieu qu'au rendu.
+    """
+    name: str
+    value: object
+    unit: str
+    note: object
+    weight: float
+    interpretation: str
+    definition: str = None
+    short_definition: str = None
+
+
+@dataclass(slots=True)
+class FundamentalResult:
+    """Résultat de FundamentalAnalysis.run : lignes et scores (/100) par catégorie."""
+    ticker: str
+    name: str
+    market_cap: object
+    country: str
+    sector: str
+    industry: str
+    currency: str
+    categories: dict  # {catégorie: [IndicatorRow]}
+    category_scores: dict  # {catégorie: score /100}, catégories avec données uniquement
+    score: float
+
+    @property
+    def rows(self):
+        return [row for rows in self.categories.values() for row in rows]
+
+
+@dataclass(slots=True)
+class FibonacciResult:
+    """Niveaux et analyse de position de Fibonacci (cf. TechnicalAnalysis.calculate_fibonacci_levels)."""
+    valid: bool
+    current_price: float
+    trend: str
+    high: float
+    low: float
+    range: float
+    levels: dict
+    extensions: dict
+    support: float
+    support_name: str
+    resistance: float
+    resistance_name: str
+    entry_zone: tuple
+    stop_loss: float
+    targets: list
+    score: float
+    interpretation: str
+    risk_reward: dict
+    anchor: str = None  # Ancrage des niveaux (TechnicalAnalysis.FIB_ANCHOR : range / swing)
+    date: str = None  # Dernière séance prise en compte (AAAA-MM-JJ)
+
+    ANALYSIS = ("support", "support_name", "resistance", "resistance_name", "entry_zone",
+                "stop_loss", "targets", "score", "interpretation", "risk_reward")
+
+    @staticmethod
+    def from_dict(fib_data, anchor=None, date=None):
+        """Depuis le dictionnaire de calculate_fibonacci_levels."""
+        analysis = fib_data["analysis"]
+        return FibonacciResult(
+            valid=bool(fib_data.get("valid", True)),
+            current_price=fib_data["current_price"],
+            trend=fib_data["trend"],
+            high=fib_data["high"],
+            low=fib_data["low"],
+            range=fib_data["range"],
+            levels=fib_data["levels"],
+            extensions=fib_data["extensions"],
+            anchor=anchor or fib_data.get("anchor"),
+            date=date or fib_data.get("date"),
+            **{key: analysis[key] for key in FibonacciResult.ANALYSIS}
+        )
+
+    def as_dict(self):
+        """Forme de calculate_fibonacci_levels (ex: FibonacciIndex.update)."""
+        data = asdict(self)
+        data["analysis"] = {key: data.pop(key) for key in FibonacciResult.ANALYSIS}
+        return data
+
+
+@dataclass(slots=True)
+class TechnicalResult:
+    """Résultat de TechnicalAnalysis.run (sans lignes si l'analyse n'a pas abouti)."""
+    ticker: str
+    rows: list  # [IndicatorRow]
+    score: float
+    recommendation: str  # Texte brut, sans mise en forme
+    level: str = None  # Niveau de la recommandation (IndicatorEvaluator.GLOBAL_LEVELS)
+    signal: str = None  # Signal de convergence éventuel (IndicatorEvaluator.GLOBAL_SIGNALS)
+    price: float = None
+    fibonacci: FibonacciResult = None
+
+
+@dataclass(slots=True)
+class TickerResult:
+    """
+    Analyse complète d'un ticker (StockAnalyzer.analyze) : résultats fondamental et
+    technique, ou message d'erreur de chacun, et score global pondéré.
+    """
+    ticker: str
+    fundamental: FundamentalResult = None
+    fundamental_error: str = None
+    technical: TechnicalResult = None
+    technical_error: str = None
+    sf: float = 0
+    st: float = 0
+    sg: float = 0
+    verdict: str = None  # Interprétation finale, texte brut
+    verdict_level: str = None  # Niveau de l'interprétation finale (StockAnalyzer.VERDICTS)
+    warnings: list = field(default_factory=list)  # Avertissements des calculs
+    error: str = None  # Échec de toute l'analyse (délai dépassé, processus interrompu...)
+    output: str = None  # Sortie console de bibliothèques tierces capturée dans un processus de travail
+
+    @property
+    def company_name(self):
+        return self.fundamental.name if self.fundamental is not None else None
+
+    @property
+    def price(self):
+        return self.technical.price if self.technical is not None else None
+
+    @property
+    def fibonacci(self):
+        return self.technical.fibonacci if self.technical is not None else None
@@ -0,0 +1,190 @@
+import json
+import os
+import pandas as pd
+import yfinance as yf
+
+
+class DataProvider:
+    """
+    Point d'accès unique aux données de marché (historiques OHLCV, `info`, `fast_info`).
+
+    Le fournisseur par défaut interroge yfinance. `RecordingProvider` enregistre en plus
+    chaque réponse dans un répertoire de fixtures, que `ReplayProvider` resert ensuite
+    sans aucun accès réseau (exécutions hors-ligne et déterministes).
+    """
+
+    FAST_FIELDS = ["last_price", "previous_close", "year_low", "year_high", "market_cap"]
+
+    # Périodes acceptées telles quelles par yfinance (les autres sont converties en date de début)
+    YF_PERIODS = {"1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"}
+
+    _current = None
+
+    @classmethod
+    def current(cls):
+        """Retourne le fournisseur actif (yfinance par défaut)."""
+        if DataProvider._current is None:
+            DataProvider._current = DataProvider()
+        return DataProvider._current
+
+    @classmethod
+    def use(cls, provider):
+        """Définit le fournisseur utilisé par toute l'application."""
+        DataProvider._current = provider
+
+    @staticmethod
+    def create(mode="live", fixtures_dir="fixtures"):
+        """Construit le fournisseur correspondant au mode (live, record, replay)."""
+        if mode == "record":
+            return RecordingProvider(fixtures_dir)
+        if mode == "replay":
+            return ReplayProvider(fixtures_dir)
+        return DataProvider()
+
+    @staticmethod
+    def window(frame, period):
+        """Restreint un historique à la période yfinance demandée (ex: 12mo, 2y, ytd, max)."""
+        if frame.empty or not period or period == "max":
+            return frame
+        if period == "ytd":
+            return frame[frame.index >= pd.Timestamp(frame.index[-1].year, 1, 1)]
+        if period.endswith("mo"):
+            offset = pd.DateOffset(months=int(period[:-2]))
+        elif period.endswith("y"):
+            offset = pd.DateOffset(years=int(period[:-1]))
+        elif period.endswith("d"):
+            offset = pd.DateOffset(days=int(period[:-1]))
+        else:
+            return frame
+        return frame[frame.index > frame.index[-1] - offset]
+
+    @staticmethod
+    def start_for(period):
+        """Date de début équivalente à une période (ex: 689d, 12mo, ytd ; max : aucune borne)."""
+        today = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+        if period == "max":
+            return pd.Timestamp.min
+        if period == "ytd":
+            return pd.Timestamp(today.year, 1, 1)
+        if period.endswith("mo"):
+            return today - pd.DateOffset(months=int(period[:-2]))
+        if period.endswith("y"):
+            return today - pd.DateOffset(years=int(period[:-1]))
+        return today - pd.DateOffset(days=int(period[:-1]))
+
+    def history(self, tickers, period="12mo", start=None):
+        """
+        Télécharge l'historique journalier ajusté de plusieurs tickers en une requête.
+
+        Returns:
+            dict: {ticker: DataFrame OHLCV} (les tickers sans données sont absents)
+        """
+        if start is None and period not in self.YF_PERIODS:
+            start = self.start_for(period).strftime("%Y-%m-%d")
+
+        data = yf.download(
+            tickers,
+            period=None if start is not None else period,
+            start=start,
+            interval="1d",
+            auto_adjust=True,
+            group_by="ticker",
+            threads=True,
+            progress=False
+        )
+
+        frames = {}
+        if data is None or data.empty:
+            return frames
+
+        for ticker in tickers:
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            frame = data[ticker].dropna(how="all")
+            if not frame.empty:
+                frames[ticker] = frame.copy()
+        return frames
+
+    def info(self, ticker):
+        """Retourne le dictionnaire `Ticker.info`."""
+        return yf.Ticker(ticker).info
+
+    def fast_info(self, ticker):
+        """Retourne les champs de prix de `Ticker.fast_info` sous forme de dictionnaire."""
+        fast = yf.Ticker(ticker).fast_info
+        return {field: getattr(fast, field, None) for field in self.FAST_FIELDS}
+
+
+class RecordingProvider(DataProvider):
+    """Fournisseur yfinance qui enregistre chaque réponse dans `fixtures_dir`."""
+
+    def __init__(self, fixtures_dir="fixtures"):
+        self.fixtures_dir = fixtures_dir
+        for sub in ("history", "info", "fast_info"):
+            os.makedirs(os.path.join(fixtures_dir, sub), exist_ok=True)
+
+    def _path(self, kind, ticker, ext):
+        return os.path.join(self.fixtures_dir, kind, f"{ticker}.{ext}")
+
+    def _dump(self, kind, ticker, payload):
+        with open(self._path(kind, ticker, "json"), "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, default=str)
+
+    def history(self, tickers, period="12mo", start=None):
+        frames = super().history(tickers, period=period, start=start)
+        for ticker, frame in frames.items():
+            path = self._path("history", ticker, "parquet")
+            if os.path.exists(path):
+                # Fusion avec l'enregistrement existant (les nouvelles barres priment)
+                previous = pd.read_parquet(path)
+                frame = pd.concat([previous[~previous.index.isin(frame.index)], frame]).sort_index()
+            frame.to_parquet(path)
+        return frames
+
+    def info(self, ticker):
+        info = super().info(ticker)
+        self._dump("info", ticker, info)
+        return info
+
+    def fast_info(self, ticker):
+        fast = super().fast_info(ticker)
+        self._dump("fast_info", ticker, fast)
+        return fast
+
+
+class ReplayProvider(DataProvider):
+    """Fournisseur hors-ligne servant les fixtures enregistrées par `RecordingProvider`."""
+
+    def __init__(self, fixtures_dir="fixtures"):
+        self.fixtures_dir = fixtures_dir
+
+    def _path(self, kind, ticker, ext):
+        return os.path.join(self.fixtures_dir, kind, f"{ticker}.{ext}")
+
+    def _load(self, kind, ticker):
+        path = self._path(kind, ticker, "json")
+        if not os.path.exists(path):
+            raise RuntimeError(f"Aucune fixture '{kind}' pour {ticker} ({path})")
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def history(self, tickers, period="12mo", start=None):
+        frames = {}
+        for ticker in tickers:
+            path = self._path("history", ticker, "parquet")
+            if not os.path.exists(path):
+                continue
+            frame = pd.read_parquet(path)
+            if start is not None:
+                frame = frame[frame.index >= pd.Timestamp(start)]
+            else:
+                frame = self.window(frame, period)
+            if not frame.empty:
+                frames[ticker] = frame
+        return frames
+
+    def info(self, ticker):
+        return self._load("info", ticker)
+
+    def fast_info(self, ticker):
+        return self._load("fast_info", ticker)
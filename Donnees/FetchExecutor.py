@@ -0,0 +1,111 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class TokenBucket:
+    """Limiteur de débit partagé entre threads : `rate` jetons/seconde, rafale de `capacity`."""
+
+    def __init__(self, rate=2.0, capacity=4):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Bloque jusqu'à obtention d'un jeton."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+
+class FetchTimeout(RuntimeError):
+    """Requête abandonnée après dépassement du délai."""
+
+
+class FetchExecutor:
+    """
+    Exécute des requêtes réseau en parallèle (pool de threads) sous un limiteur de débit
+    commun, avec délai maximal par requête et nouvelles tentatives (backoff exponentiel
+    avec jitter) sur les erreurs 429 / 5xx.
+    """
+
+    def __init__(self, max_workers=8, rate=2.0, burst=4, timeout=30, retries=3, backoff=1.0):
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(rate, burst)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+    @staticmethod
+    def _is_retryable(error):
+        """Vrai pour les erreurs de limitation (429) ou serveur (5xx)."""
+        if type(error).__name__ == "YFRateLimitError":
+            return True
+        status = getattr(error, "status_code", None)
+        if status is None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        if status is not None:
+            return status == 429 or 500 <= status < 600
+        message = str(error)
+        return "429" in message or "Too Many Requests" in message or any(
+            f" {code}" in message for code in range(500, 505)
+        )
+
+    def _call(self, fn, item, started):
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            started[item] = time.monotonic()
+            try:
+                return fn(item)
+            except Exception as e:
+                if attempt == self.retries or not self._is_retryable(e):
+                    raise
+                delay = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                print(f"⏳ Limitation/erreur serveur pour {item}, nouvelle tentative dans {delay:.1f}s...")
+                time.sleep(delay)
+
+    def map(self, fn, items):
+        """
+        Applique `fn` à chaque élément en parallèle.
+
+        Returns:
+            dict: {item: résultat} ou {item: Exception} en cas d'échec / délai dépassé
+        """
+        items = list(dict.fromkeys(items))
+        results = {}
+        started = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {executor.submit(self._call, fn, item, started): item for item in items}
+        pending = set(futures)
+
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = futures[future]
+                    try:
+                        results[item] = future.result()
+                    except Exception as e:
+                        results[item] = e
+
+                # Abandon des requêtes bloquées au-delà du délai (le thread est laissé à lui-même)
+                now = time.monotonic()
+                for future in list(pending):
+                    item = futures[future]
+                    if item in started and now - started[item] > self.timeout:
+                        results[item] = FetchTimeout(f"Délai dépassé ({self.timeout}s) pour {item}")
+                        pending.discard(future)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
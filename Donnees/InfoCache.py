@@ -0,0 +1,173 @@
+import json
+import os
+import time
+from Donnees.DataProvider import DataProvider
+from Donnees.FetchExecutor import FetchExecutor
+
+
+class InfoCache:
+    """
+    Cache disque des snapshots yfinance `Ticker.info` (un fichier JSON par ticker).
+
+    Chaque champ est horodaté :
+    - les champs fondamentaux (ROE, marges, dettes...) expirent après `ttl`
+      et déclenchent un re-téléchargement complet de `info` ;
+    - les champs de prix expirent après `price_ttl` et sont rafraîchis via
+      `fast_info`, beaucoup moins coûteux, avec recalcul des ratios dépendant du prix.
+    """
+
+    # Champs de `info` -> champ équivalent de `fast_info`
+    PRICE_FIELDS = {
+        "currentPrice": "last_price",
+        "regularMarketPrice": "last_price",
+        "previousClose": "previous_close",
+        "fiftyTwoWeekLow": "year_low",
+        "fiftyTwoWeekHigh": "year_high",
+        "marketCap": "market_cap",
+    }
+
+    # Ratios de valorisation recalculés à partir du prix : champ -> dénominateur
+    PRICE_RATIOS = {
+        "trailingPE": "trailingEps",
+        "forwardPE": "forwardEps",
+        "priceToBook": "bookValue",
+    }
+
+    def __init__(self, root=".cache/info", ttl=7 * 24 * 3600, price_ttl=4 * 3600):
+        self.root = root
+        self.ttl = ttl
+        self.price_ttl = price_ttl
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, ticker):
+        return os.path.join(self.root, f"{ticker}.json")
+
+    def load(self, ticker):
+        """Retourne le snapshot en cache {"info": ..., "timestamps": ...}, ou None."""
+        path = self.path(ticker)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Snapshot illisible pour {ticker} ({e}), re-téléchargement.")
+            return None
+
+    def save(self, ticker, snapshot):
+        with open(self.path(ticker), "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, default=str)
+
+    def load_all(self):
+        """
+        Snapshots `info` de tous les tickers en cache, sans téléchargement ni contrôle
+        de fraîcheur (ex: univers de comparaison des percentiles sectoriels).
+
+        Returns:
+            dict: {ticker: info}
+        """
+        infos = {}
+        for name in sorted(os.listdir(self.root)):
+            if name.endswith(".json"):
+                snapshot = self.load(name[:-len(".json")])
+                if snapshot is not None and isinstance(snapshot.get("info"), dict):
+                    infos[name[:-len(".json")]] = snapshot["info"]
+        return infos
+
+    def get(self, ticker, refresh=False):
+        """
+        Retourne le dictionnaire `info` du ticker depuis le cache si possible.
+
+        Args:
+            ticker: Symbole du ticker
+            refresh: Force le re-téléchargement complet (ignore le cache)
+        """
+        now = time.time()
+        snapshot = None if refresh else self.load(ticker)
+
+        if snapshot is None or self._is_stale(snapshot, now):
+            return self._store(ticker, DataProvider.current().info(ticker), now)
+
+        if self._prices_stale(snapshot, now):
+            try:
+                self._apply_prices(snapshot, DataProvider.current().fast_info(ticker), now)
+                self.save(ticker, snapshot)
+            except Exception as e:
+                print(f"⚠️ Rafraîchissement des prix impossible pour {ticker} : {e}")
+
+        return snapshot["info"]
+
+    def get_many(self, tickers, refresh=False, executor=None):
+        """
+        Version groupée de `get` : les téléchargements nécessaires (info complets et
+        rafraîchissements de prix) sont exécutés en parallèle par `executor`.
+
+        Returns:
+            dict: {ticker: info} ou {ticker: Exception} si le téléchargement a échoué
+        """
+        if executor is None:
+            executor = FetchExecutor()
+
+        provider = DataProvider.current()
+        now = time.time()
+        snapshots = {t: None if refresh else self.load(t) for t in tickers}
+
+        to_fetch = [t for t, snap in snapshots.items() if snap is None or self._is_stale(snap, now)]
+        to_price = [t for t, snap in snapshots.items() if t not in to_fetch and self._prices_stale(snap, now)]
+
+        results = {t: snap["info"] for t, snap in snapshots.items() if t not in to_fetch}
+
+        for ticker, info in executor.map(provider.info, to_fetch).items():
+            results[ticker] = info if isinstance(info, Exception) else self._store(ticker, info, now)
+
+        for ticker, fast in executor.map(provider.fast_info, to_price).items():
+            if isinstance(fast, Exception):
+                print(f"⚠️ Rafraîchissement des prix impossible pour {ticker} : {fast}")
+                continue
+            self._apply_prices(snapshots[ticker], fast, now)
+            self.save(ticker, snapshots[ticker])
+
+        return results
+
+    def _store(self, ticker, info, now):
+        """Enregistre un snapshot complet fraîchement téléchargé et retourne `info`."""
+        # Les champs de prix absents de `info` sont horodatés aussi : ils ne sont pas
+        # disponibles pour ce ticker et ne doivent pas rendre les prix périmés
+        snapshot = {
+            "info": info,
+            "timestamps": {field: now for field in [*info, *self.PRICE_FIELDS]},
+        }
+        self.save(ticker, snapshot)
+        return info
+
+    def _is_stale(self, snapshot, now):
+        """Vrai si un champ fondamental a dépassé le TTL."""
+        timestamps = snapshot.get("timestamps", {})
+        if not timestamps:
+            return True
+        return any(
+            now - ts > self.ttl
+            for field, ts in timestamps.items()
+            if field not in self.PRICE_FIELDS
+        )
+
+    def _prices_stale(self, snapshot, now):
+        timestamps = snapshot.get("timestamps", {})
+        return any(now - timestamps.get(field, 0) > self.price_ttl for field in self.PRICE_FIELDS)
+
+    def _apply_prices(self, snapshot, fast, now):
+        """Met à jour les champs de prix à partir de fast_info et recalcule les ratios associés."""
+        info, timestamps = snapshot["info"], snapshot["timestamps"]
+
+        for field, attr in self.PRICE_FIELDS.items():
+            value = fast.get(attr)
+            if value is not None:
+                info[field] = value
+            timestamps[field] = now  # Horodaté même si fast_info ne le fournit pas (tentative faite)
+
+        price = info.get("currentPrice")
+        if price:
+            for field, denominator in self.PRICE_RATIOS.items():
+                value = info.get(denominator)
+                if field in info and value and value > 0:
+                    info[field] = price / value
@@ -0,0 +1,140 @@
+import os
+import pandas as pd
+from AnalyseTechnique.LookbackPlanner import LookbackPlanner
+from AnalyseTechnique.Utils import Utils
+from Donnees.DataProvider import DataProvider
+
+
+class PriceCache:
+    """
+    Cache disque des historiques OHLCV journaliers (un fichier Parquet par ticker).
+
+    À chaque exécution, seules les barres postérieures à la dernière date en cache
+    sont téléchargées puis ajoutées. La dernière ligne en cache est re-téléchargée
+    et comparée : en cas d'écart (dividende, split, révision), l'historique complet
+    du ticker est téléchargé à nouveau, de même si le cache a été constitué pour une
+    période plus courte que `period` (profondeur fixée par LookbackPlanner).
+    """
+
+    COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+    def __init__(self, root=".cache/ohlcv", period=None, tolerance=1e-4):
+        self.root = root
+        self.period = period or Utils.history_period()
+        self.tolerance = tolerance
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, ticker):
+        return os.path.join(self.root, f"{ticker}.parquet")
+
+    def load(self, ticker):
+        """Retourne l'historique en cache du ticker, ou None."""
+        path = self.path(ticker)
+        if not os.path.exists(path):
+            return None
+        try:
+            frame = pd.read_parquet(path)
+        except Exception as e:
+            print(f"⚠️ Cache illisible pour {ticker} ({e}), re-téléchargement complet.")
+            return None
+        if frame.empty:
+            return None
+        if frame.attrs.get("period") != self.period and not self._covers(frame):
+            print(f"🔄 Cache trop court pour {ticker} (période {self.period}), re-téléchargement complet.")
+            return None
+        return frame
+
+    def last_closes(self, tickers):
+        """
+        Dernière clôture de chaque ticker déjà en cache, après mise à jour incrémentale
+        (même prix que l'analyse détaillée). Les tickers absents du cache ne sont pas
+        téléchargés et sont ignorés.
+        """
+        cached = [t for t in dict.fromkeys(tickers) if os.path.exists(self.path(t))]
+        closes = {}
+        for ticker, frame in self.get_many(cached).items():
+            close = Utils._to_series(frame, "Close").dropna()
+            if not close.empty:
+                closes[ticker] = float(close.iloc[-1])
+        return closes
+
+    def save(self, ticker, frame):
+        """
+        Enregistre l'historique du ticker.
+        La barre du jour (potentiellement incomplète) n'est jamais persistée.
+        """
+        today = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+        settled = frame[frame.index < today]
+        if not settled.empty:
+            settled = settled.copy()
+            settled.attrs["period"] = self.period
+            settled.to_parquet(self.path(ticker))
+
+    def get_many(self, tickers):
+        """
+        Retourne {ticker: DataFrame} en ne téléchargeant que les barres manquantes.
+        Chaque DataFrame couvre la fenêtre `period` (comme Utils.fetch_data).
+        """
+        tickers = list(dict.fromkeys(tickers))
+        cached = {t: self.load(t) for t in tickers}
+        frames = {}
+
+        # === Mise à jour incrémentale, regroupée par date de dernière barre ===
+        by_start = {}
+        for ticker, frame in cached.items():
+            if frame is not None:
+                by_start.setdefault(frame.index[-1], []).append(ticker)
+
+        to_refresh = [t for t, frame in cached.items() if frame is None]
+
+        for start, group in by_start.items():
+            fresh = Utils.fetch_data_bulk(group, start=start.strftime("%Y-%m-%d"))
+            for ticker in group:
+                merged = self._append(ticker, cached[ticker], fresh.get(ticker))
+                if merged is None:
+                    to_refresh.append(ticker)
+                else:
+                    frames[ticker] = merged
+
+        # === Téléchargement complet (absents du cache ou cache invalidé) ===
+        if to_refresh:
+            fresh = Utils.fetch_data_bulk(to_refresh, period=self.period)
+            for ticker, frame in fresh.items():
+                frames[ticker] = frame[self.COLUMNS]
+
+        for ticker, frame in frames.items():
+            self.save(ticker, frame)
+
+        return {t: self._window(frames[t]) for t in tickers if t in frames}
+
+    def _append(self, ticker, cached, fresh):
+        """
+        Ajoute les nouvelles barres à l'historique en cache.
+        Retourne None si le contrôle d'intégrité de la dernière ligne échoue.
+        """
+        if fresh is None or fresh.empty:
+            return cached
+
+        fresh = fresh[self.COLUMNS]
+        last_date = cached.index[-1]
+
+        if last_date in fresh.index:
+            old = cached.loc[last_date, ["Open", "High", "Low", "Close"]].astype(float)
+            new = fresh.loc[last_date, ["Open", "High", "Low", "Close"]].astype(float)
+            if ((old - new).abs() > self.tolerance * old.abs()).any():
+                print(f"⚠️ Historique révisé pour {ticker} (ajustement), re-téléchargement complet.")
+                return None
+
+        new_rows = fresh[fresh.index > last_date]
+        if new_rows.empty:
+            return cached
+        return pd.concat([cached, new_rows])
+
+    def _window(self, frame):
+        """Restreint l'historique à la fenêtre `period` (ex: 689d)."""
+        return DataProvider.window(frame, self.period)
+
+    def _covers(self, frame):
+        """Vrai si l'historique en cache remonte au début de la fenêtre `period`."""
+        start = DataProvider.start_for(self.period) + pd.DateOffset(days=LookbackPlanner.CALENDAR_SLACK_DAYS)
+        return frame.index[0] <= start
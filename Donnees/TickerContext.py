@@ -0,0 +1,104 @@
+from AnalyseTechnique.IndicatorState import IndicatorState
+from AnalyseTechnique.SwingPivots import SwingPivots
+from AnalyseTechnique.Utils import Utils
+from Donnees.DataProvider import DataProvider
+
+
+class TickerContext:
+    """
+    Données d'un ticker récupérées une seule fois et partagées par les analyses
+    fondamentale et technique : historique de prix, snapshot `info` et séries dérivées.
+
+    Le prix courant est toujours la dernière clôture de l'historique (à défaut le prix
+    de `info`), de sorte que les deux analyses travaillent sur le même prix.
+    """
+
+    def __init__(self, ticker, history=None, info=None, state_dir=None, panel=None):
+        self.ticker = ticker
+        self._history = history
+        self._info = info
+        self._indicators = None
+        self._latest = None
+        self._pivots = None
+        self.state_dir = state_dir  # Répertoire de l'état incrémental des indicateurs (None = recalcul complet)
+        self.panel = panel  # IndicatorPanel de l'univers, s'il a déjà été calculé
+        self._history_error = None
+        self.warnings = []  # Avertissements des calculs, affichés avec le rapport (Renderer)
+
+    @property
+    def history(self):
+        """Historique OHLCV (téléchargé à la première utilisation s'il n'a pas été fourni)."""
+        if self._history_error is not None:
+            raise self._history_error
+        if self._history is None or self._history.empty:
+            try:
+                self._history = Utils.fetch_data(self.ticker)
+            except Exception as e:
+                self._history_error = e
+                raise
+        return self._history
+
+    @property
+    def info(self):
+        """Snapshot `Ticker.info` (téléchargé à la première utilisation s'il n'a pas été fourni)."""
+        if self._info is None:
+            self._info = DataProvider.current().info(self.ticker)
+        return self._info
+
+    @property
+    def indicators(self):
+        """Historique enrichi des indicateurs techniques (calculé une seule fois, ou issu du panel)."""
+        if self._indicators is None:
+            if self.panel is not None and self.ticker in self.panel:
+                self._indicators = self.panel.frame(self.ticker)
+            else:
+                self._indicators = Utils.compute_indicators(self.history.copy())
+        return self._indicators
+
+    @property
+    def latest_indicators(self):
+        """
+        Valeurs des indicateurs sur la dernière barre (+ fenêtre OBV des 20 dernières barres).
+        Avec `state_dir`, elles proviennent de l'état incrémental persistant (O(1) par
+        nouvelle barre) ; sinon de la dernière ligne du recalcul complet.
+        """
+        if self._latest is None:
+            if self.state_dir:
+                self._latest = IndicatorState.sync(self.state_dir, self.ticker, self.history,
+                                                   warn=self.warnings.append).snapshot()
+            else:
+                data = self.indicators
+                columns = [c for c in IndicatorState.COLUMNS if c in data.columns]
+                self._latest = dict(data.iloc[-1][columns].astype(float))
+                if "OBV" in data.columns:
+                    self._latest["OBV_window"] = data["OBV"].iloc[-IndicatorState.WINDOWS["obv"]:].tolist()
+        return self._latest
+
+    def pivots(self, **params):
+        """
+        Points pivots (ZigZag) de l'historique, cf. SwingPivots. Avec `state_dir`, ils sont
+        mis à jour incrémentalement à partir de l'état persistant.
+        """
+        if self._pivots is None:
+            if self.state_dir:
+                self._pivots = SwingPivots.sync(self.state_dir, self.ticker, self.history,
+                                                warn=self.warnings.append, **params)
+            else:
+                self._pivots = SwingPivots.from_history(self.history, **params)
+        return self._pivots
+
+    @property
+    def sector(self):
+        return self.info.get("sector", "Général")
+
+    @property
+    def name(self):
+        return self.info.get("shortName") or self.info.get("longName")
+
+    @property
+    def current_price(self):
+        """Dernière clôture connue, ou prix de `info` si l'historique est indisponible."""
+        try:
+            return float(Utils._to_series(self.history, "Close").iloc[-1])
+        except Exception:
+            return self.info.get("currentPrice") or self.info.get("regularMarketPrice")
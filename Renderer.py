@@ -0,0 +1,287 @@
+import numpy as np
+import pandas as pd
+from colorama import Fore, Style, Back
+from AnalyseTechnique.FibonacciLevels import FibonacciLevels
+from Formatter import Formatter
+from TablePrinter import TablePrinter
+
+
+class Renderer:
+    """
+    Affichage console des résultats d'analyse (AnalysisResults). Les analyses ne font
+    que calculer : toute la mise en forme (valeurs, couleurs, tableaux) a lieu ici, dans
+    le processus principal, et les exécutions sans affichage ne la paient pas.
+    """
+
+    # Mise en forme des valeurs brutes des IndicatorRow selon leur unité
+    VALUE_FORMATS = {
+        "pct": Formatter.format_pourcentage,
+        "ratio": lambda v: f"{v:.2f}" if v else "N/A",
+        "multiple": lambda v: f"{v:.2f}x" if v else "N/A",
+        "share": lambda v: f"{v*100:.1f}%" if v else "N/A",
+        "euro": lambda v: f"{v:.2f}€" if v else "N/A",
+        "yield": lambda v: f"{v:.2f}%" if v else "N/A",
+        "pe": lambda v: f"{v:.1f}x" if v is not None else "N/A",
+        "position": lambda v: f"{v:.1f}%",
+        "grade": lambda v: f"{v:.1f}/5" if v is not None else "N/A",
+        "num": lambda v: f"{v:.2f}" if isinstance(v, (int, float, np.floating)) else str(v),
+    }
+
+    # Couleurs des niveaux de recommandation technique (IndicatorEvaluator.GLOBAL_LEVELS)
+    LEVEL_COLORS = {
+        "exceptionnel": Fore.GREEN,
+        "tres_bon": Fore.GREEN,
+        "sous_evaluation": Fore.CYAN,
+        "neutre_haussier": Fore.LIGHTBLUE_EX,
+        "equilibre": Fore.YELLOW,
+        "legere_surevaluation": Fore.MAGENTA,
+        "surevaluation": Fore.RED,
+    }
+    SIGNAL_COLORS = {"convergence": Fore.GREEN, "faiblesse": Fore.RED}
+
+    # Styles de l'interprétation finale (StockAnalyzer.VERDICTS)
+    VERDICT_STYLES = {
+        "excellent": Fore.GREEN + Style.BRIGHT,
+        "bon": Fore.CYAN + Style.BRIGHT,
+        "moyen": Fore.YELLOW,
+        "faible": Fore.RED + Style.BRIGHT,
+    }
+
+    CATEGORY_EMOJIS = {
+        "Rentabilité": "💰",
+        "Liquidité": "💧",
+        "Solvabilité": "🏦",
+        "Valorisation": "📈",
+        "Risque & Marché": "⚡"
+    }
+
+    @staticmethod
+    def value(row):
+        """Valeur affichée d'une IndicatorRow."""
+        return Renderer.VALUE_FORMATS[row.unit](row.value)
+
+    @staticmethod
+    def table(rows):
+        """DataFrame d'affichage des lignes, notes colorisées (les lignes restent intactes)."""
+        df = pd.DataFrame([{
+            "Indicateur": row.name,
+            "Valeur": Renderer.value(row),
+            "Note (/10)": row.note,
+            "Poids (%)": row.weight,
+            "Interprétation": row.interpretation,
+            "Définition": row.definition,
+            "Petite Définition": row.short_definition
+        } for row in rows])
+        df["Note (/10)"] = df["Note (/10)"].apply(Formatter.colorize_score)
+        return df
+
+    @staticmethod
+    def header(ticker):
+        print(Style.BRIGHT + Fore.WHITE + "\n" + "="*80)
+        print(f"--- 📊 Analyse détaillée de {ticker} ---")
+        print("="*80 + Style.RESET_ALL)
+
+    @staticmethod
+    def company(result):
+        """Informations générales de l'entreprise (FundamentalResult)."""
+        if result.market_cap:
+            market_cap_display = f"{result.market_cap / 1e9:.2f} Milliard {result.currency}"
+        else:
+            market_cap_display = "N/A"
+
+        print(Fore.MAGENTA + "==================== INFOS ENTREPRISE ====================" + Fore.RESET)
+        print(f"Nom : {result.name or result.ticker}")
+        print(f"Ticker : {result.ticker}")
+        print(f"Pays : {result.country}")
+        print(f"Secteur : {result.sector}")
+        print(f"Industrie : {result.industry}")
+        print(f"Capitalisation boursière : {market_cap_display}")
+        print(Fore.MAGENTA + "==========================================================" + Fore.RESET)
+
+    @staticmethod
+    def fundamental(result):
+        """Tableaux par catégorie et score de l'analyse fondamentale (FundamentalResult)."""
+        f = Formatter
+        print(Fore.CYAN + "\n=== 🔍 ANALYSE FONDAMENTALE ===" + Style.RESET_ALL)
+
+        for category, rows in result.categories.items():
+            if rows:  # Afficher seulement si la catégorie contient des données
+                emoji = Renderer.CATEGORY_EMOJIS.get(category, "📊")
+                print(f"\n{Fore.YELLOW}{emoji} {category.upper()}{Style.RESET_ALL}")
+                print(f"Score catégorie : {f.colorize_percent_score(result.category_scores[category])}")
+
+                TablePrinter.afficher_table(
+                    Renderer.table(rows),
+                    ["Indicateur", "Valeur", "Note (/10)", "Poids (%)", "Interprétation", "Définition"],
+                    center_cols=["Valeur", "Note (/10)", "Poids (%)"]
+                )
+
+        print(f"\n{Fore.GREEN}{'='*80}{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}Score fondamental global : {f.colorize_percent_score(result.score)}{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}{'='*80}{Style.RESET_ALL}")
+
+    @staticmethod
+    def technical(result):
+        """Prix, analyse Fibonacci, tableau et recommandation de l'analyse technique (TechnicalResult)."""
+        if not result.rows:
+            print(Fore.RED + "❌ Données techniques non disponibles." + Style.RESET_ALL)
+            return
+
+        try:
+            fib_info = Renderer.fibonacci(result.fibonacci)
+        except Exception as e:
+            fib_info = f"\n⚠️ Erreur formatage Fibonacci: {e}\n"
+        print(f"Prix Actuel en bourse : {result.price}")
+        print(fib_info)
+
+        print(Fore.MAGENTA + "\n=== 📈 ANALYSE TECHNIQUE ===" + Style.RESET_ALL)
+        TablePrinter.afficher_table(
+            Renderer.table(result.rows),
+            ["Indicateur", "Valeur", "Note (/10)", "Poids (%)", "Interprétation"],
+            center_cols=["Valeur", "Note (/10)", "Poids (%)"]
+        )
+        print(f"\nScore technique : {Formatter.colorize_percent_score(result.score)}")
+        print(f"Recommandation : {Renderer.recommendation(result)}")
+
+    @staticmethod
+    def recommendation(result):
+        """Recommandation technique colorée selon son niveau et son signal (TechnicalResult)."""
+        if result.level is None:
+            return result.recommendation
+        message, _, signal = result.recommendation.partition("\n")
+        text = Renderer.LEVEL_COLORS[result.level] + message
+        if result.signal is not None:
+            text += Renderer.SIGNAL_COLORS[result.signal] + "\n" + signal
+        return text + Style.RESET_ALL
+
+    @staticmethod
+    def fibonacci(fib):
+        """Formate l'analyse Fibonacci (FibonacciResult) pour l'affichage."""
+        try:
+            if not fib.valid:
+                return f"\n⚠️ FIBONACCI NON APPLICABLE\n{fib.interpretation}\n"
+
+            trend_emoji = {"haussier": "📈", "baissier": "📉", "neutre": "➡️"}
+
+            info = "\n" + "="*60
+            info += "\n📊 ANALYSE FIBONACCI (50 jours)\n"
+            info += "="*60 + "\n"
+
+            info += f"\n📍 Prix actuel : {fib.current_price:.2f}€"
+            info += f"\n{trend_emoji.get(fib.trend, '📊')} Tendance : {fib.trend.upper()}"
+            info += f"\n📈 Plus haut (50j) : {fib.high:.2f}€"
+            info += f"\n📉 Plus bas (50j) : {fib.low:.2f}€"
+            info += f"\n📏 Range : {fib.range:.2f}€ ({(fib.range/fib.current_price*100):.1f}%)"
+        except Exception as e:
+            return f"\n⚠️ Erreur formatage informations Fibonacci: {e}\n"
+
+        info += "\n\n🎯 NIVEAUX DE RETRACEMENT FIBONACCI :"
+        current = set(FibonacciLevels(fib.levels).near(fib.current_price, fib.range * 0.02))
+        for name, level in fib.levels.items():
+            marker = " ← 🎯 PRIX ACTUEL ICI" if name in current else ""
+            info += f"\n  {name:15} : {level:.2f}€{marker}"
+
+        if fib.trend == "haussier":
+            info += "\n\n🚀 EXTENSIONS FIBONACCI (Objectifs haussiers) :"
+            for name, level in fib.extensions.items():
+                gain = ((level - fib.current_price) / fib.current_price) * 100
+                info += f"\n  {name:15} : {level:.2f}€ (+{gain:.1f}%)"
+
+        info += "\n\n" + "-"*60
+        info += "\n💡 RECOMMANDATIONS DE TRADING :"
+        info += "\n" + "-"*60
+
+        if fib.support:
+            distance = ((fib.current_price - fib.support) / fib.support) * 100
+            info += f"\n🛡️  Support proche : {fib.support:.2f}€ ({fib.support_name}) [-{distance:.1f}%]"
+        if fib.resistance:
+            distance = ((fib.resistance - fib.current_price) / fib.current_price) * 100
+            info += f"\n⚔️  Résistance proche : {fib.resistance:.2f}€ ({fib.resistance_name}) [+{distance:.1f}%]"
+
+        entry_low, entry_high = fib.entry_zone
+        info += f"\n\n✅ Zone d'entrée recommandée : {entry_low:.2f}€ - {entry_high:.2f}€"
+
+        # Indiquer si on est dans la zone
+        if entry_low <= fib.current_price <= entry_high:
+            info += " ✓ (DANS LA ZONE)"
+        elif fib.current_price < entry_low:
+            info += f" (attendre {((entry_low - fib.current_price)/fib.current_price*100):.1f}% de hausse)"
+        else:
+            info += f" (attendre {((fib.current_price - entry_high)/fib.current_price*100):.1f}% de baisse)"
+
+        info += f"\n🛑 Stop Loss recommandé : {fib.stop_loss:.2f}€"
+        stop_distance = abs(fib.current_price - fib.stop_loss) / fib.current_price * 100
+        info += f" ({stop_distance:.1f}% {'au-dessus' if fib.stop_loss > fib.current_price else 'en dessous'})"
+
+        if fib.targets:
+            info += "\n\n🎯 Objectifs de sortie :"
+            for i, target in enumerate(fib.targets, 1):
+                info += f"\n   Objectif {i} : {target['level']:.2f}€ ({target['name']})"
+                info += f" | {target['type']} | Potentiel: {'+' if target['gain_potential'] > 0 else ''}{target['gain_potential']:.1f}%"
+
+        if fib.risk_reward and fib.risk_reward["ratio"] > 0:
+            rr = fib.risk_reward
+            info += f"\n\n⚖️  Ratio Risque/Récompense : 1:{rr['ratio']:.2f}"
+            info += f"\n   💸 Risque : {rr['risk']:.2f}€ | 💰 Récompense : {rr['reward']:.2f}€"
+            if rr['ratio'] >= 2:
+                info += " ✅ Excellent"
+            elif rr['ratio'] >= 1.5:
+                info += " ✓ Bon"
+            elif rr['ratio'] >= 1:
+                info += " ~ Acceptable"
+            else:
+                info += " ⚠️ Défavorable"
+
+        info += f"\n\n📝 {fib.interpretation}"
+        info += f"\n⭐ Score Fibonacci : {fib.score:.1f}/10"
+
+        info += "\n" + "="*60 + "\n"
+
+        return info
+
+    @staticmethod
+    def ticker(result, portfolio=()):
+        """Rapport complet d'un ticker (TickerResult)."""
+        f = Formatter
+        ticker = result.ticker
+        Renderer.header(ticker)
+
+        if result.error is not None:
+            print(Fore.RED + f"⚠️ Analyse de {ticker} impossible : {result.error}" + Style.RESET_ALL)
+            return
+
+        # === FONDAMENTALE ===
+        if result.fundamental is not None:
+            Renderer.company(result.fundamental)
+            Renderer.fundamental(result.fundamental)
+        else:
+            print(Fore.RED + f"⚠️ Erreur lors de l'analyse fondamentale de {ticker} : {result.fundamental_error}" + Style.RESET_ALL)
+            print("→ Passage à l'analyse technique...\n")
+
+        print("-"*80)
+
+        for warning in result.warnings:
+            print(warning)
+
+        # === TECHNIQUE ===
+        if result.technical is not None:
+            Renderer.technical(result.technical)
+        else:
+            print(Fore.RED + f"⚠️ Erreur lors de l'analyse technique de {ticker} : {result.technical_error}" + Style.RESET_ALL)
+
+        print("="*80)
+
+        # === SCORE GLOBAL ===
+        print(Style.BRIGHT + Fore.WHITE + Back.BLUE +
+            f"   🧮 SCORE GLOBAL PONDÉRÉ : {f.colorize_percent_score(result.sg)}   " +
+            Style.RESET_ALL)
+        print(f"Interprétation finale : {Renderer.VERDICT_STYLES.get(result.verdict_level, '')}{result.verdict}")
+
+        print("="*80)
+
+        if ticker in portfolio:
+            print(
+                Style.BRIGHT + Fore.WHITE + Back.GREEN +
+                f"   📢 Objectif de sortie : {ticker}   " +
+                Style.RESET_ALL
+            )
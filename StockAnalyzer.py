@@ -1,172 +1,373 @@
-from colorama import Fore, Style, Back
+import contextlib
+import io
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from colorama import Fore, Style
 from SendNotification import SendNotification
-import pandas as pd
+from AnalysisResults import TickerResult
+from Renderer import Renderer
 # from AnalyseDActualite.NewsAnalysis import NewsAnalysis
 
+
+class TickerTimeout(BaseException):
+    """
+    Délai d'analyse d'un ticker dépassé. Hérite de BaseException pour ne pas être
+    absorbée par les `except Exception` de l'analyse, qui continueraient sans délai.
+    """
+
 class StockAnalyzer:
-    def __init__(self, tickers):
+    def __init__(self, tickers, cache_dir=".cache/ohlcv", info_cache_dir=".cache/info",
+                 info_ttl=7 * 24 * 3600, refresh=False, concurrency=8, rate=2.0, timeout=30,
+                 fib_index=None, workers=1, ticker_timeout=300):
         self.tickers = tickers
-        from Formatter import Formatter
-        from TablePrinter import TablePrinter
-        self.f = Formatter()
-        self.p = TablePrinter()
+        self.cache_dir = cache_dir  # None = pas de cache disque des cours
+        self.info_cache_dir = info_cache_dir  # None = pas de cache des fondamentaux
+        self.info_ttl = info_ttl
+        self.refresh = refresh  # Force le re-téléchargement des fondamentaux
+        self.concurrency = concurrency  # Requêtes `info` simultanées
+        self.rate = rate  # Requêtes par seconde (limiteur partagé)
+        self.timeout = timeout  # Délai maximal par requête (secondes)
+        self.fib_index = fib_index  # Fichier de l'index Fibonacci mis à jour après l'analyse (None = désactivé)
+        self.workers = workers  # Processus d'analyse (1 = analyse séquentielle dans le processus principal)
+        self.ticker_timeout = ticker_timeout  # Délai maximal d'analyse d'un ticker en parallèle (secondes)
         self.portfolio = {"CS.PA", "TTE.PA", "NOV.F", "SAN.PA", "AI.PA"}
 
     
+    # (seuil du score global, niveau, interprétation) par ordre décroissant ; couleurs dans Renderer
+    VERDICTS = (
+        (80, "excellent", "💚 Excellent profil global — Opportunité d'achat (FAIBLE RISQUE)"),
+        (65, "bon", "💙 Bon profil — Potentiel intéressant (RISQUE MODÉRÉ)"),
+        (50, "moyen", "🟠 Profil moyen — À surveiller (RISQUE NORMAL)"),
+        (float("-inf"), "faible", "🔴 Profil faible — Risque élevé (ÉVITER)"),
+    )
+
     def score_final(self, sf, st):
+        """Score global pondéré, niveau et interprétation finale (texte brut)."""
         score = 0.75 * sf + 0.25 * st
-        if score >= 80:
-            txt = Fore.GREEN + Style.BRIGHT + "💚 Excellent profil global — Opportunité d'achat (FAIBLE RISQUE)"
-        elif score >= 65:
-            txt = Fore.CYAN + Style.BRIGHT + "💙 Bon profil — Potentiel intéressant (RISQUE MODÉRÉ)"
-        elif score >= 50:
-            txt = Fore.YELLOW + "🟠 Profil moyen — À surveiller (RISQUE NORMAL)"
-        else:
-            txt = Fore.RED + Style.BRIGHT + "🔴 Profil faible — Risque élevé (ÉVITER)"
-        return score, txt
+        level, txt = next(
+            ((level, txt) for threshold, level, txt in StockAnalyzer.VERDICTS if score >= threshold),
+            StockAnalyzer.VERDICTS[-1][1:]
+        )
+        return score, level, txt
 
     def run(self):
-        f, p = self.f, self.p
+        from AnalyseTechnique.Utils import Utils
+
+        # === TÉLÉCHARGEMENT GROUPÉ DES COURS ===
+        print(f"📥 Téléchargement groupé des cours ({len(self.tickers)} tickers)...")
+        if self.cache_dir:
+            from Donnees.PriceCache import PriceCache
+            prices = PriceCache(self.cache_dir).get_many(self.tickers)
+        else:
+            prices = Utils.fetch_data_bulk(self.tickers)
+
+        # Sans état incrémental, indicateurs de tout l'univers calculés en une passe
+        # (en parallèle, chaque processus calcule ceux de ses tickers)
+        panel = None
+        if prices and not self.cache_dir and self.workers <= 1:
+            from AnalyseTechnique.IndicatorPanel import IndicatorPanel
+            panel = IndicatorPanel(prices)
+
+        # === TÉLÉCHARGEMENT PARALLÈLE DES FONDAMENTAUX ===
+        from Donnees.FetchExecutor import FetchExecutor
+        from Donnees.DataProvider import DataProvider
+        executor = FetchExecutor(max_workers=self.concurrency, rate=self.rate, timeout=self.timeout)
+        print(f"📥 Téléchargement des données fondamentales ({self.concurrency} en parallèle)...")
+        if self.info_cache_dir:
+            from Donnees.InfoCache import InfoCache
+            info_cache = InfoCache(self.info_cache_dir, ttl=self.info_ttl)
+            infos = info_cache.get_many(self.tickers, refresh=self.refresh, executor=executor)
+        else:
+            infos = executor.map(DataProvider.current().info, self.tickers)
+
+        fib_index = None
+        if self.fib_index:
+            from AnalyseTechnique.FibonacciIndex import FibonacciIndex
+            fib_index = FibonacciIndex.load(self.fib_index)
+
+        if self.workers > 1:
+            print(f"⚙️ Analyse sur {self.workers} processus...")
+            results = self._run_parallel(prices, infos)
+        else:
+            results = (self.analyze(t, prices.get(t), infos.get(t), panel) for t in self.tickers)
+
+        # Rapports dans l'ordre des tickers ; index et notifications gérés par ce processus
+        for result in results:
+            self.report(result, fib_index)
+
+        if fib_index is not None:
+            fib_index.save(self.fib_index)
+            print(f"💾 Index Fibonacci mis à jour ({len(fib_index)} tickers) : {self.fib_index}")
+
+    def report(self, result, fib_index=None):
+        """Rendu d'un résultat : rapport, mise à jour de l'index Fibonacci, notification."""
+        if result.output:
+            print(result.output, end="")
+        Renderer.ticker(result, self.portfolio)
+        if fib_index is not None and result.fibonacci is not None:
+            fib_index.update(result.ticker, result.fibonacci.as_dict())
+        try:
+            self.notify(result)
+        except Exception as e:
+            print(Fore.RED + f"⚠️ Notification impossible pour {result.ticker} : {e}" + Style.RESET_ALL)
+
+    def analyze(self, ticker, history=None, info=None, panel=None):
+        """
+        Analyse complète d'un ticker (fondamentale, technique, score global), sans
+        affichage : le rapport est rendu à part (cf. `report`), tout comme les
+        notifications (cf. `notify`).
+
+        Args:
+            history: Historique OHLCV (téléchargé à la demande si absent)
+            info: Snapshot `info`, ou Exception si son téléchargement a échoué
+            panel: IndicatorPanel de l'univers, s'il a été calculé
+
+        Returns:
+            TickerResult
+        """
         from AnalyseFondamentale.FundamentalAnalysis import FundamentalAnalysis
         from AnalyseTechnique.TechnicalAnalysis import TechnicalAnalysis
+        from Donnees.TickerContext import TickerContext
 
-        for ticker in self.tickers:
-            print(Style.BRIGHT + Fore.WHITE + "\n" + "="*80)
-            print(f"--- 📊 Analyse détaillée de {ticker} ---")
-            print("="*80 + Style.RESET_ALL)
+        result = TickerResult(ticker)
 
-            sf, st = 0, 0  # Scores par défaut
-            df_f, df_t, reco = None, None, "N/A"
+        # Données du ticker partagées par les analyses fondamentale et technique
+        context = TickerContext(
+            ticker,
+            history=history,
+            info=None if isinstance(info, Exception) else info,
+            state_dir=self.cache_dir,  # État incrémental des indicateurs à côté du cache des cours
+            panel=panel
+        )
 
-            # === FONDAMENTALE ===
-            try:
-                fa = FundamentalAnalysis(ticker)
-                data_by_category, df_f, sf, company_name, market_cap, scores_by_category = fa.run()
-                
-                print(Fore.CYAN + "\n=== 🔍 ANALYSE FONDAMENTALE ===" + Style.RESET_ALL)
-                
-                # Affichage par catégorie
-                for category, data in data_by_category.items():
-                    if data:  # Afficher seulement si la catégorie contient des données
-                        df_cat = pd.DataFrame(data)
-                        df_cat["Note (/10)"] = df_cat["Note (/10)"].apply(f.colorize_score)
-                        
-                        # Emoji selon la catégorie
-                        emoji_map = {
-                            "Rentabilité": "💰",
-                            "Liquidité": "💧",
-                            "Solvabilité": "🏦",
-                            "Valorisation": "📈",
-                            "Risque & Marché": "⚡"
-                        }
-                        emoji = emoji_map.get(category, "📊")
-                        
-                        print(f"\n{Fore.YELLOW}{emoji} {category.upper()}{Style.RESET_ALL}")
-                        print(f"Score catégorie : {f.colorize_percent_score(scores_by_category[category])}")
-                        
-                        p.afficher_table(
-                            df_cat,
-                            ["Indicateur", "Valeur", "Note (/10)", "Poids (%)", "Interprétation", "Définition"],
-                            center_cols=["Valeur", "Note (/10)", "Poids (%)"]
-                        )
-                
-                print(f"\n{Fore.GREEN}{'='*80}{Style.RESET_ALL}")
-                print(f"{Fore.GREEN}Score fondamental global : {f.colorize_percent_score(sf)}{Style.RESET_ALL}")
-                print(f"{Fore.GREEN}{'='*80}{Style.RESET_ALL}")
-                
-            except Exception as e:
-                print(Fore.RED + f"⚠️ Erreur lors de l'analyse fondamentale de {ticker} : {e}" + Style.RESET_ALL)
-                print("→ Passage à l'analyse technique...\n")
-                sf = 0  # Score neutre si erreur
-
-            print("-"*80)
-
-            # === TECHNIQUE ===
+        # === FONDAMENTALE ===
+        try:
+            if isinstance(info, Exception):
+                raise info
+            result.fundamental = FundamentalAnalysis(ticker, context=context).run()
+            result.sf = result.fundamental.score
+        except Exception as e:
+            result.fundamental_error = str(e)  # Score neutre si erreur
+
+        # === TECHNIQUE ===
+        try:
+            result.technical = TechnicalAnalysis(ticker, context=context).run()
+            result.st = result.technical.score
+        except Exception as e:
+            result.technical_error = str(e)
+        result.warnings = context.warnings
+
+        # === ACTUALITÉS ===
+        ##CODE POUR ANALYSE DES ACTUALITÉS À AJOUTER ICI##
+        # newsAnalysis = NewsAnalysis(ticker)
+        # news_interpretation, score = newsAnalysis.run(result.company_name)
+
+        # === SCORE GLOBAL ===
+        result.sg, result.verdict_level, result.verdict = self.score_final(result.sf, result.st)
+        return result
+
+    def notify(self, result):
+        """Envoie la notification d'un ticker analysé (portefeuille ou opportunité)."""
+        ticker, company_name = result.ticker, result.company_name
+        sf, st, price, fibo = result.sf, result.st, result.price, result.fibonacci
+
+        if ticker in self.portfolio:
+            fibo_targets = "\n".join(
+                f"Vendre à {item['level']:.2f} EUR → {item['gain_potential']:.2f}%"
+                for item in fibo.targets
+            )
+
+            message = (
+                f"📢 {company_name} ({ticker}) — Prix actuel {price:.2f} EUR\n\n"
+                f"📊 Score Technique : {st:.2f}/100\n"
+                f"🔗 Score Fibonacci : {fibo.score:.2f}/10\n"
+                f"✅ Score Fondamental : {sf:.2f}/100\n\n"
+                "🔗 Fibonacci Analysis :\n"
+                f"{fibo_targets}"
+            )
+
+            SendNotification.send(message, canal="portfolio")
+
+        elif (sf > 70) and (st > 40):
+            message = (
+                f"🚀 {company_name} ({ticker}) — {price:.2f} EUR\n\n"
+                f"📊 Score Technique : {st:.2f}/100\n"
+                f"🔗 Score Fibonacci : {fibo.score:.2f}/10\n"
+                f"🔗 Potential : {fibo.targets[-1]['gain_potential']:.2f}%\n"
+                f"✅ Score Fondamental : {sf:.2f}/100\n\n"
+                # f" Fibonacci Analysis : {fibo.as_dict()['analysis']}"
+            )
+            SendNotification.send(message, canal="normal")
+
+        elif (sf > 70) and (st > 60):
+            message = (
+                f"🌟 {company_name} ({ticker}) — {price:.2f} EUR — Opportunité d'achat à considérer\n\n"
+                f"📊 Score Technique : {st:.2f}/100\n"
+                f"🔗 Score Fibonacci : {fibo.score:.2f}/10\n"
+                f"🔗 Potential : {fibo.targets[-1]['gain_potential']:.2f}%\n"
+                f"✅ Score Fondamental : {sf:.2f}/100\n\n"
+                # f"🔗 Fibonacci Analysis : {fibo.as_dict()['analysis']}"
+            )
+            SendNotification.send(message, canal="high")
+
+    # ------------------------------------------------------------------
+    # Exécution parallèle
+    # ------------------------------------------------------------------
+    def _run_parallel(self, prices, infos):
+        """
+        Analyse des tickers dans un pool de processus. Les résultats sont rendus dans
+        l'ordre des tickers dès qu'ils sont disponibles. Un ticker en erreur ou dépassant `ticker_timeout` ne donne qu'un
+        résultat en échec. Si un processus de travail meurt, le pool est perdu : les
+        tickers inachevés sont relancés une fois, chacun dans son propre processus, pour
+        que seul le ticker fautif échoue.
+        """
+        settings = StockAnalyzer._settings()
+        results, attempts = {}, [0] * len(self.tickers)
+        position = 0
+        pending, isolated = list(range(len(self.tickers))), False
+        limit = 2 * self.ticker_timeout if self.ticker_timeout else None  # Filet si l'alarme du processus échoue
+
+        def pool(workers):
+            return ProcessPoolExecutor(workers, initializer=StockAnalyzer._init_worker, initargs=(settings,))
+
+        while pending:
+            if isolated:
+                batch, pending = pending[:self.workers], pending[self.workers:]
+                pools = [pool(1) for _ in batch]
+            else:
+                batch, pending = pending, []
+                pools = [pool(self.workers)] * len(batch)
+
+            # Au plus `workers` analyses en vol : chaque tâche soumise démarre aussitôt sur un
+            # processus libre, le délai se mesure donc depuis la soumission (comme AnalysisPipeline)
+            futures, queue, retry, stuck = {}, list(zip(batch, pools)), [], False
+            capacity = self.workers
             try:
-                ta = TechnicalAnalysis(ticker)
-                df_t, st, reco, llm_reco, fibo = ta.run()
+                while futures or queue:
+                    while queue and len(futures) < capacity:
+                        i, executor = queue.pop(0)
+                        ticker = self.tickers[i]
+                        try:
+                            future = executor.submit(self._analyze_task, ticker, prices.get(ticker), infos.get(ticker))
+                        except BrokenProcessPool:
+                            retry.append(i)
+                            continue
+                        attempts[i] += 1
+                        futures[future] = (i, time.monotonic())
+
+                    while position in results:
+                        yield results.pop(position)
+                        position += 1
+
+                    done, _ = wait(futures, timeout=0.5, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        i, _ = futures.pop(future)
+                        try:
+                            results[i] = future.result()
+                        except BrokenProcessPool:
+                            retry.append(i)
+                        except Exception as e:
+                            results[i] = self._failed(self.tickers[i], e)
+
+                    now = time.monotonic()
+                    for future, (i, submitted) in list(futures.items()):
+                        if limit and now - submitted > limit:
+                            results[i] = self._failed(self.tickers[i], f"délai de {self.ticker_timeout:.0f}s dépassé")
+                            del futures[future]
+                            stuck = True
+                            if not isolated:
+                                capacity -= 1  # Le processus bloqué ne prend plus de tâche
 
-                if df_t is None or df_t.empty:
-                    print(Fore.RED + "❌ Données techniques non disponibles." + Style.RESET_ALL)
+                    if capacity == 0:
+                        # Tous les processus du pool sont bloqués : le reste part dans un nouveau pool
+                        pending.extend(i for i, _ in queue)
+                        queue = []
+            finally:
+                for executor in set(pools):
+                    processes = list((executor._processes or {}).values())
+                    executor.shutdown(wait=not stuck, cancel_futures=True)
+                    if stuck:
+                        # Processus bloqués : arrêtés pour ne pas retenir la fin du programme
+                        for process in processes:
+                            process.terminate()
+
+            for i in retry:
+                if attempts[i] < 2:
+                    pending.append(i)
                 else:
-                    df_t["Note (/10)"] = df_t["Note (/10)"].apply(f.colorize_score)
-                    print(Fore.MAGENTA + "\n=== 📈 ANALYSE TECHNIQUE ===" + Style.RESET_ALL)
-                    p.afficher_table(
-                        df_t,
-                        ["Indicateur", "Valeur", "Note (/10)", "Poids (%)", "Interprétation"],
-                        center_cols=["Valeur", "Note (/10)", "Poids (%)"]
-                    )
-                    print(f"\nScore technique : {f.colorize_percent_score(st)}")
-                    print(f"Recommandation : {reco}")
-            except Exception as e:
-                print(Fore.RED + f"⚠️ Erreur lors de l'analyse technique de {ticker} : {e}" + Style.RESET_ALL)
-                st = 0
-                reco = "Non disponible"
-
-            print("="*80)
-
-            # === ACTUALITÉS ===
-            ##CODE POUR ANALYSE DES ACTUALITÉS À AJOUTER ICI##
-            # newsAnalysis = NewsAnalysis(ticker)
-            # news_interpretation, score = newsAnalysis.run(company_name)
-            # print(Fore.YELLOW + "\n=== 📰 ANALYSE DES ACTUALITÉS RÉCENTES ===" + Style.RESET_ALL)
-            # print(f"Score des actualités : {f.colorize_percent_score(news_interpretation['Score'])}")
-            # print(f"Interprétation des actualités : {news_interpretation['Interprétation']}")
-
-            # === SCORE GLOBAL ===
+                    results[i] = self._failed(self.tickers[i], "processus d'analyse interrompu")
+            pending.sort()
+            isolated = isolated or bool(retry)
+
+        while position in results:
+            yield results.pop(position)
+            position += 1
+
+    def _analyze_task(self, ticker, history, info):
+        """
+        Analyse dans un processus de travail : seul le résultat est renvoyé, rendu par
+        le processus principal. Les avertissements de l'analyse font partie du résultat ;
+        seule l'éventuelle sortie de bibliothèques tierces (yfinance...) est capturée.
+        """
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
             try:
-                sg, txt = self.score_final(sf, st)
-                print(Style.BRIGHT + Fore.WHITE + Back.BLUE +
-                    f"   🧮 SCORE GLOBAL PONDÉRÉ : {f.colorize_percent_score(sg)}   " +
-                    Style.RESET_ALL)
-                print(f"Interprétation finale : {txt}")
-            except Exception as e:
-                print(Fore.RED + f"⚠️ Erreur lors du calcul du score global : {e}" + Style.RESET_ALL)
-                sg = 0
-
-            print("="*80)
-
-            if ticker in self.portfolio:
-                print(
-                    Style.BRIGHT + Fore.WHITE + Back.GREEN +
-                    f"   📢 Objectif de sortie : {ticker}   " +
-                    Style.RESET_ALL
-                )
-
-                fibo_targets = "\n".join(
-                    f"Vendre à {item['level']:.2f} EUR → {item['gain_potential']:.2f}%"
-                    for item in fibo['analysis']['targets']
-                )
-
-                message = (
-                    f"📢 {company_name} ({ticker}) — Prix actuel {llm_reco:.2f} EUR\n\n"
-                    f"📊 Score Technique : {st:.2f}/100\n"
-                    f"🔗 Score Fibonacci : {fibo['analysis']['score']:.2f}/10\n"
-                    f"✅ Score Fondamental : {sf:.2f}/100\n\n"
-                    "🔗 Fibonacci Analysis :\n"
-                    f"{fibo_targets}"
-                )
-
-                SendNotification.send(message, canal="portfolio")
-
-            elif (sf > 70) and (st > 40):
-                message = (
-                    f"🚀 {company_name} ({ticker}) — {llm_reco:.2f} EUR\n\n"
-                    f"📊 Score Technique : {st:.2f}/100\n"
-                    f"🔗 Score Fibonacci : {fibo['analysis']['score']:.2f}/10\n"
-                    f"🔗 Potential : {fibo['analysis']['targets'][-1]['gain_potential']:.2f}%\n"
-                    f"✅ Score Fondamental : {sf:.2f}/100\n\n"
-                    # f" Fibonacci Analysis : {fibo['analysis']}"
-                )
-                SendNotification.send(message, canal="normal")
-
-            elif (sf > 70) and (st > 60):
-                message = (
-                    f"🌟 {company_name} ({ticker}) — {llm_reco:.2f} EUR — Opportunité d'achat à considérer\n\n"
-                    f"📊 Score Technique : {st:.2f}/100\n"
-                    f"🔗 Score Fibonacci : {fibo['analysis']['score']:.2f}/10\n"
-                    f"🔗 Potential : {fibo['analysis']['targets'][-1]['gain_potential']:.2f}%\n"
-                    f"✅ Score Fondamental : {sf:.2f}/100\n\n"
-                    # f"🔗 Fibonacci Analysis : {fibo['analysis']}"
-                )
-                SendNotification.send(message, canal="high")
+                with StockAnalyzer._deadline(self.ticker_timeout):
+                    result = self.analyze(ticker, history, info)
+            except TickerTimeout:
+                result = self._failed(ticker, f"délai de {self.ticker_timeout:.0f}s dépassé")
+        result.output = buffer.getvalue()
+        return result
+
+    def _failed(self, ticker, error):
+        """Résultat d'un ticker dont l'analyse n'a pas abouti (rapport réduit à l'erreur)."""
+        return TickerResult(ticker, error=str(error))
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _deadline(seconds):
+        """Lève TickerTimeout après `seconds` (alarme POSIX, sans effet ailleurs)."""
+        if not seconds or not hasattr(signal, "SIGALRM"):
+            yield
+            return
+
+        def expire(signum, frame):
+            raise TickerTimeout()
+
+        previous = signal.signal(signal.SIGALRM, expire)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    @staticmethod
+    def _settings():
+        """Configuration globale du processus principal, à reproduire dans les processus de travail."""
+        from AnalyseFondamentale.IndicatorInterpreter import IndicatorInterpreter
+        from AnalyseTechnique.IndicatorEvaluator import IndicatorEvaluator
+        from AnalyseTechnique.TechnicalAnalysis import TechnicalAnalysis
+        from Donnees.DataProvider import DataProvider
+        return {
+            "provider": DataProvider.current(),
+            "interpreter_rules": IndicatorInterpreter.rules,
+            "evaluator_config": IndicatorEvaluator.config,
+            "fib_anchor": TechnicalAnalysis.FIB_ANCHOR,
+            "swing_params": TechnicalAnalysis.SWING_PARAMS,
+        }
+
+    @staticmethod
+    def _init_worker(settings):
+        """Initialisation d'un processus de travail (cf. `_settings`)."""
+        from AnalyseFondamentale.IndicatorInterpreter import IndicatorInterpreter
+        from AnalyseTechnique.IndicatorEvaluator import IndicatorEvaluator
+        from AnalyseTechnique.TechnicalAnalysis import TechnicalAnalysis
+        from Donnees.DataProvider import DataProvider
+        DataProvider.use(settings["provider"])
+        IndicatorInterpreter.rules = settings["interpreter_rules"]
+        IndicatorEvaluator.config = settings["evaluator_config"]
+        TechnicalAnalysis.FIB_ANCHOR = settings["fib_anchor"]
+        TechnicalAnalysis.SWING_PARAMS = settings["swing_params"]
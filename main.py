@@ -2,6 +2,10 @@ import argparse
 from StockAnalyzer import StockAnalyzer
 import os
 from SendNotification import SendNotification
+from Donnees.DataProvider import DataProvider
+from AnalyseFondamentale.IndicatorInterpreter import IndicatorInterpreter
+from AnalyseTechnique.IndicatorEvaluator import IndicatorEvaluator
+from AnalyseTechnique.TechnicalAnalysis import TechnicalAnalysis
 
 if __name__ == "__main__":
 
@@ -22,6 +26,207 @@ if __name__ == "__main__":
         type=str,
         help="Fichier contenant une liste de tickers (un par ligne)"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=".cache/ohlcv",
+        help="Répertoire du cache disque des cours (Parquet)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Désactive le cache disque des cours et des fondamentaux"
+    )
+    parser.add_argument(
+        "--info-cache-dir",
+        type=str,
+        default=".cache/info",
+        help="Répertoire du cache des données fondamentales (Ticker.info)"
+    )
+    parser.add_argument(
+        "--info-ttl",
+        type=float,
+        default=7,
+        help="Durée de validité des données fondamentales en cache (jours)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Nombre de requêtes de données fondamentales simultanées"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=2.0,
+        help="Débit maximal de requêtes yfinance (requêtes/seconde)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30,
+        help="Délai maximal par requête (secondes)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Nombre de processus d'analyse des tickers (1 = analyse séquentielle)"
+    )
+    parser.add_argument(
+        "--ticker-timeout",
+        type=float,
+        default=300,
+        help="Délai maximal d'analyse d'un ticker avec --workers (secondes)"
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Pipeline asyncio : téléchargement du lot suivant pendant l'analyse du précédent"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=25,
+        help="Tickers par lot de téléchargement du pipeline"
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=32,
+        help="Tickers en attente entre les étapes du pipeline (mémoire bornée)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["live", "record", "replay"],
+        default="live",
+        help="live : yfinance | record : yfinance + enregistrement des fixtures | replay : fixtures uniquement (hors-ligne)"
+    )
+    parser.add_argument(
+        "--fixtures",
+        type=str,
+        default="fixtures",
+        help="Répertoire des fixtures (modes record et replay)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Force le re-téléchargement des données fondamentales"
+    )
+    parser.add_argument(
+        "--backtest",
+        action="store_true",
+        help="Backteste le score technique sur l'historique au lieu de lancer l'analyse"
+    )
+    parser.add_argument(
+        "--backtest-period",
+        type=str,
+        default="10y",
+        help="Profondeur d'historique du backtest (ex: 5y, 10y, max)"
+    )
+
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="Optimise poids et seuils du score technique (walk-forward) sur l'historique du backtest"
+    )
+    parser.add_argument(
+        "--optimize-method",
+        choices=["random", "grid"],
+        default="random",
+        help="Recherche aléatoire ou sur grille des configurations candidates"
+    )
+    parser.add_argument(
+        "--optimize-candidates",
+        type=int,
+        default=64,
+        help="Nombre de configurations candidates évaluées"
+    )
+    parser.add_argument(
+        "--optimize-workers",
+        type=int,
+        default=None,
+        help="Nombre de processus de l'optimisation (par défaut : nombre de cœurs)"
+    )
+    parser.add_argument(
+        "--optimize-output",
+        type=str,
+        default="optimisation.json",
+        help="Fichier du rapport d'optimisation (rechargeable avec --evaluator-config)"
+    )
+    parser.add_argument(
+        "--evaluator-config",
+        type=str,
+        help="Poids et seuils du score technique à utiliser (rapport --optimize ou configuration JSON)"
+    )
+    parser.add_argument(
+        "--interpreter-rules",
+        type=str,
+        help="Barèmes d'interprétation fondamentale (JSON {indicateur: règle}) remplaçant ceux par défaut"
+    )
+
+    parser.add_argument(
+        "--fib-anchor",
+        choices=["range", "swing"],
+        default="range",
+        help="Ancrage des niveaux de Fibonacci : plus haut / plus bas sur 50 jours, ou dernier swing (ZigZag)"
+    )
+    parser.add_argument(
+        "--swing-mode",
+        choices=["percent", "atr"],
+        default="percent",
+        help="Seuil de retournement des pivots : pourcentage du prix ou multiple de l'ATR"
+    )
+    parser.add_argument(
+        "--swing-threshold",
+        type=float,
+        help="Retournement minimal d'un pivot (fraction du prix, ex: 0.08, ou multiple d'ATR, ex: 3)"
+    )
+
+    parser.add_argument(
+        "--fib-index",
+        type=str,
+        default=".cache/fibindex.parquet",
+        help="Index Fibonacci de l'univers, mis à jour après chaque analyse"
+    )
+    parser.add_argument(
+        "--fib-query",
+        type=str,
+        metavar="NIVEAU",
+        help="Liste les tickers proches d'un niveau de l'index (ex: \"Fib 61.8%%\") au lieu de lancer l'analyse"
+    )
+    parser.add_argument(
+        "--fib-within",
+        type=float,
+        default=2.0,
+        help="Distance maximale au niveau pour --fib-query (%%)"
+    )
+    parser.add_argument(
+        "--fib-trend",
+        choices=["haussier", "baissier", "neutre"],
+        help="Filtre de tendance pour --fib-query"
+    )
+    parser.add_argument(
+        "--fib-rebuild",
+        action="store_true",
+        help="Reconstruit l'index Fibonacci à partir des cours des tickers avant --fib-query"
+    )
+
+    parser.add_argument(
+        "--sector-percentiles",
+        action="store_true",
+        help="Note les indicateurs fondamentaux par rang centile parmi les pairs du secteur (univers du cache info)"
+    )
+    parser.add_argument(
+        "--screen",
+        action="store_true",
+        help="Classe tout l'univers sur son score fondamental (snapshots info, sans analyse détaillée)"
+    )
+    parser.add_argument(
+        "--screen-top",
+        type=int,
+        help="Nombre de tickers affichés par --screen (tous par défaut)"
+    )
 
     args = parser.parse_args()
 
@@ -39,7 +244,127 @@ if __name__ == "__main__":
         else:
             print(f"⚠️ Fichier '{args.file}' introuvable, utilisation des tickers par défaut.")
 
-    app = StockAnalyzer(tickers)
+    DataProvider.use(DataProvider.create(args.mode, args.fixtures))
+
+    # Les caches ne sont utilisés qu'en mode live : en record ils tronqueraient les
+    # fixtures (téléchargements incrémentaux), en replay ils casseraient le déterminisme.
+    use_cache = args.mode == "live" and not args.no_cache
+
+    TechnicalAnalysis.FIB_ANCHOR = args.fib_anchor
+    TechnicalAnalysis.SWING_PARAMS = {"mode": args.swing_mode}
+    if args.swing_threshold is not None:
+        key = "atr_multiple" if args.swing_mode == "atr" else "threshold"
+        TechnicalAnalysis.SWING_PARAMS[key] = args.swing_threshold
+
+    if args.evaluator_config:
+        IndicatorEvaluator.use(args.evaluator_config)
+    if args.interpreter_rules:
+        IndicatorInterpreter.use(args.interpreter_rules)
+    if args.sector_percentiles:
+        if use_cache:
+            from AnalyseFondamentale.FundamentalScreener import FundamentalScreener
+            from AnalyseFondamentale.SectorPercentiles import SectorPercentiles
+            from Donnees.InfoCache import InfoCache
+            peers = InfoCache(args.info_cache_dir).load_all()
+            IndicatorInterpreter.rules = SectorPercentiles.build(FundamentalScreener.frame(peers), IndicatorInterpreter.rules)
+            print(f"📊 Notation relative aux pairs du secteur ({len(peers)} tickers en cache)")
+        else:
+            print("⚠️ --sector-percentiles nécessite le cache des données fondamentales, barèmes absolus utilisés.")
 
-    app.run()
-    
\ No newline at end of file
+    if args.screen:
+        from AnalyseFondamentale.FundamentalScreener import FundamentalScreener
+        from Donnees.FetchExecutor import FetchExecutor
+        print(f"📥 Récupération des données fondamentales ({len(tickers)} tickers)...")
+        executor = FetchExecutor(max_workers=args.concurrency, rate=args.rate, timeout=args.timeout)
+        if use_cache:
+            from Donnees.InfoCache import InfoCache
+            infos = InfoCache(args.info_cache_dir, ttl=args.info_ttl * 24 * 3600).get_many(
+                tickers, refresh=args.refresh, executor=executor)
+        else:
+            infos = executor.map(DataProvider.current().info, tickers)
+        for ticker, info in infos.items():
+            if isinstance(info, Exception):
+                print(f"⚠️ Données fondamentales indisponibles pour {ticker} : {info}")
+        # Même prix que l'analyse détaillée : dernière clôture des cours en cache, mis à jour
+        # au préalable ; les tickers jamais analysés gardent le prix de `info`
+        prices = None
+        if use_cache:
+            from Donnees.PriceCache import PriceCache
+            print("📥 Mise à jour des cours en cache...")
+            prices = PriceCache(args.cache_dir).last_closes(tickers)
+        screener = FundamentalScreener()
+        FundamentalScreener.print_results(screener.run(FundamentalScreener.frame(infos, prices=prices)), top=args.screen_top)
+    elif args.fib_query:
+        from AnalyseTechnique.FibonacciIndex import FibonacciIndex
+        # Comme les autres caches, l'index persistant n'est lu et écrit qu'en mode live :
+        # en record / replay il est reconstruit à partir du fournisseur de données
+        index = FibonacciIndex.load(args.fib_index) if use_cache else FibonacciIndex()
+        if args.fib_rebuild or not len(index):
+            index, targets = FibonacciIndex(), tickers
+        else:
+            # Lignes d'un autre ancrage ou antérieures à la dernière séance : recalculées
+            targets = index.stale(args.fib_anchor)
+            if targets:
+                print(f"⚠️ {len(targets)} ticker(s) de l'index calculés avec un autre ancrage "
+                      f"ou avant la dernière séance, mise à jour.")
+        if targets:
+            from AnalyseTechnique.Utils import Utils
+            print(f"📥 Construction de l'index Fibonacci ({len(targets)} tickers)...")
+            if use_cache:
+                from Donnees.PriceCache import PriceCache
+                prices = PriceCache(args.cache_dir).get_many(targets)
+            else:
+                prices = Utils.fetch_data_bulk(targets)
+            index.replace(targets, FibonacciIndex.build(prices, anchor=args.fib_anchor))
+            if use_cache:
+                index.save(args.fib_index)
+        results = index.query(args.fib_query, within=args.fib_within, trend=args.fib_trend)
+        FibonacciIndex.print_results(results, args.fib_query, args.fib_within)
+    elif args.optimize:
+        from AnalyseTechnique.Utils import Utils
+        from AnalyseTechnique.WeightOptimizer import WeightOptimizer
+        print(f"📥 Téléchargement de l'historique ({args.backtest_period}, {len(tickers)} tickers)...")
+        histories = Utils.fetch_data_bulk(tickers, period=args.backtest_period)
+        optimizer = WeightOptimizer(
+            candidates=args.optimize_candidates,
+            method=args.optimize_method,
+            workers=args.optimize_workers
+        )
+        try:
+            report = optimizer.run(histories)
+        except RuntimeError as e:
+            print(f"⚠️ Optimisation impossible : {e}")
+        else:
+            WeightOptimizer.print_report(report)
+            WeightOptimizer.save(report, args.optimize_output)
+            print(f"💾 Rapport enregistré : {args.optimize_output}")
+    elif args.backtest:
+        from AnalyseTechnique.Backtester import Backtester
+        from AnalyseTechnique.Utils import Utils
+        print(f"📥 Téléchargement de l'historique ({args.backtest_period}, {len(tickers)} tickers)...")
+        histories = Utils.fetch_data_bulk(tickers, period=args.backtest_period)
+        # Seuils d'entrée / sortie de la configuration chargée, le cas échéant
+        config = IndicatorEvaluator.config or {}
+        backtester = Backtester(**{key: config[key] for key in ("entry", "exit") if key in config})
+        Backtester.print_report(backtester.run(histories))
+    else:
+        app = StockAnalyzer(
+            tickers,
+            cache_dir=args.cache_dir if use_cache else None,
+            info_cache_dir=args.info_cache_dir if use_cache else None,
+            info_ttl=args.info_ttl * 24 * 3600,
+            refresh=args.refresh,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            timeout=args.timeout,
+            fib_index=args.fib_index if use_cache else None,
+            workers=args.workers,
+            ticker_timeout=args.ticker_timeout
+        )
+
+        if args.pipeline:
+            from AnalysisPipeline import AnalysisPipeline
+            AnalysisPipeline(app, batch_size=args.batch_size, queue_size=args.queue_size).run()
+        else:
+            app.run()
+    
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import Donnees.DataProvider as data_provider
+from Donnees.DataProvider import DataProvider, RecordingProvider, ReplayProvider
+
+TICKERS = ["AAA.PA", "BBB.PA"]
+TODAY = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+FULL = pd.bdate_range(end=TODAY - pd.Timedelta(days=1), periods=4000)
+
+# Profondeur des périodes servies telles quelles par le faux yfinance
+YF_OFFSETS = {"5d": pd.DateOffset(days=5), "3mo": pd.DateOffset(months=3), "2y": pd.DateOffset(years=2)}
+
+
+def fake_download(tickers, period=None, start=None, **kwargs):
+    """yf.download : historique synthétique restreint comme le ferait yfinance."""
+    if start is not None:
+        index = FULL[FULL >= pd.Timestamp(start)]
+    elif period == "max":
+        index = FULL
+    elif period == "ytd":
+        index = FULL[FULL >= pd.Timestamp(TODAY.year, 1, 1)]
+    else:
+        index = FULL[FULL > TODAY - YF_OFFSETS[period]]
+    rng = np.random.default_rng(0)
+    columns = pd.MultiIndex.from_product([tickers, ["Open", "High", "Low", "Close", "Volume"]])
+    return pd.DataFrame(rng.uniform(10, 20, (len(index), len(columns))), index=index, columns=columns)
+
+
+@pytest.mark.parametrize("period", ["5d", "3mo", "12mo", "2y", "689d", "ytd", "max"])
+def test_record_then_replay(tmp_path, monkeypatch, period):
+    if period == "ytd" and FULL[-1].year != TODAY.year:
+        pytest.skip("Aucune séance écoulée cette année")
+    monkeypatch.setattr(data_provider.yf, "download", fake_download)
+    recorded = RecordingProvider(str(tmp_path)).history(TICKERS, period=period)
+    replayed = ReplayProvider(str(tmp_path)).history(TICKERS, period=period)
+
+    assert set(replayed) == set(recorded) == set(TICKERS)
+    for ticker in TICKERS:
+        expected, actual = recorded[ticker], replayed[ticker]
+        # Barres resservies à l'identique, fenêtre calée sur la dernière barre enregistrée
+        pd.testing.assert_frame_equal(actual, expected.loc[actual.index], check_freq=False)
+        assert actual.index[-1] == expected.index[-1]
+        assert len(expected) - len(actual) <= 1  # Borne de début incluse (start) ou exclue (période)
+
+    if period == "max":
+        assert len(replayed[TICKERS[0]]) == len(FULL)
+    if period == "ytd":
+        assert (replayed[TICKERS[0]].index.year == FULL[-1].year).all()
+
+
+@pytest.mark.parametrize("period, start", [
+    ("ytd", pd.Timestamp(TODAY.year, 1, 1)),
+    ("12mo", TODAY - pd.DateOffset(months=12)),
+    ("2y", TODAY - pd.DateOffset(years=2)),
+    ("689d", TODAY - pd.DateOffset(days=689)),
+])
+def test_start_for(period, start):
+    assert DataProvider.start_for(period) == start
+
+
+def test_start_for_max_has_no_bound():
+    assert DataProvider.start_for("max") <= FULL[0]
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from AnalysisResults import FibonacciResult
+from AnalyseTechnique.FibonacciIndex import FibonacciIndex
+from AnalyseTechnique.TechnicalAnalysis import TechnicalAnalysis
+from Donnees.TickerContext import TickerContext
+
+
+def history(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, bars)))
+    return pd.DataFrame({
+        "Open": close,
+        "High": close * (1 + rng.uniform(0, 0.02, bars)),
+        "Low": close * (1 - rng.uniform(0, 0.02, bars)),
+        "Close": close,
+        "Volume": rng.uniform(1e5, 1e6, bars),
+    }, index=pd.bdate_range("2024-01-01", periods=bars))
+
+
+def analysed(ticker, data, anchor):
+    """Ligne alimentée comme après une analyse détaillée (TechnicalAnalysis.run puis report)."""
+    analysis = TechnicalAnalysis(ticker, context=TickerContext(ticker, history=data))
+    fib_data = analysis.calculate_fibonacci_levels(data, period=50, anchor=anchor)
+    fibonacci = FibonacciResult.from_dict(fib_data, anchor=anchor, date=data.index[-1].strftime("%Y-%m-%d"))
+    index = FibonacciIndex()
+    index.update(ticker, fibonacci.as_dict())
+    return index.rows[ticker]
+
+
+@pytest.mark.parametrize("anchor", ["range", "swing"])
+@pytest.mark.parametrize("bars", [300, 30])  # Historique long, puis plus court que la période
+def test_build_matches_analysis(anchor, bars):
+    data = {f"T{i}": history(bars, seed=i) for i in range(3)}
+    built = FibonacciIndex.build(data, anchor=anchor)
+    for ticker, frame in data.items():
+        price, trend, valid, values, row_anchor, date = built.rows[ticker]
+        expected = analysed(ticker, frame, anchor)
+        assert price == pytest.approx(expected[0]) and (trend, valid) == expected[1:3]
+        assert (row_anchor, date) == (expected[4], expected[5]) == (anchor, frame.index[-1].strftime("%Y-%m-%d"))
+        np.testing.assert_allclose(values, expected[3], rtol=1e-9)
+
+
+def test_stale_rows():
+    index = FibonacciIndex.build({"A": history(120), "B": history(120, seed=1)})
+    session = index.rows["A"][5]
+    assert index.stale("range", session) == []
+    assert sorted(index.stale("swing", session)) == ["A", "B"]
+
+    next_day = (pd.Timestamp(session) + pd.offsets.BDay(1)).strftime("%Y-%m-%d")
+    assert sorted(index.stale("range", next_day)) == ["A", "B"]
+
+
+def test_save_load_keeps_provenance(tmp_path):
+    index = FibonacciIndex.build({"A": history(120)}, anchor="swing")
+    path = str(tmp_path / "fib.parquet")
+    index.save(path)
+    assert FibonacciIndex.load(path).rows["A"][4:] == index.rows["A"][4:]
+
+    # Index enregistré sans ancrage ni date : toujours à recalculer
+    index.to_frame().drop(columns=["Ancrage", "Date"]).to_parquet(path)
+    assert FibonacciIndex.load(path).stale("range", "2000-01-01") == ["A"]
+
+
+def test_replace():
+    index = FibonacciIndex.build({"A": history(120), "B": history(120, seed=1)})
+    fresh = FibonacciIndex.build({"A": history(130)}, anchor="swing")
+    index.replace(["A", "B"], fresh)
+    assert list(index.rows) == ["A"] and index.rows["A"][4] == "swing"
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from AnalyseFondamentale.FundamentalAnalysis import FundamentalAnalysis
+from AnalyseFondamentale.FundamentalScreener import FundamentalScreener
+from AnalyseFondamentale.IndicatorInterpreter import IndicatorInterpreter
+from Donnees.DataProvider import DataProvider, ReplayProvider
+from Donnees.TickerContext import TickerContext
+
+SECTORS = [
+    "Technology", "Healthcare", "Financial Services", "Energy", "Utilities", "Consumer Cyclical",
+    "Consumer Defensive", "Communication Services", "Industrials", "Real Estate", "Basic Materials",
+    "Conglomerates", "Oil & Gas Integrated", None,
+]
+
+# Ordre de grandeur de chaque champ de `info` (valeurs tirées autour des seuils des barèmes)
+SCALES = {
+    "returnOnEquity": 0.2, "returnOnAssets": 0.08, "profitMargins": 0.15, "operatingMargins": 0.2,
+    "grossMargins": 0.4, "earningsGrowth": 0.3, "freeCashflow": 5e8, "marketCap": 1e10,
+    "currentRatio": 1.5, "quickRatio": 1.2, "operatingCashflow": 1e9, "totalCurrentLiabilities": 2e9,
+    "debtToEquity": 100, "totalDebt": 3e9, "ebitda": 1e9, "totalAssets": 2e10, "bookValue": 40,
+    "ebit": 8e8, "interestExpense": -1e8, "totalStockholderEquity": 8e9, "forwardPE": 18,
+    "trailingEps": 4, "trailingPE": 20, "priceToBook": 2.5, "trailingPegRatio": 1.5,
+    "dividendYield": 3, "payoutRatio": 0.5, "beta": 1.1, "recommendationMean": 2.5,
+    "currentPrice": 60, "regularMarketPrice": 60,
+}
+
+
+def synthetic_info(rng):
+    """Snapshot `info` aléatoire : champs absents, None, nuls, négatifs ou plausibles."""
+    info = {}
+    for field, scale in SCALES.items():
+        draw = rng.random()
+        if draw < 0.08:
+            continue
+        if draw < 0.16:
+            info[field] = None
+        elif draw < 0.22:
+            info[field] = 0
+        else:
+            info[field] = float(scale * rng.uniform(-0.4, 2.2))
+    low = float(rng.uniform(20, 80))
+    info["fiftyTwoWeekLow"] = rng.choice([None, 0, low])
+    info["fiftyTwoWeekHigh"] = rng.choice([None, low, low * rng.uniform(1.1, 2.5)])
+    info["numberOfAnalystOpinions"] = rng.choice([None, 0, 1, 2, 3, 4, 7, 8, 14, 15, 30])
+    if rng.random() < 0.05:
+        info["dividendYield"] = "N/A"
+    if rng.random() < 0.3:
+        info["forwardPE"] = None  # Estimation à partir du BPA et de la croissance
+    sector = SECTORS[rng.integers(len(SECTORS))]
+    if sector is not None:
+        info["sector"] = sector
+    return {k: (v.item() if isinstance(v, np.generic) else v) for k, v in info.items()}
+
+
+@pytest.fixture
+def universe(tmp_path):
+    """1 500 snapshots ; une partie avec un prix issu de l'historique, le reste sans cours."""
+    rng = np.random.default_rng(21)
+    infos = {f"T{i}": synthetic_info(rng) for i in range(1500)}
+    prices = {t: float(rng.uniform(10, 150)) for t in infos if rng.random() < 0.5}
+
+    previous, rules = DataProvider._current, IndicatorInterpreter.rules
+    DataProvider.use(ReplayProvider(str(tmp_path)))  # Aucun historique : prix de `info`
+    IndicatorInterpreter.use(None)
+    yield infos, prices
+    DataProvider.use(previous)
+    IndicatorInterpreter.rules = rules
+
+
+def analysed(ticker, info, price):
+    history = None if price is None else pd.DataFrame(
+        {"Close": [price]}, index=pd.DatetimeIndex([pd.Timestamp("2025-01-02")]))
+    return FundamentalAnalysis(ticker, context=TickerContext(ticker, history=history, info=info)).run()
+
+
+def test_matches_detailed_analysis(universe):
+    infos, prices = universe
+    screener = FundamentalScreener()
+    frame = FundamentalScreener.frame(infos, prices=prices)
+    values, kept = FundamentalScreener.metrics(frame)
+    notes = screener.notes(frame, values)
+    results = screener.run(frame)
+
+    for ticker, info in infos.items():
+        expected = analysed(ticker, info, prices.get(ticker))
+        rows = {row.name: row.note for row in expected.rows}
+        ranked = results.loc[ticker]
+        screened = {name: notes.at[ticker, name] for name in kept.columns
+                    if kept.at[ticker, name] and name in rows}
+        assert set(screened) == set(rows), ticker
+        for name, note in rows.items():
+            assert screened[name] == pytest.approx(np.nan if note is None else note, nan_ok=True), (ticker, name)
+
+        assert ranked["Score"] == pytest.approx(expected.score), ticker
+        for category in FundamentalScreener.CATEGORIES:
+            score = expected.category_scores.get(category, np.nan)
+            assert ranked[category] == pytest.approx(score, nan_ok=True), (ticker, category)
+
+
+def test_forward_pe_fallback_and_analyst_adjustment():
+    info = {"sector": "Technology", "currentPrice": 50.0, "trailingEps": 2.0, "earningsGrowth": 0.25,
+            "recommendationMean": 1.8, "numberOfAnalystOpinions": 1}
+    frame = FundamentalScreener.frame({"A": info})
+    values, _ = FundamentalScreener.metrics(frame)
+    assert values.at["A", "Forward P/E"] == pytest.approx(50.0 / 2.5)
+
+    notes = FundamentalScreener(IndicatorInterpreter.rules).notes(frame, values)
+    _, base, _ = IndicatorInterpreter.interpret_analyst_rating(1.8, 10, "Technology")
+    assert notes.at["A", "Avis Analystes"] == max(1, base - 3)
@@ -0,0 +1,126 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ta = pytest.importorskip("ta")
+
+from AnalyseTechnique.IndicatorEngine import IndicatorEngine
+from AnalyseTechnique.Utils import Utils
+
+RTOL = 1e-9
+ATOL = 1e-9  # MACD et signal passent par zéro
+ADX_WARMUP = 2 * 14 - 1  # Barres à zéro dans `ta`, NaN dans le moteur
+
+
+def ohlcv(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    high = close * (1 + rng.uniform(0, 0.02, bars))
+    low = close * (1 - rng.uniform(0, 0.02, bars))
+    volume = rng.uniform(1e5, 1e6, bars)
+    return high, low, close, volume
+
+
+def ta_reference(high, low, close, volume):
+    """Colonnes calculées par `ta` (implémentation d'avant le moteur NumPy)."""
+    high, low, close, volume = map(pd.Series, (high, low, close, volume))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        stoch = ta.momentum.StochasticOscillator(high, low, close, 14, 3)
+        macd = ta.trend.MACD(close)
+        bb = ta.volatility.BollingerBands(close, 20, 2)
+        columns = {
+            "RSI": ta.momentum.RSIIndicator(close, 14).rsi(),
+            "STOCH_K": stoch.stoch(),
+            "STOCH_D": stoch.stoch_signal(),
+            "MACD": macd.macd(),
+            "Signal": macd.macd_signal(),
+            "OBV": ta.volume.OnBalanceVolumeIndicator(close, volume).on_balance_volume(),
+            "BB_H": bb.bollinger_hband(),
+            "BB_L": bb.bollinger_lband(),
+            "BB_M": bb.bollinger_mavg(),
+            "EMA200": ta.trend.EMAIndicator(close, 200).ema_indicator(),
+            "ADX": ta.trend.ADXIndicator(high, low, close, 14).adx(),
+        }
+    return {name: series.to_numpy() for name, series in columns.items()}
+
+
+def assert_matches(expected, actual, column):
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected), err_msg=f"NaN de {column}")
+    np.testing.assert_allclose(actual, expected, rtol=RTOL, atol=ATOL, err_msg=column)
+
+
+def assert_adx_matches(expected, actual):
+    """ADX : NaN pendant la chauffe (zéros dans `ta`), identique ensuite."""
+    assert (expected[:ADX_WARMUP] == 0).all()
+    assert np.isnan(actual[:ADX_WARMUP]).all()
+    assert_matches(expected[ADX_WARMUP:], actual[ADX_WARMUP:], "ADX")
+
+
+@pytest.mark.parametrize("bars", [260, 2600])
+def test_series_matches_ta(bars):
+    data = ohlcv(bars)
+    expected, actual = ta_reference(*data), IndicatorEngine.compute(*data)
+
+    assert set(actual) == set(expected)
+    for column in expected:
+        if column == "ADX":
+            assert_adx_matches(expected[column], actual[column])
+        else:
+            assert_matches(expected[column], actual[column], column)
+
+
+def test_panel_matches_ta_per_ticker_with_leading_nans():
+    bars, listings = 400, [0, 50, 180]  # Tickers cotés plus tard : NaN de tête
+    series = [ohlcv(bars, seed) for seed in range(len(listings))]
+    panel = [np.column_stack([s[field] for s in series]) for field in range(4)]
+    for j, start in enumerate(listings):
+        for field in panel:
+            field[:start, j] = np.nan
+
+    actual = IndicatorEngine.compute(*panel)
+    for j, start in enumerate(listings):
+        expected = ta_reference(*(s[start:] for s in series[j]))
+        for column, values in actual.items():
+            assert np.isnan(values[:start, j]).all(), column
+            if column == "ADX":
+                assert_adx_matches(expected[column], values[start:, j])
+            else:
+                assert_matches(expected[column], values[start:, j], column)
+
+
+def test_nan_gap_is_skipped_like_ta():
+    bars, gap = 400, 250
+    data = [field.copy() for field in ohlcv(bars)]
+    for field in data:
+        field[gap] = np.nan
+
+    expected, actual = ta_reference(*data), IndicatorEngine.compute(*data)
+    for column in expected:
+        if column == "ADX":
+            continue
+        assert_matches(expected[column], actual[column], column)
+
+    # `ta` propage le NaN à tout l'ADX suivant ; le moteur reporte le lissage de Wilder
+    adx = actual["ADX"]
+    assert_matches(expected["ADX"][ADX_WARMUP:gap], adx[ADX_WARMUP:gap], "ADX")
+    assert np.isfinite(adx[gap:]).all()
+    assert ((adx[gap:] >= 0) & (adx[gap:] <= 100)).all()
+
+    # Les moyennes ne sont pas tirées vers zéro par le trou
+    clean = IndicatorEngine.compute(*ohlcv(bars))
+    np.testing.assert_allclose(actual["EMA200"][gap:], clean["EMA200"][gap:], rtol=0.01)
+
+
+def test_compute_indicators_matches_ta():
+    high, low, close, volume = ohlcv(600)
+    data = pd.DataFrame({"Open": close, "High": high, "Low": low, "Close": close, "Volume": volume})
+    expected = ta_reference(high, low, close, volume)
+    weights = {name: 1 for name in ("RSI", "Stochastique", "MACD", "OBV", "Bollinger", "EMA200", "ADX")}
+
+    result = Utils.compute_indicators(data.copy(), weights)
+    assert len(result) > 0
+    for column in expected:
+        assert_matches(expected[column][result.index], result[column].to_numpy(), column)
@@ -0,0 +1,39 @@
+import json
+import os
+
+import pytest
+
+from AnalyseFondamentale.IndicatorInterpreter import IndicatorInterpreter
+
+# Résultats (note, texte) de l'interpréteur écrit à la main avant les barèmes déclaratifs,
+# relevés de part et d'autre de chaque seuil, pour None et pour chaque groupe de secteurs.
+# Les textes sont mutualisés : le dernier élément de chaque résultat est un index dans "texts".
+with open(os.path.join(os.path.dirname(__file__), "data", "interpreter_expected.json"), encoding="utf-8") as f:
+    EXPECTED = json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def default_rules():
+    """Barèmes par défaut, quelle que soit la surcharge chargée par un autre test."""
+    previous = IndicatorInterpreter.rules
+    IndicatorInterpreter.use(None)
+    yield
+    IndicatorInterpreter.rules = previous
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED["cases"]))
+def test_matches_former_interpreter(name):
+    interpret = getattr(IndicatorInterpreter, name)
+    mismatches = []
+    for sector, cases in EXPECTED["cases"][name].items():
+        for args, result in cases:
+            expected = result[:-1] + [EXPECTED["texts"][result[-1]]]
+            actual = list(interpret(*args, sector))
+            if actual != expected:
+                mismatches.append((sector, args, expected, actual))
+    assert not mismatches, f"{len(mismatches)} écart(s), dont : {mismatches[:5]}"
+
+
+def test_every_interpreter_is_covered():
+    names = {n for n in vars(IndicatorInterpreter) if n.startswith("interpret_")}
+    assert names == set(EXPECTED["cases"])
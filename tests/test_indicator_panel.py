@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from AnalyseTechnique.Backtester import Backtester
+from AnalyseTechnique.IndicatorEngine import IndicatorEngine
+from AnalyseTechnique.IndicatorPanel import IndicatorPanel
+from Donnees.DataProvider import DataProvider, ReplayProvider
+from SendNotification import SendNotification
+from StockAnalyzer import StockAnalyzer
+
+
+@pytest.mark.parametrize("histories", [{}, {"VIDE": pd.DataFrame()}])
+def test_empty_universe(histories):
+    panel = IndicatorPanel(histories)
+    assert panel.tickers == [] and panel.length == 0
+    assert all(values.shape == (0, 0) for values in panel.values.values())
+    assert panel.aligned("RSI").empty
+
+    report = Backtester().run(histories)
+    assert report is not None
+
+
+def test_engine_accepts_zero_length_input():
+    empty = np.empty(0)
+    columns = IndicatorEngine.compute(empty, empty, empty, empty)
+    assert all(values.shape == (0,) for values in columns.values())
+    columns = IndicatorEngine.compute(*(np.empty((0, 3)) for _ in range(4)))
+    assert all(values.shape == (0, 3) for values in columns.values())
+
+
+def test_run_without_price_data(tmp_path, monkeypatch, capsys):
+    """Aucun ticker n'a de cours (replay sans fixture) : chaque ticker échoue, le run continue."""
+    monkeypatch.setattr(SendNotification, "send", staticmethod(lambda output, canal="normal": None))
+    previous = DataProvider._current
+    DataProvider.use(ReplayProvider(str(tmp_path)))
+    try:
+        StockAnalyzer(["NOPE", "NADA"], cache_dir=None, info_cache_dir=None).run()
+    finally:
+        DataProvider.use(previous)
+
+    out = capsys.readouterr().out
+    assert "Analyse détaillée de NOPE" in out and "Analyse détaillée de NADA" in out
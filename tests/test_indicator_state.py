@@ -0,0 +1,104 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from AnalyseTechnique.IndicatorPanel import IndicatorPanel
+from AnalyseTechnique.IndicatorState import IndicatorState
+from AnalyseTechnique.Utils import Utils
+
+TICKER = "TEST.PA"
+RTOL = 1e-9
+
+
+def history(bars=400, seed=0, missing_close=(), missing_volume=()):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    data = pd.DataFrame({
+        "Open": close,
+        "High": close * (1 + rng.uniform(0, 0.02, bars)),
+        "Low": close * (1 - rng.uniform(0, 0.02, bars)),
+        "Close": close,
+        "Volume": rng.uniform(1e5, 1e6, bars),
+    }, index=pd.bdate_range("2020-01-01", periods=bars))  # Séances passées : toutes persistées
+    data.iloc[list(missing_close), data.columns.get_loc("Close")] = np.nan
+    data.iloc[list(missing_volume), data.columns.get_loc("Volume")] = np.nan
+    return data
+
+
+def full_recompute(data):
+    """Dernière ligne du recalcul complet (chemin sans état incrémental)."""
+    frame = Utils.compute_indicators(data.copy())
+    latest = dict(frame.iloc[-1][[c for c in IndicatorState.COLUMNS if c in frame.columns]].astype(float))
+    latest["OBV_window"] = frame["OBV"].iloc[-IndicatorState.WINDOWS["obv"]:].tolist()
+    return latest
+
+
+def assert_same(expected, actual):
+    for column, value in expected.items():
+        np.testing.assert_allclose(actual[column], value, rtol=RTOL, err_msg=column)
+
+
+@pytest.mark.parametrize("missing_close, missing_volume", [
+    ((), ()),
+    ((150, 320), ()),
+    ((), (120, 330)),
+    ((150, 320), (120, 330)),
+])
+def test_incremental_sync_equals_full_recompute(tmp_path, missing_close, missing_volume):
+    data = history(missing_close=missing_close, missing_volume=missing_volume)
+
+    # Premier passage sur une partie de l'historique, puis barres nouvelles uniquement
+    IndicatorState.sync(str(tmp_path), TICKER, data.iloc[:300])
+    state = IndicatorState.sync(str(tmp_path), TICKER, data)
+
+    expected = full_recompute(data)
+    assert_same(expected, state.snapshot())
+
+    # Reconstruction complète de l'état : mêmes valeurs
+    rebuilt = tmp_path / "rebuild"
+    rebuilt.mkdir()
+    assert_same(expected, IndicatorState.sync(str(rebuilt), TICKER, data).snapshot())
+
+
+def test_panel_matches_incremental_state(tmp_path):
+    data = history(missing_close=(200,), missing_volume=(250,))
+    panel = IndicatorPanel({TICKER: data})
+    state = IndicatorState.sync(str(tmp_path), TICKER, data).snapshot()
+    for column in panel.values:
+        np.testing.assert_allclose(state[column], panel.latest(TICKER, column), rtol=RTOL, err_msg=column)
+
+
+def test_saved_state_has_no_nan(tmp_path):
+    data = history(missing_close=(150,), missing_volume=(120, 330))
+    IndicatorState.sync(str(tmp_path), TICKER, data)
+    with open(IndicatorState.path(str(tmp_path), TICKER), encoding="utf-8") as f:
+        saved = json.load(f)
+    assert np.isfinite(saved["obv"])
+    assert all(np.isfinite(ewm["value"]) for ewm in saved["ewms"].values())
+
+
+def assert_same_obv(expected, actual):
+    """OBV identique ; les moyennes récursives, amorcées plus tôt, n'en diffèrent que par l'amorçage."""
+    assert_same({"OBV": expected["OBV"], "OBV_window": expected["OBV_window"]}, actual)
+    for column in expected:
+        if column not in ("OBV", "OBV_window"):
+            np.testing.assert_allclose(actual[column], expected[column], rtol=1e-2, err_msg=column)
+
+
+def test_obv_counts_from_the_analysed_window(tmp_path):
+    """L'état est plus ancien que la fenêtre analysée : l'OBV repart de la fenêtre, comme le recalcul."""
+    data = history(bars=700)
+    IndicatorState.sync(str(tmp_path), TICKER, data.iloc[:400])
+
+    # Fenêtre glissante : nouvelles barres et début d'historique avancé
+    window = data.iloc[250:]
+    assert_same_obv(full_recompute(window), IndicatorState.sync(str(tmp_path), TICKER, window).snapshot())
+
+    # Fenêtre avancée sans nouvelle barre
+    window = data.iloc[300:]
+    assert_same_obv(full_recompute(window), IndicatorState.sync(str(tmp_path), TICKER, window).snapshot())
+
+    # Fenêtre plus longue que l'état (profondeur augmentée) : état reconstruit
+    assert_same(full_recompute(data), IndicatorState.sync(str(tmp_path), TICKER, data).snapshot())
@@ -0,0 +1,138 @@
+import pytest
+
+import Donnees.InfoCache as info_cache
+from Donnees.DataProvider import DataProvider
+from Donnees.FetchExecutor import FetchExecutor
+from Donnees.InfoCache import InfoCache
+
+TTL, PRICE_TTL = 1000, 100
+
+INFO = {
+    "sector": "Technology", "returnOnEquity": 0.2, "currentPrice": 50.0, "regularMarketPrice": 50.0,
+    "previousClose": 49.0, "fiftyTwoWeekLow": 40.0, "fiftyTwoWeekHigh": 60.0, "marketCap": 5e9,
+    "trailingEps": 2.5, "trailingPE": 20.0, "forwardEps": 0.0, "forwardPE": 15.0,
+    "bookValue": 25.0, "priceToBook": 2.0,
+}
+FAST = {"last_price": 55.0, "previous_close": 50.0, "year_low": 41.0, "year_high": 61.0, "market_cap": 5.5e9}
+
+
+class FakeProvider(DataProvider):
+    """Fournisseur en mémoire : `info` et `fast_info` par ticker, appels comptés."""
+
+    def __init__(self, infos, fast):
+        self.infos, self.fast = infos, fast
+        self.calls = []
+
+    def info(self, ticker):
+        self.calls.append(("info", ticker))
+        return dict(self.infos[ticker])
+
+    def fast_info(self, ticker):
+        self.calls.append(("fast_info", ticker))
+        return dict(self.fast[ticker])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge injectée dans InfoCache (time.time), avancée à la main."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(info_cache.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def provider():
+    fake = FakeProvider({"AAA": INFO}, {"AAA": FAST})
+    previous = DataProvider._current
+    DataProvider.use(fake)
+    yield fake
+    DataProvider.use(previous)
+
+
+def fetch(cache, ticker, grouped):
+    if grouped:
+        return cache.get_many([ticker], executor=FetchExecutor(rate=1000, burst=1000))[ticker]
+    return cache.get(ticker)
+
+
+@pytest.mark.parametrize("grouped", [False, True])
+def test_fundamental_ttl(tmp_path, clock, provider, grouped):
+    cache = InfoCache(str(tmp_path), ttl=TTL, price_ttl=2 * TTL)
+    assert fetch(cache, "AAA", grouped) == INFO
+
+    clock[0] += TTL
+    fetch(cache, "AAA", grouped)
+    assert provider.calls == [("info", "AAA")]
+
+    # Un champ fondamental périmé : re-téléchargement complet
+    provider.infos["AAA"] = {**INFO, "returnOnEquity": 0.25}
+    clock[0] += 1
+    assert fetch(cache, "AAA", grouped)["returnOnEquity"] == 0.25
+    assert provider.calls == [("info", "AAA"), ("info", "AAA")]
+    assert InfoCache(str(tmp_path)).load("AAA")["info"]["returnOnEquity"] == 0.25
+
+
+@pytest.mark.parametrize("grouped", [False, True])
+def test_price_refresh(tmp_path, clock, provider, grouped):
+    cache = InfoCache(str(tmp_path), ttl=TTL, price_ttl=PRICE_TTL)
+    fetch(cache, "AAA", grouped)
+
+    clock[0] += PRICE_TTL
+    assert fetch(cache, "AAA", grouped)["currentPrice"] == 50.0
+    clock[0] += 1
+    info = fetch(cache, "AAA", grouped)
+    assert provider.calls == [("info", "AAA"), ("fast_info", "AAA")]
+
+    assert info["currentPrice"] == info["regularMarketPrice"] == 55.0
+    assert (info["previousClose"], info["fiftyTwoWeekLow"], info["fiftyTwoWeekHigh"], info["marketCap"]) \
+        == (50.0, 41.0, 61.0, 5.5e9)
+    # Ratios recalculés au nouveau prix ; forwardPE conservé (BPA prévisionnel nul)
+    assert info["trailingPE"] == pytest.approx(55.0 / 2.5)
+    assert info["priceToBook"] == pytest.approx(55.0 / 25.0)
+    assert info["forwardPE"] == 15.0
+    assert info["returnOnEquity"] == 0.2
+
+    # Prix de nouveau frais, persistés avec leur horodatage
+    assert InfoCache(str(tmp_path)).load("AAA")["info"] == info
+    clock[0] += PRICE_TTL
+    fetch(cache, "AAA", grouped)
+    assert len(provider.calls) == 2
+
+
+def test_ratios_absent_from_info_are_not_added(tmp_path, clock, provider):
+    provider.infos["AAA"] = {k: v for k, v in INFO.items() if k not in ("trailingPE", "forwardPE")}
+    cache = InfoCache(str(tmp_path), ttl=TTL, price_ttl=PRICE_TTL)
+    cache.get("AAA")
+    clock[0] += PRICE_TTL + 1
+    info = cache.get("AAA")
+    assert "trailingPE" not in info and "forwardPE" not in info
+    assert info["priceToBook"] == pytest.approx(55.0 / 25.0)
+
+
+def test_never_provided_fields(tmp_path, clock, provider):
+    # Ni 52 semaines ni capitalisation, dans info comme dans fast_info
+    provider.infos["AAA"] = {k: v for k, v in INFO.items()
+                             if k not in ("fiftyTwoWeekLow", "fiftyTwoWeekHigh", "marketCap")}
+    provider.fast["AAA"] = {**FAST, "year_low": None, "year_high": None, "market_cap": None}
+    cache = InfoCache(str(tmp_path), ttl=TTL, price_ttl=PRICE_TTL)
+
+    # Horodatés dès le téléchargement : pas de rafraîchissement des prix à chaque appel
+    cache.get("AAA")
+    clock[0] += PRICE_TTL
+    cache.get("AAA")
+    assert provider.calls == [("info", "AAA")]
+
+    clock[0] += 1
+    info = cache.get("AAA")
+    assert "fiftyTwoWeekLow" not in info and "marketCap" not in info
+    clock[0] += PRICE_TTL
+    cache.get("AAA")
+    assert provider.calls == [("info", "AAA"), ("fast_info", "AAA")]
+
+
+def test_refresh_ignores_cache(tmp_path, clock, provider):
+    cache = InfoCache(str(tmp_path), ttl=TTL, price_ttl=PRICE_TTL)
+    cache.get("AAA")
+    cache.get("AAA", refresh=True)
+    cache.get_many(["AAA"], refresh=True, executor=FetchExecutor(rate=1000, burst=1000))
+    assert provider.calls == [("info", "AAA")] * 3
@@ -0,0 +1,102 @@
+import json
+import multiprocessing
+import os
+import signal
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from AnalyseFondamentale.FundamentalAnalysis import FundamentalAnalysis
+from AnalysisPipeline import AnalysisPipeline
+from Donnees.DataProvider import DataProvider, ReplayProvider
+from SendNotification import SendNotification
+from StockAnalyzer import StockAnalyzer
+
+# Les comportements fautifs sont injectés par monkeypatch, hérités des processus de travail par fork
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                                reason="Processus de travail créés sans fork")
+
+TICKERS = ["A.PA", "HANG", "B.PA", "BOOM", "C.PA", "A.PA"]
+TIMEOUT = 1
+
+
+def write_fixtures(root):
+    """Historiques et snapshots `info` servis par ReplayProvider."""
+    for sub in ("history", "info"):
+        os.makedirs(os.path.join(root, sub), exist_ok=True)
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize() - pd.offsets.BDay(1), periods=400)
+    for seed, ticker in enumerate(dict.fromkeys(TICKERS)):
+        rng = np.random.default_rng(seed)
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.015, len(index))))
+        pd.DataFrame({
+            "Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+            "Volume": rng.uniform(1e5, 1e6, len(index)),
+        }, index=index).to_parquet(os.path.join(root, "history", f"{ticker}.parquet"))
+        info = {"sector": "Technology", "shortName": ticker, "returnOnEquity": 0.2, "trailingPE": 15.0}
+        with open(os.path.join(root, "info", f"{ticker}.json"), "w", encoding="utf-8") as f:
+            json.dump(info, f)
+
+
+def hang_sleep():
+    time.sleep(60)
+
+
+def hang_busy():
+    while True:
+        pass
+
+
+def hang_deaf():
+    """Blocage sourd à l'alarme du processus : seul le délai du processus principal s'applique."""
+    signal.signal(signal.SIGALRM, signal.SIG_IGN)
+    time.sleep(60)
+
+
+@pytest.fixture
+def rendered(tmp_path, monkeypatch):
+    """Résultats rendus par le processus principal, dans l'ordre d'affichage."""
+    write_fixtures(str(tmp_path))
+    previous = DataProvider._current
+    DataProvider.use(ReplayProvider(str(tmp_path)))
+    monkeypatch.setattr(SendNotification, "send", staticmethod(lambda output, canal="normal": None))
+
+    results = []
+    report = StockAnalyzer.report
+
+    def record(self, result, fib_index=None):
+        results.append(result)
+        report(self, result, fib_index)
+
+    monkeypatch.setattr(StockAnalyzer, "report", record)
+    yield results
+    DataProvider.use(previous)
+
+
+@pytest.mark.parametrize("hang", [hang_sleep, hang_busy, hang_deaf])
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_faulty_tickers_fail_alone(rendered, monkeypatch, hang, pipeline):
+    run = FundamentalAnalysis.run
+
+    def faulty(self):
+        if self.ticker_symbol == "HANG":
+            hang()
+        if self.ticker_symbol == "BOOM":
+            os._exit(3)  # Processus de travail tué en pleine analyse
+        return run(self)
+
+    monkeypatch.setattr(FundamentalAnalysis, "run", faulty)
+    analyzer = StockAnalyzer(TICKERS, cache_dir=None, info_cache_dir=None, workers=2, ticker_timeout=TIMEOUT)
+    started = time.monotonic()
+    if pipeline:
+        AnalysisPipeline(analyzer, batch_size=2, queue_size=2).run()
+    else:
+        analyzer.run()
+
+    assert time.monotonic() - started < 30
+    assert [r.ticker for r in rendered] == TICKERS
+    failed = {r.ticker: r.error for r in rendered if r.error}
+    assert set(failed) == {"HANG", "BOOM"}
+    assert "délai" in failed["HANG"] and "interrompu" in failed["BOOM"]
+    assert all(r.fundamental is not None and r.technical is not None for r in rendered if not r.error)
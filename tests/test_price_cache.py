@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from Donnees.DataProvider import DataProvider
+from Donnees.PriceCache import PriceCache
+
+TODAY = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+FULL = pd.bdate_range(end=TODAY - pd.Timedelta(days=1), periods=800)
+
+
+class StubProvider(DataProvider):
+    """Fournisseur en mémoire : historiques servis jusqu'à la séance `end`, appels enregistrés."""
+
+    def __init__(self, tickers):
+        self.frames = {}
+        for seed, ticker in enumerate(tickers):
+            rng = np.random.default_rng(seed)
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(FULL))))
+            self.frames[ticker] = pd.DataFrame({
+                "Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+                "Volume": rng.uniform(1e5, 1e6, len(FULL)),
+            }, index=FULL)
+        self.end = FULL[-6]
+        self.calls = []
+
+    def history(self, tickers, period="12mo", start=None):
+        self.calls.append((sorted(tickers), period if start is None else None, start))
+        frames = {}
+        for ticker in tickers:
+            frame = self.frames[ticker].loc[:self.end]
+            frame = frame[frame.index >= pd.Timestamp(start)] if start is not None else self.window(frame, period)
+            if not frame.empty:
+                frames[ticker] = frame.copy()
+        return frames
+
+
+@pytest.fixture
+def provider():
+    stub = StubProvider(["AAA", "BBB", "CCC"])
+    previous = DataProvider._current
+    DataProvider.use(stub)
+    yield stub
+    DataProvider.use(previous)
+
+
+def expected(provider, ticker, period):
+    return DataProvider.window(provider.frames[ticker].loc[:provider.end], period)
+
+
+def test_incremental_append(tmp_path, provider):
+    cache = PriceCache(str(tmp_path), period="2y")
+    cache.get_many(["AAA", "BBB"])
+    assert provider.calls == [(["AAA", "BBB"], "2y", None)]
+
+    # Cinq nouvelles séances : seules les barres depuis la dernière date en cache sont demandées
+    provider.calls.clear()
+    last = provider.end
+    provider.end = FULL[-1]
+    frames = cache.get_many(["AAA", "BBB"])
+    assert provider.calls == [(["AAA", "BBB"], None, last.strftime("%Y-%m-%d"))]
+    for ticker in ("AAA", "BBB"):
+        pd.testing.assert_frame_equal(frames[ticker], expected(provider, ticker, "2y"), check_freq=False)
+        assert cache.load(ticker).index[-1] == FULL[-1]
+
+
+@pytest.mark.parametrize("change, revised", [(5e-5, False), (5e-4, True)])
+def test_last_row_integrity_check(tmp_path, provider, change, revised):
+    cache = PriceCache(str(tmp_path), period="2y", tolerance=1e-4)
+    original = cache.get_many(["AAA"])["AAA"]
+
+    # Dividende détaché : tout l'historique est ajusté, au-delà de la tolérance ou non
+    provider.frames["AAA"] = provider.frames["AAA"] * (1 - change)
+    provider.end = FULL[-1]
+    provider.calls.clear()
+    frame = cache.get_many(["AAA"])["AAA"]
+
+    assert [period for _, period, _ in provider.calls] == ([None, "2y"] if revised else [None])
+    assert frame.index[-1] == FULL[-1]
+    if revised:
+        pd.testing.assert_frame_equal(frame, expected(provider, "AAA", "2y"), check_freq=False)
+    else:
+        # Écart toléré : barres en cache conservées, nouvelles barres ajoutées
+        kept = frame.index.intersection(original.index)
+        pd.testing.assert_frame_equal(frame.loc[kept], original.loc[kept], check_freq=False)
+
+
+def test_period_invalidation(tmp_path, provider):
+    PriceCache(str(tmp_path), period="3mo").get_many(["AAA"])
+    assert PriceCache(str(tmp_path), period="3mo").load("AAA").attrs["period"] == "3mo"
+
+    # Cache constitué pour une période plus courte : téléchargement complet
+    provider.calls.clear()
+    frame = PriceCache(str(tmp_path), period="2y").get_many(["AAA"])["AAA"]
+    assert provider.calls == [(["AAA"], "2y", None)]
+    pd.testing.assert_frame_equal(frame, expected(provider, "AAA", "2y"), check_freq=False)
+
+    # Période plus courte que celle du cache, qui la couvre : cache conservé
+    provider.calls.clear()
+    frame = PriceCache(str(tmp_path), period="12mo").get_many(["AAA"])["AAA"]
+    assert [period for _, period, _ in provider.calls] == [None]
+    pd.testing.assert_frame_equal(frame, expected(provider, "AAA", "12mo"), check_freq=False)
+
+
+def test_todays_bar_is_not_persisted(tmp_path, provider):
+    cache = PriceCache(str(tmp_path), period="2y")
+    frame = provider.frames["AAA"].iloc[-3:].copy()
+    frame.index = pd.DatetimeIndex([FULL[-2], FULL[-1], TODAY])
+    cache.save("AAA", frame)
+    assert cache.load("AAA").index[-1] == FULL[-1]
+
+
+def test_last_closes(tmp_path, provider):
+    cache = PriceCache(str(tmp_path), period="2y")
+    cache.get_many(["AAA", "BBB"])
+    provider.end = FULL[-1]
+    provider.calls.clear()
+
+    closes = cache.last_closes(["AAA", "BBB", "CCC"])
+    # Cours mis à jour avant lecture ; CCC, absent du cache, n'est pas téléchargé
+    assert closes == {t: pytest.approx(provider.frames[t]["Close"].iloc[-1]) for t in ("AAA", "BBB")}
+    assert all("CCC" not in tickers for tickers, _, _ in provider.calls)
+    assert cache.last_closes([]) == {}